@@ -1,72 +1,690 @@
-import sys
+import time
+STARTED_AT = time.perf_counter()
+
 import os
-import json
+import sys
+import math
+import argparse
+import logging
+import importlib
+import threading
+import traceback
+from datetime import date, datetime
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QLabel, QPushButton,
-    QHBoxLayout, QCheckBox, QScrollArea, QFrame, QSizePolicy,
-    QDialog, QLineEdit, QMenu, QTextEdit
+    QHBoxLayout, QFrame, QSizePolicy, QDialog, QLineEdit, QMenu,
+    QTextEdit, QListView, QStyledItemDelegate, QStyle, QAbstractItemView,
+    QSystemTrayIcon, QProgressBar, QFileDialog, QMessageBox
+)
+from PySide6.QtCore import (
+    Qt, QTimer, QUrl, QAbstractListModel, QModelIndex, QRect, QRectF, QSize,
+    Signal, QEvent, QObject, QStringListModel, QFileSystemWatcher
+)
+from PySide6.QtNetwork import QLocalServer, QLocalSocket
+from PySide6.QtGui import (
+    QFont, QColor, QPainter, QBrush, QCursor, QAction, QPen, QFontMetrics, QIcon,
+    QPixmap, QShortcut, QKeySequence
 )
-from PySide6.QtCore import Qt, QTimer, QUrl
-from PySide6.QtGui import QFont, QColor, QPainter, QBrush, QCursor, QAction
-from PySide6.QtMultimedia import QSoundEffect
 
-TASKS_FILE = "pomodoro_tasks.json"
+from pomodoro.cli import format_duration
+from pomodoro.control import ControlProtocol, ControlSession, MAX_LINE, encode, socket_path
+from pomodoro.core import PomodoroCore
+from pomodoro.lists import MAX_NAME_LENGTH
+from pomodoro.store import MAX_TEXT_LENGTH
+from pomodoro.timer import WakeupMeter, WORK, SHORT_BREAK, LONG_BREAK
+from pomodoro.trace import tracer
+from pomodoro.transfer import TaskExporter, TaskImporter
+
+APP_STYLESHEET = """
+PomodoroApp, PomodoroApp QWidget {
+    background-color: #fff1d5;
+    border: none;
+}
+QFrame#card {
+    background-color: #fffbee;
+    border: 2px solid #f5ce95;
+    border-radius: 20px;
+}
+QWidget#tabBar, QWidget#addRow {
+    background-color: #fffbee;
+}
+QLabel#tab {
+    color: #014f68;
+    background-color: #fffbee;
+    border-bottom: none;
+    padding-bottom: 4px;
+}
+QLabel#tab[active="true"] {
+    color: #eb5539;
+    border-bottom: 3px solid #eb5539;
+}
+QFrame#underline {
+    background-color: #efece3;
+    border: none;
+}
+QFrame#divider {
+    background-color: #efece3;
+    border: none;
+    margin-top: 6px;
+    margin-bottom: 6px;
+}
+QFrame#bottomDivider {
+    background-color: #efece3;
+    border: none;
+    margin-top: 20px;
+}
+QLabel#activeTask, QLabel#todoTitle {
+    color: #014f68;
+    background-color: #fffbee;
+}
+QPushButton#dotsButton, QPushButton#listButton {
+    color: #ababab;
+    background: transparent;
+    border: none;
+}
+QPushButton#dotsButton:hover, QPushButton#listButton:hover {
+    color: #2ec4b6;
+}
+QListView#taskList {
+    background-color: #fffbee;
+    border: none;
+}
+QListView#taskList QScrollBar:vertical, QListView#archiveList QScrollBar:vertical {
+    background: #f5f5f5;
+    width: 10px;
+    margin: 2px 0 2px 0;
+    border-radius: 5px;
+}
+QListView#taskList QScrollBar::handle:vertical, QListView#archiveList QScrollBar::handle:vertical {
+    background: #2ec4b6;
+    min-height: 20px;
+    border-radius: 5px;
+}
+QListView#taskList QScrollBar::add-line:vertical, QListView#taskList QScrollBar::sub-line:vertical,
+QListView#archiveList QScrollBar::add-line:vertical, QListView#archiveList QScrollBar::sub-line:vertical {
+    background: none;
+    border: none;
+}
+QListView#taskList QScrollBar::add-page:vertical, QListView#taskList QScrollBar::sub-page:vertical,
+QListView#archiveList QScrollBar::add-page:vertical, QListView#archiveList QScrollBar::sub-page:vertical {
+    background: none;
+}
+QLabel#plusLabel {
+    color: #2ec4b6;
+    background-color: #fffbee;
+}
+QPushButton#addButton {
+    color: #014f68;
+    background-color: #fffbee;
+    border: none;
+}
+QLabel#pomodoroCounter {
+    color: #eb5539;
+    background: none;
+}
+QWidget#popup, QWidget#popup QWidget {
+    background: transparent;
+}
+QWidget#popup QFrame#popupCard, QFrame#popupCard QFrame {
+    background-color: #fffbee;
+    border: 2px solid #f5ce95;
+    border-radius: 20px;
+}
+QFrame#popupCard QLabel#popupTitle {
+    color: #eb5539;
+    background: none;
+    border: none;
+}
+QFrame#popupCard QLabel#popupMessage {
+    color: #014f68;
+    background: none;
+    border: none;
+}
+QFrame#popupCard QLabel#popupHint {
+    color: #bababa;
+    border: none;
+    margin-right: 4px;
+}
+QLineEdit#searchInput {
+    border: 2px solid #f5ce95;
+    border-radius: 8px;
+    padding: 4px 8px;
+    background-color: #fff;
+    color: #014f68;
+}
+QFrame#popupCard QLineEdit#taskInput {
+    border: 2px solid #f5ce95;
+    border-radius: 8px;
+    padding: 6px 10px;
+    background-color: #fff;
+    color: #014f68;
+}
+QFrame#popupCard QTextEdit#descInput {
+    border: 2px solid #f5ce95;
+    border-radius: 8px;
+    padding: 8px 10px;
+    background-color: #fff;
+    color: #014f68;
+}
+QFrame#popupCard QTextEdit#taskDescInput {
+    border: 1.5px solid #e5be8e;
+    border-radius: 6px;
+    padding: 6px 9px;
+    background-color: #fff;
+    color: #666;
+}
+QTextEdit#descInput QScrollBar:vertical, QTextEdit#taskDescInput QScrollBar:vertical {
+    background: #f5f5f5;
+    width: 10px;
+    margin: 2px 0 2px 0;
+    border-radius: 5px;
+}
+QTextEdit#descInput QScrollBar::handle:vertical, QTextEdit#taskDescInput QScrollBar::handle:vertical {
+    background: #2ec4b6;
+    min-height: 20px;
+    border-radius: 5px;
+}
+QFrame#popupCard QListView#archiveList {
+    background-color: #fffbee;
+    border: none;
+    border-radius: 0;
+    color: #014f68;
+}
+QFrame#popupCard QProgressBar#progressBar {
+    border: 2px solid #f5ce95;
+    border-radius: 8px;
+    background-color: #fff;
+    color: #014f68;
+    text-align: center;
+}
+QFrame#popupCard QProgressBar#progressBar::chunk {
+    background-color: #2ec4b6;
+    border-radius: 6px;
+}
+QLabel#debugOverlay {
+    background-color: rgba(0, 0, 0, 170);
+    color: #e0ffe0;
+    font-family: monospace;
+    font-size: 10px;
+    padding: 4px;
+    border-radius: 4px;
+}
+"""
+TAB_FOR_MODE = {
+    WORK: "Pomodoro",
+    SHORT_BREAK: "Kısa Mola",
+    LONG_BREAK: "Uzun Mola"
+}
+# Bir yazım birkaç dosya bildirimi üretir; bu süre içindekiler tek yeniden yüklemeye indirgenir
+RELOAD_DELAY_MS = 200
 
 class OvalButton(QPushButton):
-    def paintEvent(self, event):
-        painter = QPainter(self)
+    # Boyut, metin ve duruma göre önceden çizilmiş görüntüler paylaşılır
+    _cache = {}
+    _CACHE_LIMIT = 64
+    _font = None
+
+    def _state(self):
+        if not self.isEnabled():
+            return "disabled"
+        return "down" if self.isDown() else "normal"
+
+    def _render(self, size, dpr, state):
+        pixmap = QPixmap(size * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        if OvalButton._font is None:
+            OvalButton._font = QFont("Segoe UI", 15, QFont.Bold)
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing)
-        painter.setBrush(QBrush(QColor("#eb5539")))
+        color = {"normal": "#eb5539", "down": "#d44a30", "disabled": "#f0a596"}[state]
+        painter.setBrush(QBrush(QColor(color)))
         painter.setPen(Qt.NoPen)
-        painter.drawRoundedRect(self.rect(), 26, 26)
+        rect = QRect(0, 0, size.width(), size.height())
+        painter.drawRoundedRect(rect, 26, 26)
         painter.setPen(QColor("white"))
-        painter.setFont(QFont("Segoe UI", 15, QFont.Bold))
-        painter.drawText(self.rect(), Qt.AlignCenter, self.text())
+        painter.setFont(OvalButton._font)
+        painter.drawText(rect, Qt.AlignCenter, self.text())
+        painter.end()
+        return pixmap
+
+    def paintEvent(self, event):
+        dpr = self.devicePixelRatioF()
+        state = self._state()
+        key = (self.width(), self.height(), dpr, self.text(), state)
+        pixmap = OvalButton._cache.get(key)
+        if pixmap is None:
+            if len(OvalButton._cache) >= OvalButton._CACHE_LIMIT:
+                OvalButton._cache.clear()
+            pixmap = self._render(self.size(), dpr, state)
+            OvalButton._cache[key] = pixmap
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, pixmap)
+
+class CountdownWidget(QWidget):
+    # "MM:SS" biçimindeki sayacı önceden çizilmiş rakam görüntüleriyle çizer;
+    # her saniye yalnızca değişen hanelerin alanı yeniden boyanır
+    GLYPHS = "0123456789:"
+
+    def __init__(self, text="00:00", parent=None, progress_ring=False):
+        super().__init__(parent)
+        self._text = text
+        self._font = QFont("Segoe UI", 50, QFont.Black)
+        self._color = QColor("#014f68")
+        self._background = QColor("#fffbee")
+        self._ring_track = QColor("#efece3")
+        self._ring_color = QColor("#eb5539")
+        self._progress_ring = progress_ring
+        self._progress = 0.0
+        metrics = QFontMetrics(self._font)
+        # Rakamlar tek bir hücre genişliğinde tutulur ki metin kaymasın
+        self._digit_width = max(metrics.horizontalAdvance(c) for c in "0123456789")
+        self._colon_width = metrics.horizontalAdvance(":")
+        self._glyph_height = metrics.height()
+        self._ascent = metrics.ascent()
+        self._glyphs = {}
+        self._glyph_dpr = None
+        self._cells = []
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        self.setFixedHeight(self._glyph_height + (24 if progress_ring else 8))
+
+    def text(self):
+        return self._text
+
+    def setText(self, text):
+        if text == self._text:
+            return
+        old = self._text
+        self._text = text
+        if len(old) != len(text) or not self._cells:
+            self._layout_cells()
+            self.update()
+            return
+        for i, (a, b) in enumerate(zip(old, text)):
+            if a != b:
+                self.update(self._cells[i])
+
+    def set_progress(self, fraction):
+        if not self._progress_ring:
+            return
+        fraction = min(max(fraction, 0.0), 1.0)
+        # Halka yalnızca görünür bir değişiklik olduğunda yeniden çizilir
+        if abs(fraction - self._progress) * 360 * 16 >= 16:
+            self._progress = fraction
+            self.update()
+
+    def sizeHint(self):
+        width = 4 * self._digit_width + self._colon_width
+        return QSize(width + 16, self.height())
+
+    def _cell_width(self, char):
+        return self._colon_width if char == ":" else self._digit_width
+
+    def _layout_cells(self):
+        total = sum(self._cell_width(c) for c in self._text)
+        x = (self.width() - total) // 2
+        y = (self.height() - self._glyph_height) // 2
+        self._cells = []
+        for char in self._text:
+            w = self._cell_width(char)
+            self._cells.append(QRect(x, y, w, self._glyph_height))
+            x += w
+
+    def resizeEvent(self, event):
+        self._layout_cells()
+        super().resizeEvent(event)
+
+    def _glyph(self, char):
+        dpr = self.devicePixelRatioF()
+        if dpr != self._glyph_dpr:
+            self._glyphs.clear()
+            self._glyph_dpr = dpr
+        pixmap = self._glyphs.get(char)
+        if pixmap is None:
+            width = self._cell_width(char)
+            pixmap = QPixmap(QSize(width, self._glyph_height) * dpr)
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.TextAntialiasing)
+            painter.setFont(self._font)
+            painter.setPen(self._color)
+            painter.drawText(QRect(0, 0, width, self._glyph_height), Qt.AlignCenter, char)
+            painter.end()
+            self._glyphs[char] = pixmap
+        return pixmap
+
+    def paintEvent(self, event):
+        tracer.count("repaint.countdown")
+        painter = QPainter(self)
+        dirty = event.rect()
+        painter.fillRect(dirty, self._background)
+        if self._progress_ring:
+            painter.setRenderHint(QPainter.Antialiasing)
+            ring = QRectF(self.rect()).adjusted(3, 3, -3, -3)
+            painter.setPen(QPen(self._ring_track, 3))
+            painter.drawEllipse(ring)
+            painter.setPen(QPen(self._ring_color, 3, Qt.SolidLine, Qt.RoundCap))
+            painter.drawArc(ring, 90 * 16, -int(self._progress * 360 * 16))
+        for char, cell in zip(self._text, self._cells):
+            if cell.intersects(dirty):
+                painter.drawPixmap(cell.topLeft(), self._glyph(char))
+
+class TaskListModel(QAbstractListModel):
+    DoneRole = Qt.UserRole + 1
+    CompletedTimeRole = Qt.UserRole + 2
+    TaskIdRole = Qt.UserRole + 3
+
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self._store = store
+        self._moving = False
+        # Düzen değişikliği boyunca kalıcı dizinler ve gösterdikleri görevler
+        self._persistent = None
+        # Filtre varken görünür görevler liste sırasıyla burada tutulur
+        self._matcher = None
+        self._rows = None
+        self._holding = False
+        store.subscribe(self._on_store_event)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._store) if self._rows is None else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        task = self.task(index.row())
+        if role == Qt.DisplayRole:
+            return task.text
+        if role == Qt.ToolTipRole:
+            return task.desc or None
+        if role == self.DoneRole:
+            return task.done
+        if role == self.CompletedTimeRole:
+            return task.completed_time
+        if role == self.TaskIdRole:
+            return task.id
+        return None
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled if index.isValid() else Qt.NoItemFlags
+
+    def task(self, row):
+        if self._rows is not None:
+            return self._rows[row]
+        return self._store.task_at(row)
+
+    def set_filter(self, matcher):
+        # matcher() eşleşen görev kimliklerini ya da filtre yoksa None döner
+        self.beginResetModel()
+        self._matcher = matcher
+        self._refilter()
+        self.endResetModel()
+
+    def is_filtered(self):
+        return self._matcher is not None
+
+    def _refilter(self):
+        ids = self._matcher() if self._matcher is not None else None
+        self._rows = None if ids is None else self._store.tasks_in_order(ids)
+
+    def _on_store_event(self, event, payload):
+        if self._rows is not None:
+            # Süzülmüş görünümde satır eşlemesi değişir; değişiklik tek sıfırlama olarak yansır.
+            # Toplu değişikliğin tamamı da tek sıfırlamadır.
+            if self._holding:
+                if event == "batched":
+                    self._holding = False
+                    self._refilter()
+                    self.endResetModel()
+                return
+            if event == "batching":
+                self._holding = True
+                self.beginResetModel()
+            elif event in ("adding", "moving", "removing", "removing_rows", "reordering", "resetting",
+                           "adding_many", "removing_many"):
+                self.beginResetModel()
+            elif event in ("added", "moved", "removed", "rows_removed", "reordered", "reset",
+                           "added_many", "removed_many"):
+                self._refilter()
+                self.endResetModel()
+            elif event == "changed":
+                self.beginResetModel()
+                self._refilter()
+                self.endResetModel()
+            return
+        # Yalnızca etkilenen satırlar bildirilir; tek satırlık işlem tek satırı taşır
+        if event == "adding":
+            row = payload[1]
+            self.beginInsertRows(QModelIndex(), row, row)
+        elif event == "added":
+            self.endInsertRows()
+        elif event == "changed":
+            index = self.index(payload[1])
+            self.dataChanged.emit(index, index)
+        elif event == "moving":
+            _, old_row, new_row = payload
+            dest = new_row + 1 if new_row > old_row else new_row
+            self._moving = old_row != new_row and \
+                self.beginMoveRows(QModelIndex(), old_row, old_row, QModelIndex(), dest)
+        elif event == "moved":
+            if self._moving:
+                self.endMoveRows()
+                self._moving = False
+            index = self.index(payload[2])
+            self.dataChanged.emit(index, index)
+        elif event == "removing":
+            row = payload[1]
+            self.beginRemoveRows(QModelIndex(), row, row)
+        elif event == "removing_rows":
+            self.beginRemoveRows(QModelIndex(), payload[0], payload[1])
+        elif event in ("removed", "rows_removed"):
+            self.endRemoveRows()
+        elif event == "reordering":
+            # Toplu işlemler tek bir düzen değişikliği olarak yansıtılır; seçim ve düzenleyici
+            # gibi kalıcı dizinler gösterdikleri görevin yeni satırına taşınır
+            self.layoutAboutToBeChanged.emit()
+            self._persistent = [(index, self._store.task_at(index.row()).id)
+                                for index in self.persistentIndexList()]
+        elif event == "reordered":
+            old = [index for index, _ in self._persistent]
+            new = [self.index(self._store.row_of(task_id)) for _, task_id in self._persistent]
+            self._persistent = None
+            self.changePersistentIndexList(old, new)
+            self.layoutChanged.emit()
+            self.dataChanged.emit(self.index(0), self.index(len(self._store) - 1))
+        elif event in ("resetting", "adding_many", "removing_many"):
+            # Dağınık satırlara toplu ekleme/silme tek sıfırlama olarak yansıtılır
+            self.beginResetModel()
+        elif event in ("reset", "added_many", "removed_many"):
+            self.endResetModel()
+
+class TaskDelegate(QStyledItemDelegate):
+    ROW_SPACING = 12
+    BOX_SIZE = 26
+    DOTS_WIDTH = 32
+    GAP = 8
+
+    def __init__(self, view):
+        super().__init__(view)
+        self._view = view
+        self._font = QFont("Segoe UI", 15)
+        self._done_font = QFont(self._font)
+        self._done_font.setStrikeOut(True)
+        self._dots_font = QFont("Segoe UI", 17)
+        self._metrics = QFontMetrics(self._font)
+        self._box_pen = QPen(QColor("#2ec4b6"), 2)
+        self._box_checked = QBrush(QColor("#2ec4b6"))
+        self._box_unchecked = QBrush(QColor("#fffbee"))
+        self._text_color = QColor("#014f68")
+        self._done_color = QColor("#6c757d")
+        self._dots_color = QColor("#ababab")
+        self._dots_hover_color = QColor("#2ec4b6")
+
+    def geometry(self, rect):
+        row = rect.adjusted(0, 0, 0, -self.ROW_SPACING)
+        box = QRect(row.left() + 1, row.center().y() - self.BOX_SIZE // 2,
+                    self.BOX_SIZE, self.BOX_SIZE)
+        dots = QRect(row.right() - self.DOTS_WIDTH + 1, row.top(),
+                     self.DOTS_WIDTH, row.height())
+        text = QRect(box.right() + 1 + self.GAP, row.top(),
+                     dots.left() - self.GAP - box.right() - 1 - self.GAP, row.height())
+        return box, text, dots
+
+    def sizeHint(self, option, index):
+        width = self._view.viewport().width()
+        text_width = width - self.BOX_SIZE - self.DOTS_WIDTH - 2 * self.GAP - 1
+        text = index.data(Qt.DisplayRole) or ""
+        bounds = self._metrics.boundingRect(QRect(0, 0, max(text_width, 1), 10000),
+                                            Qt.TextWordWrap, text)
+        height = max(self.BOX_SIZE + 4, bounds.height())
+        return QRect(0, 0, width, height + self.ROW_SPACING).size()
+
+    def paint(self, painter, option, index):
+        done = index.data(TaskListModel.DoneRole)
+        box, text, dots = self.geometry(option.rect)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(self._box_pen)
+        painter.setBrush(self._box_checked if done else self._box_unchecked)
+        painter.drawRoundedRect(box.adjusted(1, 1, -1, -1), 4, 4)
+        painter.setFont(self._done_font if done else self._font)
+        painter.setPen(self._done_color if done else self._text_color)
+        painter.drawText(text, Qt.AlignLeft | Qt.AlignVCenter | Qt.TextWordWrap,
+                         index.data(Qt.DisplayRole))
+        hovered = index.row() == self._view.hovered_dots_row
+        painter.setFont(self._dots_font)
+        painter.setPen(self._dots_hover_color if hovered else self._dots_color)
+        painter.drawText(dots, Qt.AlignCenter, "⋮")
+        painter.restore()
+
+class TaskListView(QListView):
+    toggled = Signal(int)
+    textClicked = Signal(int)
+    menuRequested = Signal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.hovered_dots_row = -1
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setResizeMode(QListView.Adjust)
+        self.setLayoutMode(QListView.Batched)
+        self.setBatchSize(200)
+        self.setMouseTracking(True)
+        self.setItemDelegate(TaskDelegate(self))
+
+    def paintEvent(self, event):
+        tracer.count("repaint.tasks")
+        super().paintEvent(event)
+
+    def updateGeometries(self):
+        tracer.count("relayout.tasks")
+        super().updateGeometries()
+
+    def _hit(self, pos):
+        index = self.indexAt(pos)
+        if not index.isValid():
+            return -1, None
+        box, text, dots = self.itemDelegate().geometry(self.visualRect(index))
+        if box.contains(pos):
+            return index.row(), "box"
+        if dots.contains(pos):
+            return index.row(), "dots"
+        if text.contains(pos):
+            return index.row(), "text"
+        return index.row(), None
+
+    def mouseMoveEvent(self, event):
+        row, part = self._hit(event.position().toPoint())
+        hovered = row if part == "dots" else -1
+        if hovered != self.hovered_dots_row:
+            for r in (self.hovered_dots_row, hovered):
+                if r >= 0:
+                    self.viewport().update(self.visualRect(self.model().index(r, 0)))
+            self.hovered_dots_row = hovered
+        self.viewport().setCursor(Qt.PointingHandCursor if part in ("box", "dots") else Qt.ArrowCursor)
+        super().mouseMoveEvent(event)
+
+    def leaveEvent(self, event):
+        if self.hovered_dots_row >= 0:
+            self.viewport().update(self.visualRect(self.model().index(self.hovered_dots_row, 0)))
+            self.hovered_dots_row = -1
+        super().leaveEvent(event)
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            row, part = self._hit(event.position().toPoint())
+            if part == "text":
+                self.textClicked.emit(row)
+                return
+        super().mousePressEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            row, part = self._hit(event.position().toPoint())
+            if part == "box":
+                self.toggled.emit(row)
+                return
+            if part == "dots":
+                self.menuRequested.emit(row)
+                return
+        super().mouseReleaseEvent(event)
+
+def clear_focus(dialog):
+    # Yeniden kullanılan pencerede odak, yeni kurulmuş gibi ilk alana düşsün
+    widget = dialog.focusWidget()
+    if widget is not None:
+        widget.clearFocus()
 
 class CustomPopup(QWidget):
-    def __init__(self, title, message, parent=None):
+    def __init__(self, title="", message="", parent=None):
         super().__init__(parent)
         self.setWindowFlags(Qt.Dialog | Qt.FramelessWindowHint)
         self.setAttribute(Qt.WA_TranslucentBackground)
-        self.setStyleSheet("background: transparent;")
+        self.setObjectName("popup")
         self.setFixedSize(320, 220)
         outer_layout = QVBoxLayout(self)
         outer_layout.setContentsMargins(0, 0, 0, 0)
         outer_layout.setAlignment(Qt.AlignCenter)
         card = QFrame()
-        card.setStyleSheet("""
-            QFrame {
-                background-color: #fffbee;
-                border: 2px solid #f5ce95;
-                border-radius: 20px;
-            }
-        """)
+        card.setObjectName("popupCard")
         card_layout = QVBoxLayout(card)
         card_layout.setContentsMargins(24, 24, 24, 24)
         card_layout.setSpacing(16)
-        title_label = QLabel(title)
-        title_label.setFont(QFont("Segoe UI", 18, QFont.Bold))
-        title_label.setStyleSheet("color: #eb5539; background: none; border: none;")
-        title_label.setAlignment(Qt.AlignCenter)
-        card_layout.addWidget(title_label)
-        message_label = QLabel(message)
-        message_label.setFont(QFont("Segoe UI", 14))
-        message_label.setStyleSheet("color: #014f68; background: none; border: none;")
-        message_label.setWordWrap(True)
-        message_label.setAlignment(Qt.AlignCenter)
-        card_layout.addWidget(message_label)
+        self.title_label = QLabel()
+        self.title_label.setFont(QFont("Segoe UI", 18, QFont.Bold))
+        self.title_label.setObjectName("popupTitle")
+        self.title_label.setAlignment(Qt.AlignCenter)
+        card_layout.addWidget(self.title_label)
+        self.message_label = QLabel()
+        self.message_label.setFont(QFont("Segoe UI", 14))
+        self.message_label.setObjectName("popupMessage")
+        self.message_label.setWordWrap(True)
+        self.message_label.setAlignment(Qt.AlignCenter)
+        card_layout.addWidget(self.message_label)
         ok_button = OvalButton("Tamam")
         ok_button.setFixedSize(150, 42)
         ok_button.clicked.connect(self.close)
         card_layout.addWidget(ok_button, alignment=Qt.AlignCenter)
         outer_layout.addWidget(card)
+        self.reset(title, message)
+
+    def reset(self, title, message):
+        self.title_label.setText(title)
+        self.message_label.setText(message)
 
 class CustomDescriptionPopup(QDialog):
     def __init__(self, parent=None, text=""):
         super().__init__(parent)
         self.setWindowFlags(Qt.Dialog | Qt.FramelessWindowHint)
         self.setAttribute(Qt.WA_TranslucentBackground)
-        self.setStyleSheet("background: transparent;")
+        self.setObjectName("popup")
         self.setFixedSize(350, 220)
         self.result = False
         self.desc_text = ""
@@ -75,47 +693,21 @@ class CustomDescriptionPopup(QDialog):
         outer_layout.setContentsMargins(0, 0, 0, 0)
         outer_layout.setAlignment(Qt.AlignCenter)
         card = QFrame()
-        card.setStyleSheet("""
-            QFrame {
-                background-color: #fffbee;
-                border: 2px solid #f5ce95;
-                border-radius: 20px;
-            }
-        """)
+        card.setObjectName("popupCard")
         card_layout = QVBoxLayout(card)
         card_layout.setContentsMargins(24, 24, 24, 24)
         card_layout.setSpacing(12)
         title_label = QLabel("Açıklama Ekle/Düzenle")
         title_label.setFont(QFont("Segoe UI", 16, QFont.Bold))
-        title_label.setStyleSheet("color: #eb5539; background: none; border: none;")
+        title_label.setObjectName("popupTitle")
         title_label.setAlignment(Qt.AlignCenter)
         card_layout.addWidget(title_label)
         self.input = QTextEdit()
         self.input.setFont(QFont("Segoe UI", 13))
         self.input.setPlaceholderText("Açıklama girin...")
-        self.input.setText(text)
         self.input.setMaximumHeight(110)
         self.input.setMinimumHeight(60)
-        self.input.setStyleSheet("""
-            QTextEdit {
-                border: 2px solid #f5ce95;
-                border-radius: 8px;
-                padding: 8px 10px;
-                background-color: #fff;
-                color: #014f68;
-            }
-            QTextEdit QScrollBar:vertical {
-                background: #f5f5f5;
-                width: 10px;
-                margin: 2px 0 2px 0;
-                border-radius: 5px;
-            }
-            QTextEdit QScrollBar::handle:vertical {
-                background: #2ec4b6;
-                min-height: 20px;
-                border-radius: 5px;
-            }
-        """)
+        self.input.setObjectName("descInput")
         card_layout.addWidget(self.input)
         card_layout.addSpacing(8)
         button_row = QHBoxLayout()
@@ -129,6 +721,12 @@ class CustomDescriptionPopup(QDialog):
         button_row.addWidget(add_btn)
         card_layout.addLayout(button_row)
         outer_layout.addWidget(card)
+        self.reset(text)
+    def reset(self, text=""):
+        self.result = False
+        self.desc_text = ""
+        self.input.setPlainText(text)
+        clear_focus(self)
     def accept(self):
         self.result = True
         self.desc_text = self.input.toPlainText()
@@ -137,32 +735,440 @@ class CustomDescriptionPopup(QDialog):
         self.result = False
         super().reject()
 
+class WeeklyChart(QWidget):
+    # Son bir yılın haftalık pomodoro sayıları; veriler hazır özetlerden gelir
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.values = []
+        self.setMinimumHeight(90)
+
+    def set_values(self, values):
+        self.values = values
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setPen(Qt.NoPen)
+        rect = self.rect()
+        count = len(self.values)
+        if not count:
+            return
+        peak = max(self.values) or 1
+        step = rect.width() / count
+        for i, value in enumerate(self.values):
+            height = max(1, int(value * (rect.height() - 2) / peak)) if value else 1
+            painter.setBrush(QColor("#eb5539" if i == count - 1 else "#2ec4b6" if value else "#efece3"))
+            painter.drawRect(QRectF(i * step + 0.5, rect.height() - height, max(1.0, step - 1), height))
+
+class StatsPopup(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowFlags(Qt.Dialog | Qt.FramelessWindowHint)
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setObjectName("popup")
+        self.setFixedSize(350, 420)
+        outer_layout = QVBoxLayout(self)
+        outer_layout.setContentsMargins(0, 0, 0, 0)
+        outer_layout.setAlignment(Qt.AlignCenter)
+        card = QFrame()
+        card.setObjectName("popupCard")
+        card_layout = QVBoxLayout(card)
+        card_layout.setContentsMargins(24, 24, 24, 24)
+        card_layout.setSpacing(10)
+        title_label = QLabel("İstatistikler")
+        title_label.setFont(QFont("Segoe UI", 18, QFont.Bold))
+        title_label.setObjectName("popupTitle")
+        title_label.setAlignment(Qt.AlignCenter)
+        card_layout.addWidget(title_label)
+        self.summary_label = QLabel()
+        self.summary_label.setFont(QFont("Segoe UI", 12))
+        self.summary_label.setObjectName("popupMessage")
+        card_layout.addWidget(self.summary_label)
+        self.chart = WeeklyChart()
+        card_layout.addWidget(self.chart)
+        hint = QLabel("Son 53 hafta")
+        hint.setFont(QFont("Segoe UI", 9))
+        hint.setObjectName("popupHint")
+        hint.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
+        card_layout.addWidget(hint)
+        self.tasks_label = QLabel()
+        self.tasks_label.setFont(QFont("Segoe UI", 11))
+        self.tasks_label.setObjectName("popupMessage")
+        self.tasks_label.setWordWrap(True)
+        card_layout.addWidget(self.tasks_label)
+        card_layout.addStretch()
+        close_btn = OvalButton("Kapat")
+        close_btn.setFixedSize(120, 40)
+        close_btn.clicked.connect(self.accept)
+        card_layout.addWidget(close_btn, alignment=Qt.AlignCenter)
+        outer_layout.addWidget(card)
+    def reset(self, core=None):
+        if core is None:
+            return
+        today = date.today().toordinal()
+        history = core.history
+        lines = []
+        for label, (count, work, _) in (("Bugün", history.day_totals(today)),
+                                        ("Bu hafta", history.week_totals(today))):
+            lines.append(f"{label}: {count} pomodoro, {format_duration(work)}")
+        self.summary_label.setText("\n".join(lines))
+        self.chart.set_values([count for count, _, _ in history.weeks(today)])
+        top = core.top_tasks(3)
+        self.tasks_label.setText("\n".join(f"{name}: {count} pomodoro" for name, count, _ in top)
+                                 or "Henüz görevle eşleşen oturum yok")
+
+class ArchivePopup(QDialog):
+    # Arşiv yalnızca bu pencere açılınca diskten okunur
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.archive = None
+        self.setWindowFlags(Qt.Dialog | Qt.FramelessWindowHint)
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setObjectName("popup")
+        self.setFixedSize(350, 420)
+        outer_layout = QVBoxLayout(self)
+        outer_layout.setContentsMargins(0, 0, 0, 0)
+        outer_layout.setAlignment(Qt.AlignCenter)
+        card = QFrame()
+        card.setObjectName("popupCard")
+        card_layout = QVBoxLayout(card)
+        card_layout.setContentsMargins(24, 24, 24, 24)
+        card_layout.setSpacing(10)
+        title_label = QLabel("Arşiv")
+        title_label.setFont(QFont("Segoe UI", 18, QFont.Bold))
+        title_label.setObjectName("popupTitle")
+        title_label.setAlignment(Qt.AlignCenter)
+        card_layout.addWidget(title_label)
+        self.search_input = QLineEdit()
+        self.search_input.setObjectName("searchInput")
+        self.search_input.setFont(QFont("Segoe UI", 12))
+        self.search_input.setPlaceholderText("Arşivde ara...")
+        self.search_input.setClearButtonEnabled(True)
+        self.search_input.textChanged.connect(self.apply_search)
+        card_layout.addWidget(self.search_input)
+        self.list_model = QStringListModel(self)
+        self.list_view = QListView()
+        self.list_view.setObjectName("archiveList")
+        self.list_view.setFont(QFont("Segoe UI", 11))
+        self.list_view.setModel(self.list_model)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.list_view.setFocusPolicy(Qt.NoFocus)
+        card_layout.addWidget(self.list_view)
+        self.count_label = QLabel()
+        self.count_label.setFont(QFont("Segoe UI", 9))
+        self.count_label.setObjectName("popupHint")
+        self.count_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
+        card_layout.addWidget(self.count_label)
+        close_btn = OvalButton("Kapat")
+        close_btn.setFixedSize(120, 40)
+        close_btn.clicked.connect(self.accept)
+        card_layout.addWidget(close_btn, alignment=Qt.AlignCenter)
+        outer_layout.addWidget(card)
+    def reset(self, archive=None):
+        if archive is None:
+            return
+        self.archive = archive
+        self.search_input.blockSignals(True)
+        self.search_input.clear()
+        self.search_input.blockSignals(False)
+        clear_focus(self)
+        self.apply_search("")
+    def apply_search(self, text):
+        with tracer.span("archive.search", query=text):
+            tasks = self.archive.search(text)
+        lines = []
+        for task in tasks:
+            completed = task.get("completed_time")
+            when = datetime.fromtimestamp(completed).strftime("%d.%m.%Y") if completed else ""
+            lines.append(f"✓ {task['text']}" + (f"   {when}" if when else ""))
+        self.list_model.setStringList(lines)
+        self.count_label.setText(f"{len(lines)} görev")
+
+class ProgressPopup(QDialog):
+    # Uzun işlemler için ilerleme; işlem bitene kadar düğme "İptal", sonra "Kapat"
+    cancelled = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.running = False
+        self.setWindowFlags(Qt.Dialog | Qt.FramelessWindowHint)
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setObjectName("popup")
+        self.setFixedSize(350, 260)
+        outer_layout = QVBoxLayout(self)
+        outer_layout.setContentsMargins(0, 0, 0, 0)
+        outer_layout.setAlignment(Qt.AlignCenter)
+        card = QFrame()
+        card.setObjectName("popupCard")
+        card_layout = QVBoxLayout(card)
+        card_layout.setContentsMargins(24, 24, 24, 24)
+        card_layout.setSpacing(12)
+        self.title_label = QLabel()
+        self.title_label.setFont(QFont("Segoe UI", 18, QFont.Bold))
+        self.title_label.setObjectName("popupTitle")
+        self.title_label.setAlignment(Qt.AlignCenter)
+        card_layout.addWidget(self.title_label)
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setObjectName("progressBar")
+        self.progress_bar.setRange(0, 1000)
+        self.progress_bar.setFormat("%p%")
+        self.progress_bar.setFixedHeight(24)
+        card_layout.addWidget(self.progress_bar)
+        self.message_label = QLabel()
+        self.message_label.setFont(QFont("Segoe UI", 11))
+        self.message_label.setObjectName("popupMessage")
+        self.message_label.setWordWrap(True)
+        self.message_label.setAlignment(Qt.AlignCenter)
+        card_layout.addWidget(self.message_label)
+        self.button = OvalButton("İptal")
+        self.button.setFixedSize(120, 40)
+        self.button.clicked.connect(self.on_button)
+        card_layout.addWidget(self.button, alignment=Qt.AlignCenter)
+        outer_layout.addWidget(card)
+    def reset(self, title=""):
+        self.title_label.setText(title)
+        self.set_progress(0.0, "")
+        self.running = True
+        self.button.setText("İptal")
+    def set_progress(self, fraction, message):
+        self.progress_bar.setValue(int(fraction * 1000))
+        self.message_label.setText(message)
+    def finish(self, message):
+        self.running = False
+        self.progress_bar.setValue(1000)
+        self.message_label.setText(message)
+        self.button.setText("Kapat")
+    def on_button(self):
+        if self.running:
+            self.running = False
+            self.cancelled.emit()
+        self.accept()
+    def keyPressEvent(self, event):
+        # Esc de iptal sayılır
+        if event.key() == Qt.Key_Escape:
+            self.on_button()
+            return
+        super().keyPressEvent(event)
+
+class DebugOverlay(QLabel):
+    # İzleme açıkken son ölçümlerin p50/p99 değerlerini ve sayaçları pencerenin üstünde gösterir
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.setObjectName("debugOverlay")
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.move(6, 6)
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.refresh_timer.start(500)
+        self.refresh()
+
+    def refresh(self):
+        lines = [f"{'':<18}{'n':>5}{'p50':>8}{'p99':>8}"]
+        for name, (count, p50, p99) in tracer.summary().items():
+            lines.append(f"{name:<18}{count:>5}{p50:>8.2f}{p99:>8.2f}")
+        for name, value in sorted(tracer.counters.items()):
+            lines.append(f"{name:<18}{value:>5}")
+        self.setText("\n".join(lines))
+        self.adjustSize()
+        self.raise_()
+
+class PopupPool(QObject):
+    # Her açılır pencere bir kez kurulur; sonraki açılışlarda sıfırlanıp yeniden kullanılır
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.window = parent
+        self._popups = {}
+        self._opening = {}
+
+    def prebuild(self, classes):
+        for cls in classes:
+            if cls not in self._popups:
+                self._build(cls)
+
+    def _build(self, cls):
+        with tracer.span("popup.build", kind=cls.__name__):
+            popup = self._popups[cls] = cls(parent=self.window)
+            popup.installEventFilter(self)
+        return popup
+
+    def get(self, cls, *args):
+        # Açılış gecikmesi: istekten açılır pencerenin ilk çizimine kadar geçen süre
+        self._opening[cls] = time.perf_counter()
+        popup = self._popups.get(cls) or self._build(cls)
+        with tracer.span("popup.reset", kind=cls.__name__):
+            popup.reset(*args)
+        return popup
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            started = self._opening.pop(type(obj), None)
+            if started is not None:
+                tracer.sample("popup.open", (time.perf_counter() - started) * 1000)
+        return False
+
+class AppControl(ControlProtocol):
+    # Denetim komutları pencerenin kendi güncelleme yollarından geçer
+    def __init__(self, window):
+        super().__init__(window.core)
+        self.window = window
+
+    def timer_changed(self):
+        self.window.sync_timer()
+        self.window.publish_control("timer")
+
+    def task_removed(self, task_id):
+        if self.core.active_task_id == task_id:
+            self.window.set_active_task("")
+
+    def subscriptions_changed(self):
+        self.window.control.update_ticks()
+
+class ControlServer(QObject):
+    # QLocalServer üzerinden satır satır JSON; istekler olay döngüsünde işlenir
+    def __init__(self, protocol, path, parent=None):
+        super().__init__(parent)
+        self.protocol = protocol
+        self.path = path
+        self.sessions = {}
+        self.server = QLocalServer(self)
+        self.server.setSocketOptions(QLocalServer.UserAccessOption)
+        self.server.newConnection.connect(self.on_new_connection)
+        self.tick_timer = QTimer(self)
+        self.tick_timer.timeout.connect(lambda: self.publish("tick"))
+
+    def listen(self):
+        if self.server.listen(self.path):
+            return True
+        # Dinleyen yoksa önceki çalışmadan kalan soket dosyası silinip yeniden denenir
+        probe = QLocalSocket()
+        probe.connectToServer(self.path)
+        if probe.waitForConnected(200):
+            probe.abort()
+            return False
+        QLocalServer.removeServer(self.path)
+        return self.server.listen(self.path)
+
+    def close(self):
+        for sock in list(self.sessions):
+            sock.abort()
+        self.server.close()
+
+    def on_new_connection(self):
+        while self.server.hasPendingConnections():
+            sock = self.server.nextPendingConnection()
+            self.sessions[sock] = ControlSession(self.protocol)
+            sock.readyRead.connect(lambda sock=sock: self.on_ready_read(sock))
+            sock.disconnected.connect(lambda sock=sock: self.on_disconnected(sock))
+
+    def on_ready_read(self, sock):
+        session = self.sessions.get(sock)
+        if session is None:
+            return
+        # Ardışık gönderilen istekler tek okumada işlenir, yanıtları tek yazımla gider
+        out = session.feed(sock.readAll().data())
+        if out:
+            sock.write(out)
+
+    def on_disconnected(self, sock):
+        if self.sessions.pop(sock, None) is not None:
+            sock.deleteLater()
+            self.update_ticks()
+
+    def publish(self, name):
+        message = None
+        for sock, session in self.sessions.items():
+            # Okumayan istemcinin tamponu şişmesin diye olay atlanır
+            if name in session.events and sock.bytesToWrite() < MAX_LINE:
+                if message is None:
+                    message = encode(self.protocol.event(name))
+                sock.write(message)
+
+    def update_ticks(self):
+        wanted = self.protocol.core.engine.running and \
+            any("tick" in session.events for session in self.sessions.values())
+        if wanted and not self.tick_timer.isActive():
+            self.tick_timer.start(1000)
+        elif not wanted:
+            self.tick_timer.stop()
+
 class PomodoroApp(QWidget):
-    def __init__(self):
+    # Arka plan iş parçacıklarından arayüz iş parçacığına sonuç taşır
+    data_loaded = Signal(object)
+    list_loaded = Signal(object)
+    save_failed = Signal(object)
+    sound_loaded = Signal(object)
+
+    def __init__(self, wakeup_stats=False, startup_profile=False, debug_overlay=False):
         super().__init__()
+        self.startup_profile = startup_profile
+        self.startup_marks = {}
+        self._first_frame_done = False
+        # Liste değişirken core.loaded da False olur; ilk yükleme yalnızca bir kez başlatılır
+        self._load_requested = False
         self.setWindowTitle("Pomodoro ve Yapılacaklar")
         self.setFixedSize(400, 700)
-        self.setStyleSheet("QWidget { background-color: #fff1d5; border: none; }")
-        self.tasks = []
+        # Tüm görünüm tek bir uygulama stil sayfasından gelir; durumlar dinamik özelliklerle seçilir
+        QApplication.instance().setStyleSheet(APP_STYLESHEET)
         self.active_tab = "Pomodoro"
-        self.pomodoro_duration = 25 * 60
-        self.short_break = 5 * 60
-        self.long_break = 10 * 60
-        self.current_time = self.pomodoro_duration
-        self.timer_running = False
-        self.mode = "work"
-        self.pomodoro_count = 0
-        self.active_task = None
-
-        self.sound = QSoundEffect()
-        self.sound.setSource(QUrl.fromLocalFile("assets/sounds/ding.wav"))
-        self.sound.setVolume(0.5)
+        # Zamanlayıcı, görevler ve kayıt arayüzsüz çekirdekte; pencere yalnızca onu gösterir
+        self.core = PomodoroCore()
+        self.engine = self.core.engine
+        self.store = self.core.store
+        self.config = self.core.config
+        QApplication.instance().aboutToQuit.connect(self.core.close)
 
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_timer)
+        # QtMultimedia ilk kareden sonra arka planda yüklenir
+        self.sound = None
+        self.sound_loaded.connect(self.on_sound_loaded)
+        self.data_loaded.connect(self.apply_loaded_data)
+        self.list_loaded.connect(self.apply_list)
+        # Kayıt iş parçacığındaki yazım hataları arayüz iş parçacığında gösterilir
+        self.save_failed.connect(self.on_save_failed)
+        self.core.on_save_error = self.save_failed.emit
+        self.core.on_active_task_cleared = lambda: self.set_active_task("")
+
+        # Ekran tiki bir sonraki saniye sınırına, bitiş zamanlayıcısı tam bitiş anına kurulur
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self.on_tick)
+        self.tick_due = None
+        self.expiry_timer = QTimer(self)
+        self.expiry_timer.setSingleShot(True)
+        self.expiry_timer.setTimerType(Qt.PreciseTimer)
+        self.expiry_timer.timeout.connect(self.update_timer)
+        # Pencere görünmezken saniyelik güncelleme durur; yalnızca bu seyrek tepsi yenilemesi kalır
+        self.tray = None
+        self.tray_timer = QTimer(self)
+        self.tray_timer.setTimerType(Qt.VeryCoarseTimer)
+        self.tray_timer.timeout.connect(self.on_tray_tick)
+        # Başka bir örnek ya da eşitleme veri dosyalarını değiştirirse yalnızca farklar uygulanır
+        self.file_watcher = QFileSystemWatcher(self)
+        self.file_watcher.fileChanged.connect(lambda path: self.reload_timer.start(RELOAD_DELAY_MS))
+        self.reload_timer = QTimer(self)
+        self.reload_timer.setSingleShot(True)
+        self.reload_timer.timeout.connect(self.reload_external)
+        self.wakeups = WakeupMeter()
+        if wakeup_stats:
+            self.wakeup_stats_timer = QTimer(self)
+            self.wakeup_stats_timer.timeout.connect(self.print_wakeup_stats)
+            self.wakeup_stats_timer.start(60 * 1000)
+        if tracer.enabled:
+            # Olay döngüsü gecikme sondası: 50 ms'lik zamanlayıcının ne kadar geç tetiklendiği
+            self.probe_due = time.perf_counter() + 0.05
+            self.loop_probe = QTimer(self)
+            self.loop_probe.setTimerType(Qt.PreciseTimer)
+            self.loop_probe.timeout.connect(self.on_loop_probe)
+            self.loop_probe.start(50)
 
         self.build_ui()
-        self.load_data()
+        self.build_tray()
+        self.debug_overlay = DebugOverlay(self) if debug_overlay else None
+        self.popups = PopupPool(self)
+        self.control = None
+        # Görevler ve oturum durumu yüklenene kadar etkileşimli denetimler kapalı kalır
+        self.set_interactive(False)
 
     def build_ui(self):
         main_layout = QVBoxLayout(self)
@@ -170,19 +1176,19 @@ class PomodoroApp(QWidget):
         main_layout.setSpacing(10)
         card = QFrame()
         card.setObjectName("card")
-        card.setStyleSheet("QFrame#card { background-color: #fffbee; border: 2px solid #f5ce95; border-radius: 20px; }")
         card_layout = QVBoxLayout(card)
         card_layout.setContentsMargins(20, 20, 20, 30)
         card_layout.setSpacing(14)
         self.tabs = {}
         tab_widget = QWidget()
-        tab_widget.setStyleSheet("background-color: #fffbee;")
+        tab_widget.setObjectName("tabBar")
         tab_layout = QHBoxLayout(tab_widget)
         tab_layout.setSpacing(0)
         tab_layout.setContentsMargins(0, 0, 0, 0)
         for label in ["Pomodoro", "Kısa Mola", "Uzun Mola"]:
             tab = QLabel(label)
             tab.setFont(QFont("Segoe UI", 16, QFont.Bold if label == self.active_tab else QFont.Normal))
+            tab.setObjectName("tab")
             tab.setAlignment(Qt.AlignCenter)
             tab.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
             self.tabs[label] = tab
@@ -191,12 +1197,10 @@ class PomodoroApp(QWidget):
         card_layout.addWidget(tab_widget)
         underline_all = QFrame()
         underline_all.setFixedHeight(1)
-        underline_all.setStyleSheet("background-color: #efece3; border: none;")
+        underline_all.setObjectName("underline")
         card_layout.addWidget(underline_all)
-        self.time_label = QLabel(self.format_time(self.current_time))
-        self.time_label.setFont(QFont("Segoe UI", 50, QFont.Black))
-        self.time_label.setStyleSheet("color: #014f68; background-color: #fffbee;")
-        self.time_label.setAlignment(Qt.AlignCenter)
+        self.time_label = CountdownWidget(self.format_time(self.engine.remaining_seconds()),
+                                          progress_ring=self.config["progress_ring"])
         card_layout.addWidget(self.time_label)
         self.start_button = OvalButton("Başlat")
         self.start_button.setFixedSize(230, 54)
@@ -204,79 +1208,79 @@ class PomodoroApp(QWidget):
         card_layout.addWidget(self.start_button, alignment=Qt.AlignCenter)
         self.active_task_label = QLabel("<b>Aktif Görev:</b> Yok")
         self.active_task_label.setFont(QFont("Segoe UI", 15))
-        self.active_task_label.setStyleSheet("color: #014f68; background-color: #fffbee;")
+        self.active_task_label.setObjectName("activeTask")
         card_layout.addWidget(self.active_task_label)
         divider1 = QFrame()
         divider1.setFrameShape(QFrame.HLine)
         divider1.setFixedHeight(1)
-        divider1.setStyleSheet("background-color: #efece3; border: none; margin-top: 6px; margin-bottom: 6px;")
+        divider1.setObjectName("divider")
         card_layout.addWidget(divider1)
         todo_title_row = QHBoxLayout()
-        todo_title = QLabel("Yapılacaklar")
-        todo_title.setFont(QFont("Segoe UI", 16, QFont.Bold))
-        todo_title.setStyleSheet("color: #014f68; background-color: #fffbee;")
-        todo_title_row.addWidget(todo_title)
+        self.todo_title = QLabel()
+        self.todo_title.setFont(QFont("Segoe UI", 16, QFont.Bold))
+        self.todo_title.setObjectName("todoTitle")
+        todo_title_row.addWidget(self.todo_title)
+        self.list_button = QPushButton("▾")
+        self.list_button.setFont(QFont("Segoe UI", 14))
+        self.list_button.setObjectName("listButton")
+        self.list_button.setCursor(Qt.PointingHandCursor)
+        self.list_button.setFixedWidth(28)
+        self.list_button.clicked.connect(self.show_lists_menu)
+        todo_title_row.addWidget(self.list_button)
+        self.update_list_title()
         todo_title_row.addStretch()
         self.todo_three_dots = QPushButton("⋮")
         self.todo_three_dots.setFont(QFont("Segoe UI", 17))
-        self.todo_three_dots.setStyleSheet("QPushButton { color: #ababab; background: transparent; border: none; } QPushButton:hover { color: #2ec4b6; }")
+        self.todo_three_dots.setObjectName("dotsButton")
         self.todo_three_dots.setCursor(Qt.PointingHandCursor)
         self.todo_three_dots.setFixedWidth(32)
         self.todo_three_dots.clicked.connect(self.show_all_tasks_menu)
         todo_title_row.addWidget(self.todo_three_dots)
         card_layout.addLayout(todo_title_row)
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("""
-            QScrollArea { background-color: transparent; border: none; }
-            QScrollBar:vertical {
-                background: #f5f5f5;
-                width: 10px;
-                margin: 2px 0 2px 0;
-                border-radius: 5px;
-            }
-            QScrollBar::handle:vertical {
-                background: #2ec4b6;
-                min-height: 20px;
-                border-radius: 5px;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                background: none;
-                border: none;
-            }
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                background: none;
-            }
-        """)
-        self.task_container = QWidget()
-        self.task_container.setStyleSheet("background-color: #fffbee; border: none;")
-        self.task_layout = QVBoxLayout(self.task_container)
-        self.task_layout.setAlignment(Qt.AlignTop)
-        self.task_layout.setSpacing(12)
-        scroll.setWidget(self.task_container)
-        card_layout.addWidget(scroll)
+        self.search_input = QLineEdit()
+        self.search_input.setObjectName("searchInput")
+        self.search_input.setFont(QFont("Segoe UI", 12))
+        self.search_input.setPlaceholderText("Görevlerde ara...")
+        self.search_input.setClearButtonEnabled(True)
+        self.search_input.textChanged.connect(self.apply_search)
+        # Dizin ilk tuştan önce, arama kutusu odak aldığında kurulur
+        QApplication.instance().focusChanged.connect(self.on_focus_changed)
+        card_layout.addWidget(self.search_input)
+        self.task_model = TaskListModel(self.store, self)
+        self.store.subscribe(self.on_store_batch)
+        self.task_view = TaskListView()
+        self.task_view.setModel(self.task_model)
+        self.task_view.setObjectName("taskList")
+        self.task_view.toggled.connect(self.handle_check)
+        self.task_view.textClicked.connect(self.handle_task_click)
+        self.task_view.menuRequested.connect(self.show_task_menu)
+        card_layout.addWidget(self.task_view)
+        # Arama kutusundayken Ctrl+Z kutunun kendi geri almasıdır
+        QShortcut(QKeySequence.Undo, self, self.undo)
+        QShortcut(QKeySequence.Redo, self, self.redo)
         ekle_row = QHBoxLayout()
         self.plus_label = QLabel("+")
         self.plus_label.setFont(QFont("Segoe UI", 17, QFont.Bold))
-        self.plus_label.setStyleSheet("color: #2ec4b6; background-color: #fffbee;")
+        self.plus_label.setObjectName("plusLabel")
         self.plus_label.setCursor(Qt.PointingHandCursor)
         self.plus_label.mousePressEvent = self.add_task
         ekle_row.addWidget(self.plus_label)
         add_button = QPushButton("Ekle")
         add_button.setFont(QFont("Segoe UI", 15, QFont.Bold))
-        add_button.setStyleSheet("QPushButton { color: #014f68; background-color: #fffbee; border: none; }")
+        add_button.setObjectName("addButton")
         add_button.clicked.connect(self.add_task)
         ekle_row.addWidget(add_button)
         ekle_row.addStretch()
         ekle_widget = QWidget()
-        ekle_widget.setStyleSheet("background-color: #fffbee;")
+        ekle_widget.setObjectName("addRow")
         ekle_widget.setLayout(ekle_row)
-        self.task_layout.addWidget(ekle_widget)
+        self.ekle_widget = ekle_widget
+        card_layout.addWidget(ekle_widget)
 
         # Pomodoro Sayacı Label (en alta ekle)
         self.pomodoro_counter_label = QLabel()
         self.pomodoro_counter_label.setFont(QFont("Segoe UI", 12, QFont.Bold))
-        self.pomodoro_counter_label.setStyleSheet("color: #eb5539; background: none;")
+        self.pomodoro_counter_label.setObjectName("pomodoroCounter")
         self.pomodoro_counter_label.setAlignment(Qt.AlignCenter)
         self.update_pomodoro_counter()
         card_layout.addWidget(self.pomodoro_counter_label)
@@ -284,56 +1288,227 @@ class PomodoroApp(QWidget):
         bottom_divider = QFrame()
         bottom_divider.setFrameShape(QFrame.HLine)
         bottom_divider.setFixedHeight(1)
-        bottom_divider.setStyleSheet("background-color: #efece3; border: none; margin-top: 20px;")
+        bottom_divider.setObjectName("bottomDivider")
         card_layout.addWidget(bottom_divider)
         main_layout.addWidget(card)
 
+    @property
+    def storage(self):
+        # Liste değişince kayıt da değişir; her zaman etkin listeninki döner
+        return self.core.storage
+
+    def set_interactive(self, enabled):
+        for widget in (self.start_button, self.search_input, self.task_view, self.ekle_widget,
+                       self.todo_three_dots, self.list_button):
+            widget.setEnabled(enabled)
+
+    def mark_startup(self, name):
+        elapsed = (time.perf_counter() - STARTED_AT) * 1000
+        self.startup_marks[name] = elapsed
+        if self.startup_profile:
+            labels = {
+                "first_frame": "ilk kare",
+                "interactive": "etkileşime hazır",
+                "sound": "ses hazır"
+            }
+            print(f"[başlangıç] {labels.get(name, name)}: {elapsed:.1f} ms", file=sys.stderr)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self._first_frame_done:
+            self._first_frame_done = True
+            self.mark_startup("first_frame")
+            QTimer.singleShot(0, self.start_deferred_loading)
+
+    def start_deferred_loading(self):
+        if not self._load_requested:
+            self.load_data_async()
+        self.load_sound_async()
+
+    def load_sound_async(self):
+        def work():
+            try:
+                module = importlib.import_module("PySide6.QtMultimedia")
+            except ImportError:
+                module = None
+            self.sound_loaded.emit(module)
+        threading.Thread(target=work, name="pomodoro-sound", daemon=True).start()
+
+    def on_sound_loaded(self, module):
+        # QtMultimedia yüklenemezse uygulama sessiz çalışmaya devam eder
+        if module is None:
+            return
+        self.sound = module.QSoundEffect(self)
+        self.sound.setSource(QUrl.fromLocalFile("assets/sounds/ding.wav"))
+        self.sound.setVolume(0.5)
+        self.mark_startup("sound")
+
+    def play_sound(self):
+        if self.sound is not None:
+            self.sound.play()
+
+    def build_tray(self):
+        if not self.config["tray"] or not QSystemTrayIcon.isSystemTrayAvailable():
+            return
+        self.tray = QSystemTrayIcon(QIcon("assets/icons/pomodoro.png"), self)
+        menu = QMenu(self)
+        show_action = QAction("Göster", self)
+        show_action.triggered.connect(self.show_window)
+        quit_action = QAction("Çıkış", self)
+        quit_action.triggered.connect(QApplication.instance().quit)
+        menu.addAction(show_action)
+        menu.addAction(quit_action)
+        self.tray.setContextMenu(menu)
+        self.tray.activated.connect(
+            lambda reason: self.show_window() if reason == QSystemTrayIcon.Trigger else None)
+        self.tray.show()
+        self.refresh_tray()
+
+    def show_window(self):
+        self.showNormal()
+        self.raise_()
+        self.activateWindow()
+
+    def refresh_tray(self):
+        if self.tray is None:
+            return
+        state = "" if self.engine.running else " (duraklatıldı)"
+        self.tray.setToolTip(f"{TAB_FOR_MODE[self.engine.mode]}: "
+                             f"{self.format_time(self.engine.remaining_seconds())}{state}")
+
+    def on_tray_tick(self):
+        self.wakeups.hit("hidden")
+        self.refresh_tray()
+
+    def print_wakeup_stats(self):
+        print(f"uyanma/dk görünür={self.wakeups.per_minute('visible'):.1f} "
+              f"gizli={self.wakeups.per_minute('hidden'):.1f} "
+              f"(toplam {self.wakeups.totals})", file=sys.stderr)
+
+    def is_displayed(self):
+        return self.isVisible() and not self.isMinimized()
+
+    def update_wakeup_mode(self):
+        if self.is_displayed():
+            self.tray_timer.stop()
+            self.sync_timer()
+        else:
+            self.timer.stop()
+            self.refresh_tray()
+            if self.tray is not None and self.engine.running and self.config["tray_refresh_s"]:
+                self.tray_timer.start(int(self.config["tray_refresh_s"] * 1000))
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.update_wakeup_mode()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.update_wakeup_mode()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            self.update_wakeup_mode()
+
+    def closeEvent(self, event):
+        if self.tray is not None:
+            # Tepsi varken pencere kapatılınca uygulama tepside çalışmaya devam eder
+            event.ignore()
+            self.hide()
+            return
+        super().closeEvent(event)
+
     def format_time(self, seconds):
         return f"{seconds // 60:02d}:{seconds % 60:02d}"
 
     def toggle_timer(self):
-        self.timer_running = not self.timer_running
-        self.start_button.setText("Durdur" if self.timer_running else "Başlat")
-        if self.timer_running:
-            self.timer.start(1000)
+        self.core.toggle()
+        self.sync_timer()
+        self.publish_control("timer")
+
+    def start_control(self):
+        # Veriler yüklendikten sonra açılır; komutlar hiçbir zaman boş listeye uygulanmaz
+        path = socket_path(self.config)
+        if not path:
+            return
+        self.control = ControlServer(AppControl(self), path, self)
+        if not self.control.listen():
+            print(f"Denetim soketi açılamadı: {path}", file=sys.stderr)
+            self.control = None
+            return
+        QApplication.instance().aboutToQuit.connect(self.control.close)
+
+    def publish_control(self, name):
+        if self.control is not None:
+            self.control.publish(name)
+            self.control.update_ticks()
+
+    def sync_timer(self):
+        self.start_button.setText("Durdur" if self.engine.running else "Başlat")
+        self.refresh_countdown()
+        self.refresh_tray()
+        if self.engine.running:
+            self.expiry_timer.start(int(math.ceil(self.engine.remaining() * 1000)))
+            if self.is_displayed():
+                self.schedule_tick()
+            else:
+                self.timer.stop()
         else:
             self.timer.stop()
+            self.expiry_timer.stop()
+            self.tray_timer.stop()
+
+    def refresh_countdown(self):
+        self.time_label.setText(self.format_time(self.engine.remaining_seconds()))
+        self.time_label.set_progress(1 - self.engine.remaining() / self.engine.duration())
 
     def update_timer(self):
-        if self.current_time > 0:
-            self.current_time -= 1
-            self.time_label.setText(self.format_time(self.current_time))
-        else:
+        if not self.engine.running:
+            return
+        self.wakeups.hit("visible" if self.is_displayed() else "hidden")
+        if self.engine.expired():
             self.timer.stop()
-            self.timer_running = False
+            self.expiry_timer.stop()
+            # Liste değişirken biten oturum yeni liste yüklenince kapanır (apply_list -> sync_timer)
+            if not self.core.loaded:
+                return
             self.start_button.setText("Başlat")
-            self.sound.play()
+            self.play_sound()
             self.switch_mode()
+            return
+        # Gösterim sayaçtan değil, kalan süreden hesaplanır; uyku sonrası bitiş yeniden hizalanır
+        self.expiry_timer.start(int(math.ceil(self.engine.remaining() * 1000)))
+        if self.is_displayed():
+            self.refresh_countdown()
+            self.schedule_tick()
+
+    def schedule_tick(self):
+        ms = self.engine.ms_until_next_second()
+        self.tick_due = time.perf_counter() + ms / 1000
+        self.timer.start(ms)
+
+    def on_tick(self):
+        if self.tick_due is not None:
+            tracer.sample("loop.tick_late", (time.perf_counter() - self.tick_due) * 1000)
+        self.update_timer()
+
+    def on_loop_probe(self):
+        now = time.perf_counter()
+        tracer.sample("loop.lag", max(0.0, (now - self.probe_due) * 1000))
+        self.probe_due = now + 0.05
 
     def switch_mode(self):
-        if self.mode == "work":
-            self.pomodoro_count += 1
-            self.update_pomodoro_counter()
-            self.save_data()
-            self.mode = "long_break" if self.pomodoro_count % 4 == 0 else "short_break"
-        else:
-            self.mode = "work"
-        self.current_time = {
-            "work": self.pomodoro_duration,
-            "short_break": self.short_break,
-            "long_break": self.long_break
-        }[self.mode]
-        self.time_label.setText(self.format_time(self.current_time))
-        self.active_tab = {
-            "work": "Pomodoro",
-            "short_break": "Kısa Mola",
-            "long_break": "Uzun Mola"
-        }[self.mode]
+        self.core.finish()
+        self.update_pomodoro_counter()
+        self.sync_timer()
+        self.active_tab = TAB_FOR_MODE[self.engine.mode]
         self.update_tab_styles()
+        self.publish_control("mode")
         self.show_popup()
 
     def update_pomodoro_counter(self):
-        self.pomodoro_counter_label.setText(f"Toplam Pomodoro: {self.pomodoro_count}")
+        self.pomodoro_counter_label.setText(f"Toplam Pomodoro: {self.engine.pomodoro_count}")
 
     def show_popup(self):
         messages = {
@@ -341,114 +1516,66 @@ class PomodoroApp(QWidget):
             "Kısa Mola": "Kısa mola zamanı!",
             "Uzun Mola": "Uzun mola zamanı!"
         }
-        popup = CustomPopup(self.active_tab, messages[self.active_tab], self)
-        popup.move(self.geometry().center() - popup.rect().center())
-        popup.show()
+        self.show_message(self.active_tab, messages[self.active_tab])
 
     def add_task(self, event=None):
-        popup = CustomTaskPopup(self)
+        popup = self.popups.get(CustomTaskPopup)
         popup.exec()
         if popup.result and popup.task_text.strip():
             text = popup.task_text.strip()
             desc = popup.desc_text.strip() if hasattr(popup, "desc_text") else ""
-            self._add_task_widget(text, desc, False, None)
-            self.save_data()
-
-    def _add_task_widget(self, text, desc, done, completed_time):
-        task_widget = QWidget()
-        task_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Maximum)
-        row = QHBoxLayout(task_widget)
-        row.setContentsMargins(0, 0, 0, 0)
-        row.setSpacing(8)
-        checkbox = QCheckBox()
-        checkbox.setFont(QFont("Segoe UI", 15))
-        checkbox.setChecked(done)
-        checkbox.setStyleSheet("""
-            QCheckBox {
-                color: #014f68;
-                background-color: #fffbee;
-            }
-            QCheckBox::indicator {
-                width: 24px;
-                height: 24px;
-                border: 2px solid #2ec4b6;
-                border-radius: 4px;
-                background: #fffbee;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #2ec4b6;
-            }
-        """)
-        task_label = QLabel(text)
-        task_label.setFont(QFont("Segoe UI", 15))
-        task_label.setWordWrap(True)
-        task_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        task_label.setStyleSheet("""
-            QLabel {
-                color: #014f68;
-                background-color: #fffbee;
-            }
-        """)
-        if desc:
-            task_label.setToolTip(desc)
-        if done:
-            task_label.setStyleSheet(task_label.styleSheet() + "QLabel { color: #6c757d; text-decoration: line-through; }")
-        def label_click(event, lbl=task_label, cb=checkbox):
-            if not cb.isChecked():
-                self.set_active_task(lbl.text(), lbl.toolTip())
-        task_label.mousePressEvent = label_click
-        def check_callback(state, lbl=task_label, cb=checkbox):
-            self.handle_check(lbl, cb)
-        checkbox.stateChanged.connect(check_callback)
-        three_dots = QPushButton("⋮")
-        three_dots.setFont(QFont("Segoe UI", 17))
-        three_dots.setStyleSheet("QPushButton { color: #ababab; background: transparent; border: none; } QPushButton:hover { color: #2ec4b6; }")
-        three_dots.setCursor(Qt.PointingHandCursor)
-        three_dots.setFixedWidth(32)
-        three_dots.clicked.connect(lambda _, w=task_widget, lbl=task_label, cb=checkbox: self.show_task_menu(w, lbl, cb))
-        row.addWidget(checkbox)
-        row.addWidget(task_label, 1)
-        row.addWidget(three_dots)
-        row.setAlignment(Qt.AlignVCenter)
-        # Tamamlanan görevler listenin en başına, zaman sırasına göre eklenir
-        data = (task_widget, task_label, checkbox, completed_time)
-        if done:
-            idx = 0
-            while idx < len(self.tasks) and self.tasks[idx][2].isChecked() and \
-                    (self.tasks[idx][3] or 0) <= (completed_time or 0):
-                idx += 1
-            self.tasks.insert(idx, data)
-            self.task_layout.insertWidget(idx, task_widget)
-        else:
-            self.tasks.append(data)
-            self.task_layout.insertWidget(self.task_layout.count() - 1, task_widget)
+            self.core.add_task(text, desc)
+
+    def on_focus_changed(self, old, new):
+        if new is self.search_input and not self.core.search_index.built:
+            with tracer.span("search.build"):
+                self.core.search_index.build()
+
+    def apply_search(self, text):
+        # Her tuşta yalnızca dizin sorgulanır; görevler yeniden taranmaz
+        if text.strip():
+            self.task_model.set_filter(lambda: self.core.search(text))
+        elif self.task_model.is_filtered():
+            self.task_model.set_filter(None)
 
-    def show_task_menu(self, task_widget, task_label, checkbox):
+    def handle_task_click(self, row):
+        task = self.task_model.task(row)
+        if not task.done:
+            self.set_active_task(task.text, task.desc, task.id)
+
+    def show_task_menu(self, row):
+        task_id = self.task_model.task(row).id
         menu = QMenu()
         edit_action = QAction("Düzenle", self)
         desc_action = QAction("Açıklama Ekle/Düzenle", self)
         delete_action = QAction("Sil", self)
+        # Menü ya da pencere açıkken görev dışarıdan (eşitleme, denetim soketi) silinmiş olabilir;
+        # o zaman değişiklik bırakılır
         def edit_task():
-            popup = CustomTaskPopup(self, task_label.text(), task_label.toolTip())
+            task = self.store.get(task_id)
+            if task is None:
+                return
+            popup = self.popups.get(CustomTaskPopup, task.text, task.desc)
             popup.exec()
+            if task_id not in self.store:
+                return
             if popup.result and popup.task_text.strip():
-                task_label.setText(popup.task_text.strip())
                 if hasattr(popup, "desc_text") and popup.desc_text.strip():
-                    task_label.setToolTip(popup.desc_text.strip())
+                    desc = popup.desc_text.strip()
                 else:
-                    task_label.setToolTip("")
-                self.save_data()
+                    desc = ""
+                self.store.update(task_id, text=popup.task_text.strip(), desc=desc)
         def add_description():
-            popup = CustomDescriptionPopup(self, task_label.toolTip())
+            task = self.store.get(task_id)
+            if task is None:
+                return
+            popup = self.popups.get(CustomDescriptionPopup, task.desc)
             popup.exec()
-            if popup.result:
-                task_label.setToolTip(popup.desc_text)
-                self.save_data()
+            if popup.result and task_id in self.store:
+                self.store.update(task_id, desc=popup.desc_text)
         def delete_task():
-            self.task_layout.removeWidget(task_widget)
-            task_widget.deleteLater()
-            self.tasks = [t for t in self.tasks if t[0] != task_widget]
-            self.save_data()
+            if task_id in self.store:
+                self.store.remove(task_id)
         edit_action.triggered.connect(edit_task)
         desc_action.triggered.connect(add_description)
         delete_action.triggered.connect(delete_task)
@@ -459,126 +1586,412 @@ class PomodoroApp(QWidget):
 
     def show_all_tasks_menu(self):
         menu = QMenu()
+        undo_action = QAction("Geri Al", self)
+        redo_action = QAction("Yinele", self)
+        undo_action.setShortcut(QKeySequence.Undo)
+        redo_action.setShortcut(QKeySequence.Redo)
+        undo_action.setEnabled(self.core.undo_log.can_undo())
+        redo_action.setEnabled(self.core.undo_log.can_redo())
         complete_all = QAction("Hepsini Tamamla", self)
         delete_all = QAction("Hepsini Sil", self)
         delete_completed = QAction("Tamamlananları Sil", self)
-        def do_complete_all():
-            import time
-            now = time.time()
-            for idx, (widget, label, checkbox, completed_time) in enumerate(self.tasks):
-                if not checkbox.isChecked():
-                    checkbox.setChecked(True)
-                    self.tasks[idx] = (widget, label, checkbox, now + idx)
-            self.reorder_tasks()
-            self.save_data()
-        def do_delete_all():
-            for task_widget, _, _, _ in self.tasks:
-                self.task_layout.removeWidget(task_widget)
-                task_widget.deleteLater()
-            self.tasks.clear()
-            self.save_data()
-        def do_delete_completed():
-            to_remove = [t for t in self.tasks if t[2].isChecked()]
-            for task_widget, _, _, _ in to_remove:
-                self.task_layout.removeWidget(task_widget)
-                task_widget.deleteLater()
-                self.tasks.remove((task_widget, _, _, _))
-            self.save_data()
-        complete_all.triggered.connect(do_complete_all)
-        delete_all.triggered.connect(do_delete_all)
-        delete_completed.triggered.connect(do_delete_completed)
+        archive_action = QAction("Arşiv", self)
+        stats_action = QAction("İstatistikler", self)
+        import_action = QAction("İçe Aktar...", self)
+        export_action = QAction("Dışa Aktar...", self)
+        undo_action.triggered.connect(self.undo)
+        redo_action.triggered.connect(self.redo)
+        complete_all.triggered.connect(self.core.complete_all)
+        delete_all.triggered.connect(self.core.clear_tasks)
+        delete_completed.triggered.connect(self.core.remove_done)
+        archive_action.triggered.connect(self.show_archive)
+        stats_action.triggered.connect(self.show_stats)
+        import_action.triggered.connect(self.choose_import)
+        export_action.triggered.connect(self.choose_export)
+        menu.addAction(undo_action)
+        menu.addAction(redo_action)
+        menu.addSeparator()
         menu.addAction(complete_all)
         menu.addAction(delete_all)
         menu.addAction(delete_completed)
+        menu.addSeparator()
+        menu.addAction(archive_action)
+        menu.addAction(stats_action)
+        menu.addSeparator()
+        menu.addAction(import_action)
+        menu.addAction(export_action)
         menu.exec(QCursor.pos())
 
-    def set_active_task(self, text, desc=None):
+    def undo(self):
+        if self.core.undo():
+            self.drop_missing_active_task()
+
+    def redo(self):
+        if self.core.redo():
+            self.drop_missing_active_task()
+
+    def drop_missing_active_task(self):
+        active_id = self.core.active_task_id
+        if active_id is not None and active_id not in self.store:
+            self.set_active_task("")
+
+    def choose_import(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Görevleri İçe Aktar", "",
+                                              "Görevler (*.csv *.jsonl *.ndjson)")
+        if path:
+            self.import_tasks(path)
+
+    def import_tasks(self, path):
+        try:
+            importer = TaskImporter(self.core, path)
+        except (OSError, ValueError) as e:
+            self.show_message("İçe Aktar", str(e))
+            return None
+
+        def finished(importer):
+            message = f"{len(importer.added)} görev eklendi"
+            if importer.skipped:
+                line, error = importer.errors[0]
+                message += f", {importer.skipped} satır atlandı\n" + \
+                    (f"satır {line}: {error}" if line else error)
+            return message
+        return self.run_steps("İçe Aktar", importer,
+                              lambda importer: f"{len(importer.added)} görev eklendi", finished)
+
+    def choose_export(self):
+        path, selected = QFileDialog.getSaveFileName(self, "Görevleri Dışa Aktar", "gorevler.csv",
+                                                     "CSV (*.csv);;JSON Lines (*.jsonl)")
+        if path:
+            self.export_tasks(path, "jsonl" if selected.startswith("JSON") else "csv")
+
+    def export_tasks(self, path, fmt=None):
+        # Yazım sırasında değişen liste dosyaya karışmaz; başlangıçtaki sıra yazılır
+        try:
+            exporter = TaskExporter(list(self.store), path, fmt)
+        except (OSError, ValueError) as e:
+            self.show_message("Dışa Aktar", str(e))
+            return None
+
+        def written(exporter):
+            return f"{exporter.count} görev yazıldı"
+        return self.run_steps("Dışa Aktar", exporter, written, written)
+
+    def run_steps(self, title, job, progress_message, finish_message):
+        # Her adım bir parçayı işler; arada olay döngüsü çalışır, pencere donmaz.
+        # İptal ya da dosya hatasında iş kendi cancel()'ı ile geri alınır.
+        popup = self.popups.get(ProgressPopup, title)
+        step_timer = QTimer(popup)
+
+        def step():
+            try:
+                more = job.step()
+            except OSError as e:
+                step_timer.stop()
+                job.cancel()
+                popup.finish(f"İşlem yarıda kaldı, geri alındı:\n{e}")
+                return
+            if more:
+                popup.set_progress(job.progress(), progress_message(job))
+                return
+            step_timer.stop()
+            popup.finish(finish_message(job))
+
+        def cancel():
+            step_timer.stop()
+            job.cancel()
+
+        step_timer.timeout.connect(step)
+        popup.cancelled.connect(cancel)
+        step_timer.start(0)
+        popup.exec()
+        popup.cancelled.disconnect(cancel)
+        step_timer.deleteLater()
+        return job
+
+    def show_message(self, title, message):
+        # Tek bildirim: üst üste gelen mesajlar aynı pencereyi günceller
+        popup = self.popups.get(CustomPopup, title, message)
+        popup.move(self.geometry().center() - popup.rect().center())
+        popup.show()
+        popup.raise_()
+
+    def show_archive(self):
+        popup = self.popups.get(ArchivePopup, self.core.archive)
+        popup.exec()
+
+    def show_stats(self):
+        popup = self.popups.get(StatsPopup, self.core)
+        popup.exec()
+
+    def set_active_task(self, text, desc=None, task_id=None):
+        self.core.active_task = text or None
+        self.core.active_task_id = task_id if text else None
         if not text:
             self.active_task_label.setText("<b>Aktif Görev:</b> Yok")
             return
         self.active_task_label.setText(f"<b>Aktif Görev:</b> {text}" +
                                        (f"<br><span style='color:#ababab;font-size:12px'>{desc}</span>" if desc else ""))
-        self.active_task = text
-
-    def handle_check(self, label, checkbox):
-        # Aktif görev tamamlanırsa aktif görev boşalır
-        if checkbox.isChecked():
-            label.setStyleSheet(label.styleSheet() + "QLabel { color: #6c757d; text-decoration: line-through; }")
-            if self.active_task_label.text().find(label.text()) != -1:
-                self.set_active_task("")
-            import time
-            # Tamamlanma zamanını kaydet
-            for idx, (widget, lbl, cb, completed_time) in enumerate(self.tasks):
-                if lbl == label:
-                    self.tasks[idx] = (widget, lbl, cb, time.time())
+
+    def handle_check(self, row):
+        task = self.task_model.task(row)
+        # Aktif görev tamamlanırsa çekirdek onu bırakır (on_active_task_cleared)
+        if not task.done:
+            self.core.complete_task(task.id)
         else:
-            label.setStyleSheet(label.styleSheet() + "QLabel { color: #014f68; text-decoration: none; }")
-            for idx, (widget, lbl, cb, completed_time) in enumerate(self.tasks):
-                if lbl == label:
-                    self.tasks[idx] = (widget, lbl, cb, None)
-        self.reorder_tasks()
-        self.save_data()
-
-    def reorder_tasks(self):
-        # Tamamlananlar en üste, tamamlanma sırasına göre
-        completed = sorted([t for t in self.tasks if t[2].isChecked()],
-                           key=lambda x: x[3] or 0)
-        not_completed = [t for t in self.tasks if not t[2].isChecked()]
-        # Task layout sıfırlanır ve eklenir
-        while self.task_layout.count() > 1:
-            w = self.task_layout.takeAt(0).widget()
-            if w:
-                w.setParent(None)
-        self.tasks = completed + not_completed
-        for t in self.tasks:
-            self.task_layout.insertWidget(self.tasks.index(t), t[0])
+            self.core.reopen_task(task.id)
 
     def update_tab_styles(self):
+        # Yalnızca "active" özelliği değişen sekme yeniden cilalanır; stil sayfası yeniden ayrıştırılmaz
         for label, tab in self.tabs.items():
             is_active = (label == self.active_tab)
-            tab.setStyleSheet(f"""
-                QLabel {{
-                    color: {'#eb5539' if is_active else '#014f68'};
-                    background-color: #fffbee;
-                    border-bottom: {'3px solid #eb5539' if is_active else 'none'};
-                    padding-bottom: 4px;
-                }}
-            """)
-
-    def save_data(self):
-        data = {
-            "pomodoro_count": self.pomodoro_count,
-            "tasks": []
-        }
-        for task_widget, label, checkbox, completed_time in self.tasks:
-            data["tasks"].append({
-                "text": label.text(),
-                "desc": label.toolTip() if label.toolTip() else "",
-                "done": checkbox.isChecked(),
-                "completed_time": completed_time
-            })
-        with open(TASKS_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+            if tab.property("active") != is_active:
+                tab.setProperty("active", is_active)
+                tab.style().unpolish(tab)
+                tab.style().polish(tab)
 
     def load_data(self):
-        if not os.path.exists(TASKS_FILE):
-            return
-        with open(TASKS_FILE, "r", encoding="utf-8") as f:
+        self._load_requested = True
+        self.apply_loaded_data(self.core.read_saved())
+
+    def load_data_async(self, signal=None):
+        self._load_requested = True
+        signal = signal or self.data_loaded
+        def work():
             try:
-                data = json.load(f)
-            except Exception:
-                data = {}
-        self.pomodoro_count = data.get("pomodoro_count", 0)
+                result = self.core.read_saved()
+            except Exception as exc:
+                result = exc
+            signal.emit(result)
+        threading.Thread(target=work, name="pomodoro-load", daemon=True).start()
+
+    def load_plugins_async(self):
+        # Eklentilerin içe aktardıkları modüller açılışı geciktirmesin
+        def work():
+            for filename, error in self.core.load_plugins()[1]:
+                print(f"Eklenti yüklenemedi ({filename}): {error}", file=sys.stderr)
+        threading.Thread(target=work, name="pomodoro-plugins", daemon=True).start()
+
+    def load_failed(self, error, signal):
+        # Okunamayan kayda hiçbir şey yazılmaz; yeniden denenir, başka listeye ya da çıkışa geçilir
+        traceback.print_exception(error)
+        lists = self.core.lists
+        default = lists.default()
+        box = QMessageBox(QMessageBox.Critical, "Görevler yüklenemedi",
+                          f"“{lists.active}” listesi okunamadı:\n{error}", parent=self)
+        retry_button = box.addButton("Yeniden Dene", QMessageBox.AcceptRole)
+        fallback_button = None
+        if lists.active != default:
+            fallback_button = box.addButton(f"“{default}” Listesine Dön", QMessageBox.ActionRole)
+        box.addButton("Çık", QMessageBox.RejectRole)
+        box.exec()
+        if box.clickedButton() is retry_button:
+            self.load_data_async(signal)
+        elif fallback_button is not None and box.clickedButton() is fallback_button:
+            self.core.leave_list(default)
+            self.load_data_async(signal)
+        else:
+            QApplication.instance().quit()
+
+    def on_save_failed(self, error):
+        if error is None:
+            self.show_message("Kaydedildi", "Bekleyen değişiklikler diske yazıldı.")
+        else:
+            self.show_message("Kayıt yazılamadı",
+                              f"{error}\n\nDeğişiklikler bellekte; yazım yeniden denenecek.")
+
+    def update_list_title(self):
+        lists = self.core.lists
+        self.todo_title.setText(lists.active if len(lists.names()) > 1 else "Yapılacaklar")
+
+    def show_lists_menu(self):
+        menu = QMenu()
+        active = self.core.lists.active
+        for name, total, pending in self.core.list_counts():
+            # Diğer listelerin sayıları saklanan değerlerdir; kayıtları açılmaz
+            action = QAction(name if pending is None else f"{name}  ({pending})", menu)
+            action.setCheckable(True)
+            action.setChecked(name == active)
+            action.triggered.connect(lambda checked=False, name=name: self.switch_list(name))
+            menu.addAction(action)
+        menu.addSeparator()
+        new_action = QAction("Yeni Liste...", menu)
+        rename_action = QAction("Yeniden Adlandır...", menu)
+        delete_action = QAction("Listeyi Sil", menu)
+        # Yalnızca boş liste silinebilir; görevler onaysız kaybolmasın
+        delete_action.setEnabled(active != self.core.lists.default() and not len(self.store)
+                                 and not os.path.exists(self.core.archive.path))
+        new_action.triggered.connect(self.create_list)
+        rename_action.triggered.connect(self.rename_list)
+        delete_action.triggered.connect(self.delete_list)
+        menu.addAction(new_action)
+        menu.addAction(rename_action)
+        menu.addAction(delete_action)
+        menu.exec(QCursor.pos())
+
+    def ask_list_name(self, title, text=""):
+        popup = self.popups.get(ListNamePopup, title, text)
+        popup.exec()
+        return popup.name_text.strip() if popup.result else ""
+
+    def create_list(self):
+        name = self.ask_list_name("Yeni Liste")
+        if not name:
+            return
+        try:
+            name = self.core.create_list(name)
+        except (OSError, ValueError) as e:
+            self.show_message("Liste oluşturulamadı", str(e))
+            return
+        self.switch_list(name)
+
+    def rename_list(self):
+        active = self.core.lists.active
+        name = self.ask_list_name("Listeyi Yeniden Adlandır", active)
+        if not name or name == active:
+            return
+        try:
+            self.core.rename_list(active, name)
+        except ValueError as e:
+            self.show_message("Liste adlandırılamadı", str(e))
+            return
+        self.update_list_title()
+
+    def delete_list(self):
+        self.task_view.setUpdatesEnabled(False)
+        self.core.remove_list(self.core.lists.active)
+        self.task_view.setUpdatesEnabled(True)
+        self.after_list_switch()
+
+    def switch_list(self, name):
+        # Yeni listenin görevleri arka planda okunur; bu sırada eski liste soluk görünür
+        if not self.core.leave_list(name):
+            return
+        self.reload_timer.stop()
+        if self.file_watcher.files():
+            self.file_watcher.removePaths(self.file_watcher.files())
+        self.set_interactive(False)
+        self.load_data_async(self.list_loaded)
+
+    def apply_list(self, result):
+        if isinstance(result, Exception):
+            self.load_failed(result, self.list_loaded)
+            return
+        self.task_view.setUpdatesEnabled(False)
+        self.search_input.clear()
+        self.core.apply_list(result)
+        self.task_view.setUpdatesEnabled(True)
+        self.after_list_switch()
+        self.set_interactive(True)
+        self.sync_timer()
+
+    def after_list_switch(self):
+        self.update_list_title()
+        self.watch_data_files()
+        self.task_view.scrollToTop()
+
+    def on_store_batch(self, event, payload):
+        # Toplu değişiklik bitene kadar liste yeniden çizilmez
+        if event == "batching":
+            self.task_view.setUpdatesEnabled(False)
+        elif event == "batched":
+            self.task_view.setUpdatesEnabled(True)
+
+    def watch_data_files(self):
+        # Atomik olarak değiştirilen dosyanın izi düşer; her bildirimden sonra yeniden eklenir
+        watched = set(self.file_watcher.files())
+        paths = [path for path in self.storage.watch_paths() if path not in watched and os.path.exists(path)]
+        if paths:
+            self.file_watcher.addPaths(paths)
+
+    def reload_external(self):
+        self.watch_data_files()
+        if self.core.reload():
+            self.drop_missing_active_task()
+
+    def apply_loaded_data(self, result):
+        if isinstance(result, Exception):
+            self.load_failed(result, self.data_loaded)
+            return
+        # Tek toplu yükleme: model bir kez sıfırlanır, liste bu sırada yeniden çizilmez
+        self.task_view.setUpdatesEnabled(False)
+        self.core.apply_loaded(result)
+        self.task_view.setUpdatesEnabled(True)
         self.update_pomodoro_counter()
-        for task in data.get("tasks", []):
-            self._add_task_widget(task["text"], task.get("desc", ""), task.get("done", False), task.get("completed_time", None))
+        self.active_tab = TAB_FOR_MODE[self.engine.mode]
+        self.update_tab_styles()
+        self.sync_timer()
+        self.set_interactive(True)
+        self.watch_data_files()
+        self.start_control()
+        self.load_plugins_async()
+        self.mark_startup("interactive")
+        # Açılır pencereler ilk kullanımda beklenmesin diye etkileşime hazır olduktan sonra kurulur
+        QTimer.singleShot(0, lambda: self.popups.prebuild(
+            (CustomTaskPopup, CustomDescriptionPopup, CustomPopup)))
+
+class ListNamePopup(QDialog):
+    def __init__(self, parent=None, title="", text=""):
+        super().__init__(parent)
+        self.setWindowFlags(Qt.Dialog | Qt.FramelessWindowHint)
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setObjectName("popup")
+        self.setFixedSize(350, 220)
+        self.result = False
+        self.name_text = ""
+        outer_layout = QVBoxLayout(self)
+        outer_layout.setContentsMargins(0, 0, 0, 0)
+        outer_layout.setAlignment(Qt.AlignCenter)
+        card = QFrame()
+        card.setObjectName("popupCard")
+        card_layout = QVBoxLayout(card)
+        card_layout.setContentsMargins(24, 24, 24, 24)
+        card_layout.setSpacing(12)
+        self.title_label = QLabel()
+        self.title_label.setFont(QFont("Segoe UI", 16, QFont.Bold))
+        self.title_label.setObjectName("popupTitle")
+        self.title_label.setAlignment(Qt.AlignCenter)
+        card_layout.addWidget(self.title_label)
+        self.input = QLineEdit()
+        self.input.setFont(QFont("Segoe UI", 14))
+        self.input.setPlaceholderText("Liste adı...")
+        self.input.setMaxLength(MAX_NAME_LENGTH)
+        self.input.setObjectName("taskInput")
+        self.input.returnPressed.connect(self.accept)
+        card_layout.addWidget(self.input)
+        card_layout.addSpacing(8)
+        button_row = QHBoxLayout()
+        cancel_btn = OvalButton("İptal")
+        cancel_btn.setFixedSize(100, 40)
+        cancel_btn.clicked.connect(self.reject)
+        button_row.addWidget(cancel_btn)
+        save_btn = OvalButton("Kaydet")
+        save_btn.setFixedSize(100, 40)
+        save_btn.clicked.connect(self.accept)
+        button_row.addWidget(save_btn)
+        card_layout.addLayout(button_row)
+        outer_layout.addWidget(card)
+        self.reset(title, text)
+    def reset(self, title="", text=""):
+        self.result = False
+        self.name_text = ""
+        self.title_label.setText(title)
+        self.input.setText(text)
+        self.input.selectAll()
+        clear_focus(self)
+    def accept(self):
+        self.result = True
+        self.name_text = self.input.text()
+        super().accept()
+    def reject(self):
+        self.result = False
+        super().reject()
 
 class CustomTaskPopup(QDialog):
     def __init__(self, parent=None, text="", desc=""):
         super().__init__(parent)
         self.setWindowFlags(Qt.Dialog | Qt.FramelessWindowHint)
         self.setAttribute(Qt.WA_TranslucentBackground)
-        self.setStyleSheet("background: transparent;")
+        self.setObjectName("popup")
         self.setFixedSize(350, 380)
         self.result = False
         self.task_text = ""
@@ -587,67 +2000,32 @@ class CustomTaskPopup(QDialog):
         outer_layout.setContentsMargins(0, 0, 0, 0)
         outer_layout.setAlignment(Qt.AlignCenter)
         card = QFrame()
-        card.setStyleSheet("""
-            QFrame {
-                background-color: #fffbee;
-                border: 2px solid #f5ce95;
-                border-radius: 20px;
-            }
-        """)
+        card.setObjectName("popupCard")
         card_layout = QVBoxLayout(card)
         card_layout.setContentsMargins(24, 24, 24, 24)
         card_layout.setSpacing(10)
-        title_label = QLabel("Görevi Düzenle" if text else "Yeni Görev")
-        title_label.setFont(QFont("Segoe UI", 18, QFont.Bold))
-        title_label.setStyleSheet("color: #eb5539; background: none; border: none;")
-        title_label.setAlignment(Qt.AlignCenter)
-        card_layout.addWidget(title_label)
+        self.title_label = QLabel()
+        self.title_label.setFont(QFont("Segoe UI", 18, QFont.Bold))
+        self.title_label.setObjectName("popupTitle")
+        self.title_label.setAlignment(Qt.AlignCenter)
+        card_layout.addWidget(self.title_label)
         self.input = QLineEdit()
         self.input.setFont(QFont("Segoe UI", 14))
         self.input.setPlaceholderText("Görev girin...")
-        self.input.setText(text)
-        self.input.setMaxLength(50)
-        self.input.setStyleSheet("""
-            QLineEdit {
-                border: 2px solid #f5ce95;
-                border-radius: 8px;
-                padding: 6px 10px;
-                background-color: #fff;
-                color: #014f68;
-            }
-        """)
+        self.input.setMaxLength(MAX_TEXT_LENGTH)
+        self.input.setObjectName("taskInput")
         card_layout.addWidget(self.input)
-        hint = QLabel("Maksimum 50 karakter")
+        hint = QLabel(f"Maksimum {MAX_TEXT_LENGTH} karakter")
         hint.setFont(QFont("Segoe UI", 9))
-        hint.setStyleSheet("color: #bababa; border: none; margin-right: 4px;")
+        hint.setObjectName("popupHint")
         hint.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
         card_layout.addWidget(hint)
         self.desc_input = QTextEdit()
         self.desc_input.setFont(QFont("Segoe UI", 12))
         self.desc_input.setPlaceholderText("Açıklama (isteğe bağlı)")
-        self.desc_input.setText(desc)
         self.desc_input.setMaximumHeight(100)
         self.desc_input.setMinimumHeight(60)
-        self.desc_input.setStyleSheet("""
-            QTextEdit {
-                border: 1.5px solid #e5be8e;
-                border-radius: 6px;
-                padding: 6px 9px;
-                background-color: #fff;
-                color: #666;
-            }
-            QTextEdit QScrollBar:vertical {
-                background: #f5f5f5;
-                width: 10px;
-                margin: 2px 0 2px 0;
-                border-radius: 5px;
-            }
-            QTextEdit QScrollBar::handle:vertical {
-                background: #2ec4b6;
-                min-height: 20px;
-                border-radius: 5px;
-            }
-        """)
+        self.desc_input.setObjectName("taskDescInput")
         card_layout.addWidget(self.desc_input)
         card_layout.addSpacing(8)
         button_row = QHBoxLayout()
@@ -655,12 +2033,22 @@ class CustomTaskPopup(QDialog):
         cancel_btn.setFixedSize(100, 40)
         cancel_btn.clicked.connect(self.reject)
         button_row.addWidget(cancel_btn)
-        add_btn = OvalButton("Kaydet" if text else "Ekle")
-        add_btn.setFixedSize(100, 40)
-        add_btn.clicked.connect(self.accept)
-        button_row.addWidget(add_btn)
+        self.add_btn = OvalButton()
+        self.add_btn.setFixedSize(100, 40)
+        self.add_btn.clicked.connect(self.accept)
+        button_row.addWidget(self.add_btn)
         card_layout.addLayout(button_row)
         outer_layout.addWidget(card)
+        self.reset(text, desc)
+    def reset(self, text="", desc=""):
+        self.result = False
+        self.task_text = ""
+        self.desc_text = ""
+        self.title_label.setText("Görevi Düzenle" if text else "Yeni Görev")
+        self.add_btn.setText("Kaydet" if text else "Ekle")
+        self.input.setText(text)
+        self.desc_input.setPlainText(desc)
+        clear_focus(self)
     def accept(self):
         self.result = True
         self.task_text = self.input.text()
@@ -671,7 +2059,25 @@ class CustomTaskPopup(QDialog):
         super().reject()
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    win = PomodoroApp()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--wakeup-stats", action="store_true",
+                        help="dakikadaki zamanlayıcı uyanmalarını her dakika stderr'e yazar")
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="ilk kare ve etkileşime hazır olma sürelerini stderr'e yazar")
+    parser.add_argument("--trace", metavar="DOSYA",
+                        help="ölçüm aralıklarını çıkışta Chrome trace-event JSON olarak yazar")
+    parser.add_argument("--debug-overlay", action="store_true",
+                        help="son ölçümlerin p50/p99 değerlerini pencerede gösterir")
+    args, qt_args = parser.parse_known_args()
+    # Çekirdeğin uyarıları stderr'e; kayıt hataları ayrıca pencerede gösterilir
+    logging.basicConfig(format="%(levelname)s %(name)s: %(message)s")
+    if args.trace or args.debug_overlay:
+        tracer.enable()
+    app = QApplication(sys.argv[:1] + qt_args)
+    win = PomodoroApp(wakeup_stats=args.wakeup_stats, startup_profile=args.startup_profile,
+                      debug_overlay=args.debug_overlay)
+    if args.trace:
+        # Çekirdek kapandıktan sonra yazılır; son kayıtlar da izde yer alır
+        app.aboutToQuit.connect(lambda: tracer.export(args.trace))
     win.show()
     sys.exit(app.exec())
@@ -0,0 +1,231 @@
+# Görev listesi ve kayıt sıcak yolları için ölçüm takımı.
+#
+#   python benchmarks/bench.py --output sonuc.json
+#   python benchmarks/bench.py --sizes 100 1000 --storage sqlite
+#   python benchmarks/bench.py --compare onceki.json sonuc.json
+#
+# Her boyut ayrı bir süreçte ölçülür; böylece tepe RSS o boyuta aittir.
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SIZES = [100, 1000, 10000, 50000]
+REPEAT = 100
+THRESHOLD = 1.2
+
+
+def make_tasks(count, seed=1):
+    rnd = random.Random(seed)
+    tasks = []
+    for i in range(count):
+        done = i % 3 == 0
+        tasks.append({
+            "text": f"Görev {i}",
+            "desc": "açıklama" if rnd.random() < 0.3 else "",
+            "done": done,
+            "completed_time": 1_700_000_000 + i if done else None
+        })
+    return tasks
+
+
+def peak_rss_kb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS bayt, Linux kilobayt döner
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def per_op(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def once(func):
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1000
+
+
+def measure_footprint(tasks):
+    from pomodoro.store import TaskStore
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    store = TaskStore()
+    store.load(tasks)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del store
+    return (after - before) / max(1, len(tasks))
+
+
+def run_size(count, storage, repeat):
+    sys.path.insert(0, ROOT)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from pomodoro.config import TASKS_FILE
+    from pomodoro.journal import write_snapshot
+
+    workdir = tempfile.mkdtemp(prefix="pomodoro-bench-")
+    os.chdir(workdir)
+    with open("pomodoro_config.json", "w", encoding="utf-8") as f:
+        # Arşivleme kapalı: tamamlanmış görevler iş yükünün parçası olarak kalır
+        json.dump({"storage": storage, "archive_after_days": 0}, f)
+    tasks = make_tasks(count)
+    # Başka iş yapılmadan ölçülür; yoksa serbest listelerden gelen demetler sayılmaz
+    result = {"tasks": count, "bytes_per_task": round(measure_footprint(tasks), 1)}
+    # Güncel biçimde yazılır ki "load" ölçümü eski dosya dönüşümünü içermesin
+    write_snapshot(TASKS_FILE, {"pomodoro_count": 0, "generation": 1, "journal_offset": 0, "tasks": tasks})
+    if storage == "sqlite":
+        from pomodoro.sqlite_store import migrate_json
+        migrate_json(TASKS_FILE, "pomodoro.db")
+
+    from PySide6.QtWidgets import QApplication
+    import basic
+    app = QApplication.instance() or QApplication([])
+    win = basic.PomodoroApp()
+    core = win.core
+    timings = {}
+
+    def load():
+        win.load_data()
+        app.processEvents()
+    timings["load"] = once(load)
+    win.show()
+    app.processEvents()
+
+    rnd = random.Random(2)
+
+    def add():
+        core.add_task("Yeni görev")
+        app.processEvents()
+    timings["add_task"] = per_op(add, repeat)
+
+    def check():
+        win.handle_check(rnd.randrange(len(core.store)))
+        app.processEvents()
+    timings["handle_check"] = per_op(check, repeat)
+
+    def save_state():
+        # core.save_state değişmeyen durumu atlar; burada her seferinde yazılır
+        core.storage.record_state(pomodoro_count=core.engine.pomodoro_count, timer=core.engine.to_state())
+        core.storage.flush()
+    timings["save_state"] = per_op(save_state, min(repeat, 20))
+    timings["compact"] = once(core.storage.compact) if hasattr(core.storage, "compact") else None
+
+    def complete_all():
+        core.complete_all()
+        app.processEvents()
+    timings["complete_all"] = once(complete_all)
+
+    def remove_done():
+        core.remove_done()
+        app.processEvents()
+    timings["remove_done"] = once(remove_done)
+
+    core.close()
+    # Kayıt zamanlayıcısı: yazım sayısı, birleştirilen kayıtlar, değişiklikten diske gecikme
+    save = core.storage.stats()
+    result["save"] = {k: round(v, 3) if isinstance(v, float) else v for k, v in save.items()}
+    os.chdir(ROOT)
+    shutil.rmtree(workdir, ignore_errors=True)
+    result["timings_ms"] = {k: round(v, 3) for k, v in timings.items() if v is not None}
+    result["peak_rss_kb"] = peak_rss_kb()
+    return result
+
+
+def git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                             capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def run_all(sizes, storage, repeat):
+    results = []
+    for count in sizes:
+        cmd = [sys.executable, os.path.abspath(__file__), "--run-size", str(count),
+               "--storage", storage, "--repeat", str(repeat)]
+        out = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        result = json.loads(out.stdout.strip().splitlines()[-1])
+        print(f"{count:>6} görev: " + ", ".join(f"{k}={v:.2f}ms" for k, v in result["timings_ms"].items())
+              + f", rss={result['peak_rss_kb']}kB, {result['bytes_per_task']}B/görev"
+              + f", kayıt p50={result['save'].get('p50_latency_ms', 0):.2f}ms", file=sys.stderr)
+        results.append(result)
+    from PySide6 import __version__ as qt_version
+    return {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "pyside6": qt_version,
+        "storage": storage,
+        "repeat": repeat,
+        "results": results
+    }
+
+
+def compare(old_path, new_path, threshold):
+    # Süre veya bellek eşikten fazla artarsa gerileme sayılır
+    with open(old_path, "r", encoding="utf-8") as f:
+        old = {r["tasks"]: r for r in json.load(f)["results"]}
+    with open(new_path, "r", encoding="utf-8") as f:
+        new = {r["tasks"]: r for r in json.load(f)["results"]}
+    regressions = 0
+    for count in sorted(set(old) & set(new)):
+        pairs = [(f"{k} (ms)", old[count]["timings_ms"].get(k), v)
+                 for k, v in new[count]["timings_ms"].items()]
+        pairs.append(("peak_rss_kb", old[count]["peak_rss_kb"], new[count]["peak_rss_kb"]))
+        pairs.append(("bytes_per_task", old[count]["bytes_per_task"], new[count]["bytes_per_task"]))
+        for name, before, after in pairs:
+            if not before or after is None:
+                continue
+            ratio = after / before
+            flag = ""
+            if ratio > threshold:
+                flag = "  GERİLEME"
+                regressions += 1
+            print(f"{count:>6} {name:<22} {before:>12.2f} -> {after:>12.2f}  x{ratio:.2f}{flag}")
+    return 1 if regressions else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pomodoro görev listesi ve kayıt ölçümleri")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--storage", choices=["json", "sqlite"], default="json")
+    parser.add_argument("--repeat", type=int, default=REPEAT,
+                        help="tek görevlik işlemlerin tekrar sayısı (medyan raporlanır)")
+    parser.add_argument("--output", help="JSON sonuç dosyası (yoksa stdout)")
+    parser.add_argument("--compare", nargs=2, metavar=("ONCEKI", "SONRAKI"))
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help="gerileme sayılacak oran (varsayılan 1.2)")
+    parser.add_argument("--run-size", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.compare:
+        sys.exit(compare(args.compare[0], args.compare[1], args.threshold))
+    if args.run_size is not None:
+        print(json.dumps(run_size(args.run_size, args.storage, args.repeat)))
+        return
+    report = json.dumps(run_all(args.sizes, args.storage, args.repeat), indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(report + "\n")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+# Denetim soketi için yük testi: istek gecikmesi ve işlem hacmi.
+#
+#   python benchmarks/control_load.py --spawn
+#   python benchmarks/control_load.py --socket pomodoro.sock --requests 5000
+#
+# --spawn uygulamayı geçici bir klasörde ekransız başlatır; yoksa çalışan uygulamanın
+# soketine bağlanılır (dikkat: görev ekleyip siler).
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pomodoro.control import ControlClient
+from pomodoro.trace import percentile
+
+
+def spawn(workdir):
+    with open(os.path.join(workdir, "pomodoro_config.json"), "w", encoding="utf-8") as f:
+        json.dump({"control_socket": "pomodoro.sock"}, f)
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    proc = subprocess.Popen([sys.executable, os.path.join(ROOT, "basic.py")], cwd=workdir, env=env)
+    path = os.path.join(workdir, "pomodoro.sock")
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if os.path.exists(path):
+            try:
+                return proc, ControlClient(path)
+            except OSError:
+                pass
+        time.sleep(0.05)
+    proc.kill()
+    raise RuntimeError("uygulama soketi açmadı")
+
+
+def sequential(client, cmd, count, make_args):
+    # Her istek yanıtı beklenerek gönderilir: gidiş-dönüş gecikmesi
+    samples = []
+    for i in range(count):
+        start = time.perf_counter()
+        client.call(cmd, **make_args(i))
+        samples.append((time.perf_counter() - start) * 1000)
+    return {"requests": count, "p50_ms": round(percentile(samples, 0.5), 3),
+            "p99_ms": round(percentile(samples, 0.99), 3),
+            "per_s": round(count / (sum(samples) / 1000), 1)}
+
+
+def pipelined(client, cmd, count, make_args, window):
+    # window kadar istek yanıt beklenmeden gönderilir: işlem hacmi
+    start = time.perf_counter()
+    sent = received = 0
+    while received < count:
+        while sent < count and sent - received < window:
+            client.send(cmd, **make_args(sent))
+            sent += 1
+        response = client.receive()
+        if not response["ok"]:
+            raise RuntimeError(response["error"])
+        received += 1
+    elapsed = time.perf_counter() - start
+    return {"requests": count, "window": window, "per_s": round(count / elapsed, 1)}
+
+
+def batched(client, count, size):
+    # Görevler size'lık toplu komutlarla eklenir
+    samples = []
+    ids = []
+    for first in range(0, count, size):
+        ops = [{"cmd": "add", "text": f"toplu {i}"} for i in range(first, min(count, first + size))]
+        start = time.perf_counter()
+        ids.extend(task["id"] for task in client.call("batch", ops=ops))
+        samples.append((time.perf_counter() - start) * 1000)
+    return ids, {"tasks": count, "batch": size, "p50_ms": round(statistics.median(samples), 3),
+                 "tasks_per_s": round(count / (sum(samples) / 1000), 1)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pomodoro denetim soketi yük testi")
+    parser.add_argument("--socket", default="pomodoro.sock")
+    parser.add_argument("--spawn", action="store_true", help="uygulamayı geçici klasörde başlatır")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--window", type=int, default=64, help="ardışık gönderimde yanıt beklenmeyen istek sayısı")
+    parser.add_argument("--batch", type=int, default=500, help="toplu komut başına görev")
+    args = parser.parse_args()
+
+    proc = workdir = None
+    if args.spawn:
+        workdir = tempfile.mkdtemp(prefix="pomodoro-control-")
+        proc, client = spawn(workdir)
+    else:
+        client = ControlClient(os.path.abspath(args.socket))
+    n = args.requests
+    try:
+        report = {"status": sequential(client, "status", n, lambda i: {})}
+        report["status_pipelined"] = pipelined(client, "status", n, lambda i: {}, args.window)
+        before = {task["id"] for task in client.call("list")}
+        report["add"] = sequential(client, "add", n, lambda i: {"text": f"yük {i}"})
+        ids = [task["id"] for task in client.call("list") if task["id"] not in before]
+        report["complete_pipelined"] = pipelined(client, "complete", len(ids),
+                                                 lambda i: {"id": ids[i]}, args.window)
+        batch_ids, report["batch_add"] = batched(client, n, args.batch)
+        # Eklenenler tek toplu komutla silinir
+        start = time.perf_counter()
+        client.call("batch", ops=[{"cmd": "delete", "id": task_id} for task_id in ids + batch_ids])
+        report["batch_delete_ms"] = round((time.perf_counter() - start) * 1000, 3)
+    finally:
+        client.close()
+        if proc is not None:
+            proc.terminate()
+            proc.wait(10)
+            shutil.rmtree(workdir, ignore_errors=True)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4 @@
+from .core import PomodoroCore
+from .store import Task, TaskStore
+
+__all__ = ["PomodoroCore", "Task", "TaskStore"]
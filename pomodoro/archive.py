@@ -0,0 +1,71 @@
+import gzip
+import json
+import os
+
+from .search import tokenize
+
+ARCHIVE_FILE = "pomodoro_archive.jsonl.gz"
+
+
+def archive_path(tasks_file):
+    return os.path.join(os.path.dirname(tasks_file), ARCHIVE_FILE)
+
+
+class Archive:
+    # Eski tamamlanmış görevler; her arşivleme dosyaya yeni bir gzip üyesi olarak eklenir.
+    # Dosya yalnızca arşiv görüntülenince ya da aranınca okunur.
+    def __init__(self, path=ARCHIVE_FILE):
+        self.path = path
+        self._tasks = None
+
+    def append(self, tasks):
+        # Görevler canlı listeden silinmeden önce diske zorlanır
+        if not tasks:
+            return 0
+        data = "".join(json.dumps(task.to_dict(), ensure_ascii=False, separators=(",", ":")) + "\n"
+                       for task in tasks)
+        with open(self.path, "ab") as raw:
+            with gzip.GzipFile(fileobj=raw, mode="wb") as f:
+                f.write(data.encode("utf-8"))
+            raw.flush()
+            os.fsync(raw.fileno())
+        if self._tasks is not None:
+            for task in tasks:
+                self._tasks[task.id] = task.to_dict()
+        return len(tasks)
+
+    def _read(self):
+        tasks = {}
+        if not os.path.exists(self.path):
+            return tasks
+        try:
+            with gzip.open(self.path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        task = json.loads(line)
+                    except ValueError:
+                        continue
+                    # Kesintiye uğramış bir arşivlemede görev iki kez yazılmış olabilir
+                    tasks[task["id"]] = task
+        except (EOFError, OSError):
+            # Yarım kalmış son üye: ondan önceki görevler kullanılır
+            pass
+        return tasks
+
+    def tasks(self):
+        # Tamamlanma zamanına göre yeniden eskiye
+        if self._tasks is None:
+            self._tasks = self._read()
+        return sorted(self._tasks.values(), key=lambda task: task.get("completed_time") or 0,
+                      reverse=True)
+
+    def search(self, query):
+        terms = tokenize(query)
+        if not terms:
+            return self.tasks()
+        result = []
+        for task in self.tasks():
+            tokens = tokenize(task["text"] + "\n" + task.get("desc", ""))
+            if all(any(token.startswith(term) for token in tokens) for term in terms):
+                result.append(task)
+        return result
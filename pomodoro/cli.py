@@ -0,0 +1,241 @@
+import argparse
+import logging
+import sys
+from datetime import date
+
+from .config import CONFIG_FILE, TASKS_FILE, load_config
+from .core import PomodoroCore
+from .history import week_of
+from .store import MAX_TEXT_LENGTH
+from .timer import WORK, SHORT_BREAK, LONG_BREAK
+from .transfer import FORMATS, TaskImporter, export_tasks
+
+MODE_NAMES = {
+    WORK: "Pomodoro",
+    SHORT_BREAK: "Kısa Mola",
+    LONG_BREAK: "Uzun Mola"
+}
+
+
+def format_time(seconds):
+    minutes, seconds = divmod(seconds, 60)
+    return f"{minutes:02d}:{seconds:02d}"
+
+
+def format_duration(seconds):
+    hours, minutes = divmod(int(round(seconds / 60)), 60)
+    return f"{hours} sa {minutes} dk" if hours else f"{minutes} dk"
+
+
+def cmd_start(core, args):
+    core.start()
+    return cmd_status(core, args)
+
+
+def cmd_stop(core, args):
+    core.stop()
+    return cmd_status(core, args)
+
+
+def cmd_status(core, args):
+    engine = core.engine
+    state = "çalışıyor" if engine.running else "duraklatıldı"
+    print(f"{MODE_NAMES[engine.mode]}: {format_time(engine.remaining_seconds())} ({state})")
+    print(f"Toplam Pomodoro: {engine.pomodoro_count}")
+    return 0
+
+
+def cmd_add(core, args):
+    text = args.text.strip()
+    if not text or len(text) > MAX_TEXT_LENGTH:
+        print(f"Görev 1-{MAX_TEXT_LENGTH} karakter olmalı.", file=sys.stderr)
+        return 1
+    task = core.add_task(text, args.desc)
+    print(f"{task.id}\t{task.text}")
+    return 0
+
+
+def cmd_list(core, args):
+    if args.archived:
+        for task in core.archive.search(args.search or ""):
+            print(f"{task['id']}\t[x] {task['text']}")
+        return 0
+    ids = core.search(args.search) if args.search else None
+    tasks = core.store if ids is None else core.store.tasks_in_order(ids)
+    for task in tasks:
+        if args.pending and task.done:
+            continue
+        print(f"{task.id}\t[{'x' if task.done else ' '}] {task.text}")
+    return 0
+
+
+def cmd_complete(core, args):
+    if args.id not in core.store:
+        print(f"Görev bulunamadı: {args.id}", file=sys.stderr)
+        return 1
+    task = core.complete_task(args.id)
+    print(f"{task.id}\t[x] {task.text}")
+    return 0
+
+
+def cmd_stats(core, args):
+    today = date.today().toordinal()
+    history = core.history
+    for label, (count, work, _) in (("Bugün", history.day_totals(today)),
+                                    ("Bu hafta", history.week_totals(today))):
+        print(f"{label}: {count} pomodoro, {format_duration(work)}")
+    weeks = history.weeks(today, args.weeks)
+    peak = max(count for count, _, _ in weeks) or 1
+    first = week_of(today) - len(weeks) + 1
+    for offset, (count, _, _) in enumerate(weeks):
+        start = date.fromordinal((first + offset) * 7 + 1)
+        print(f"{start:%d.%m.%Y}  {'#' * round(count * 30 / peak):<30} {count}")
+    for name, count, work in core.top_tasks():
+        print(f"{count:>4}  {format_duration(work):>10}  {name}")
+    return 0
+
+
+def cmd_import(core, args):
+    try:
+        importer = TaskImporter(core, args.path, args.format)
+    except (OSError, ValueError) as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    def progress(importer):
+        if sys.stderr.isatty():
+            print(f"\r%{importer.progress() * 100:.0f}  {len(importer.added)} görev", end="", file=sys.stderr)
+    try:
+        importer.run(progress)
+    except KeyboardInterrupt:
+        importer.cancel()
+        print("\nİptal edildi; hiçbir görev eklenmedi", file=sys.stderr)
+        return 130
+    if sys.stderr.isatty():
+        print(file=sys.stderr)
+    for line, message in importer.errors:
+        print(f"satır {line}: {message}" if line else message, file=sys.stderr)
+    print(f"{len(importer.added)} görev eklendi, {importer.skipped} satır atlandı")
+    return 0
+
+
+def cmd_export(core, args):
+    if args.archived:
+        tasks = core.archive.tasks()
+    else:
+        tasks = (task for task in core.store if not (args.pending and task.done))
+    try:
+        count = export_tasks(tasks, args.path, args.format)
+    except (OSError, ValueError) as e:
+        print(e, file=sys.stderr)
+        return 1
+    print(f"{count} görev yazıldı: {args.path}")
+    return 0
+
+
+def cmd_archive(core, args):
+    days = core.config.get("archive_after_days", 0) if args.days is None else args.days
+    if days <= 0:
+        print("Gün sayısı verilmeli: --days ya da archive_after_days ayarı.", file=sys.stderr)
+        return 1
+    tasks = core.archive_old(days)
+    print(f"{len(tasks)} görev arşivlendi")
+    return 0
+
+
+def cmd_lists(core, args):
+    try:
+        if args.new:
+            core.create_list(args.new)
+        if args.use:
+            core.switch_list(args.use)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+    except KeyError:
+        print(f"Liste bulunamadı: {args.use}", file=sys.stderr)
+        return 1
+    for name, total, pending in core.list_counts():
+        mark = "*" if name == core.lists.active else " "
+        print(f"{mark} {name}" + ("" if total is None else f"\t{pending} bekleyen / {total}"))
+    return 0
+
+
+COMMANDS = {
+    "start": cmd_start,
+    "stop": cmd_stop,
+    "status": cmd_status,
+    "add": cmd_add,
+    "list": cmd_list,
+    "complete": cmd_complete,
+    "stats": cmd_stats,
+    "import": cmd_import,
+    "export": cmd_export,
+    "archive": cmd_archive,
+    "lists": cmd_lists
+}
+
+
+# Eklenti kancalarına olay gönderebilen komutlar; diğerleri için eklentiler yüklenmez
+HOOK_COMMANDS = ("start", "add", "complete", "import")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="pomodoro",
+                                     description="Arayüz olmadan pomodoro zamanlayıcısı ve görevler")
+    parser.add_argument("--file", default=TASKS_FILE, help="görev dosyası")
+    parser.add_argument("--config", default=CONFIG_FILE, help="ayar dosyası")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("start", help="zamanlayıcıyı başlatır")
+    sub.add_parser("stop", help="zamanlayıcıyı duraklatır")
+    sub.add_parser("status", help="mod, kalan süre ve toplam pomodoro")
+    add = sub.add_parser("add", help="görev ekler")
+    add.add_argument("text")
+    add.add_argument("--desc", default="", help="açıklama")
+    listing = sub.add_parser("list", help="görevleri listeler")
+    listing.add_argument("--pending", action="store_true", help="yalnızca tamamlanmamış görevler")
+    listing.add_argument("--search", help="metin ya da açıklamada geçen sözcükler (önek eşleşir)")
+    listing.add_argument("--archived", action="store_true", help="arşivlenmiş görevler")
+    complete = sub.add_parser("complete", help="görevi tamamlandı olarak işaretler")
+    complete.add_argument("id", type=int)
+    stats = sub.add_parser("stats", help="günlük/haftalık oturum özeti ve en çok çalışılan görevler")
+    stats.add_argument("--weeks", type=int, default=8, help="gösterilecek hafta sayısı")
+    importing = sub.add_parser("import", help="CSV ya da JSON Lines dosyasından görev ekler")
+    importing.add_argument("path")
+    importing.add_argument("--format", choices=FORMATS, help="varsayılan: dosya uzantısından")
+    exporting = sub.add_parser("export", help="görevleri CSV ya da JSON Lines olarak yazar")
+    exporting.add_argument("path")
+    exporting.add_argument("--format", choices=FORMATS, help="varsayılan: dosya uzantısından")
+    exporting.add_argument("--pending", action="store_true", help="yalnızca tamamlanmamış görevler")
+    exporting.add_argument("--archived", action="store_true", help="arşivlenmiş görevler")
+    archiving = sub.add_parser("archive", help="eski tamamlanmış görevleri arşive taşır")
+    archiving.add_argument("--days", type=int,
+                           help="bu kadar günden eski olanlar (varsayılan: archive_after_days)")
+    lists = sub.add_parser("lists", help="görev listelerini gösterir, oluşturur ya da etkin listeyi değiştirir")
+    lists.add_argument("--new", metavar="AD", help="yeni liste oluşturur")
+    lists.add_argument("--use", metavar="AD", help="etkin listeyi değiştirir")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    # Kitaplık modüllerinin uyarıları (kayıt, kanca, sıkıştırma hataları) stderr'e yazılır
+    logging.basicConfig(format="%(message)s")
+    core = PomodoroCore(load_config(args.config), args.file)
+    core.load()
+    # Kapanacak oturum da work_completed olayı gönderir
+    if args.command in HOOK_COMMANDS or core.engine.expired():
+        for filename, error in core.load_plugins()[1]:
+            print(f"Eklenti yüklenemedi ({filename}): {error}", file=sys.stderr)
+    try:
+        # Uygulama kapalıyken süresi dolan oturum önce kapatılır; komut satırı yalnızca
+        # archive komutuyla arşivler
+        finished = core.tick(archive=False)
+        if finished is not None:
+            print(f"{MODE_NAMES[finished]} tamamlandı.")
+        return COMMANDS[args.command](core, args)
+    finally:
+        core.close()
+        lost = core.storage.stats().get("lost")
+        if lost:
+            print(f"{lost} kayıt yazılamadı.", file=sys.stderr)
@@ -0,0 +1,50 @@
+import json
+import os
+
+CONFIG_FILE = "pomodoro_config.json"
+TASKS_FILE = "pomodoro_tasks.json"
+
+DEFAULTS = {
+    # "json" (anlık görüntü + günlük) veya "sqlite"
+    "storage": "json",
+    "sqlite_path": "pomodoro.db",
+    # Kayıtların biriktirilip tek seferde yazıldığı pencere
+    "save_window_ms": 300,
+    # Bu kadar günlük kaydından sonra anlık görüntüye sıkıştırılır
+    "compact_every": 500,
+    # Sistem tepsisi simgesi; açıkken pencere kapatılınca tepsiye küçülür
+    "tray": False,
+    # Sayacın etrafında oturum ilerleme halkası
+    "progress_ring": False,
+    # Pencere gizliyken tepsi ipucunun yenilenme aralığı (0: hiç)
+    "tray_refresh_s": 60,
+    # Bu kadar günden eski tamamlanmış görevler oturum bitince arşive taşınır (0: yalnızca
+    # "pomodoro archive" ile)
+    "archive_after_days": 0,
+    # Betik ve editör eklentileri için yerel denetim soketi (boş: kapalı)
+    "control_socket": "pomodoro.sock",
+    # Geri alma geçmişinin bellek bütçesi; aşılınca en eski adımlar düşer
+    "undo_budget_kb": 4096,
+    # Olay kancası eklentilerinin klasörü; her .py dosyası register(bus) tanımlar (boş: kapalı).
+    # Göreli yol görev dosyasının klasörüne göredir.
+    "plugins_dir": "",
+    # Kancaları çalıştıran iş parçacıkları, kanca başına bekleyen olay sınırı ve çağrı süresi
+    "hook_workers": 2,
+    "hook_queue_size": 64,
+    "hook_timeout_s": 5,
+    # Kapanışta kuyruktaki olaylar için ayrılan süre; kayıtlar bundan önce yazılır
+    "hook_shutdown_s": 0.5,
+}
+
+
+def load_config(path=CONFIG_FILE):
+    config = dict(DEFAULTS)
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            try:
+                data = json.load(f)
+            except Exception:
+                data = {}
+        if isinstance(data, dict):
+            config.update(data)
+    return config
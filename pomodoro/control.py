@@ -0,0 +1,314 @@
+import json
+import logging
+import os
+import socket
+
+from .store import MAX_TEXT_LENGTH
+from .trace import tracer
+
+log = logging.getLogger(__name__)
+
+# Satır başına bir JSON nesnesi:
+#   istek  {"id": 1, "cmd": "add", "text": "..."}
+#   yanıt  {"id": 1, "ok": true, "result": ...} ya da {"id": 1, "ok": false, "error": "..."}
+#   olay   {"event": "tick", ...}  (yalnızca subscribe ile istenen olaylar)
+EVENTS = ("tick", "mode", "timer")
+MAX_LINE = 1 << 20
+
+
+class ControlError(Exception):
+    pass
+
+
+def encode(message):
+    return (json.dumps(message, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def socket_path(config):
+    # Boş değer sunucuyu kapatır
+    path = config.get("control_socket")
+    return os.path.abspath(path) if path else None
+
+
+def _task_id(args):
+    task_id = args.get("id")
+    if not isinstance(task_id, int) or isinstance(task_id, bool):
+        raise ControlError("geçersiz görev kimliği")
+    return task_id
+
+
+def _text(args, key="text", required=True):
+    text = args.get(key)
+    if text is None and not required:
+        return None
+    if not isinstance(text, str) or (required and not text.strip()):
+        raise ControlError(f"geçersiz {key}")
+    text = text.strip()
+    if key == "text" and len(text) > MAX_TEXT_LENGTH:
+        raise ControlError(f"görev metni en fazla {MAX_TEXT_LENGTH} karakter olabilir")
+    return text
+
+
+def _events(events):
+    # Geçerli olay adları listesi değilse None
+    if not isinstance(events, list) or not all(isinstance(event, str) and event in EVENTS
+                                               for event in events):
+        return None
+    return events
+
+
+class ControlProtocol:
+    # Taşımadan bağımsız komut işleyici; arayüz, zamanlayıcı değişince güncellensin diye
+    # timer_changed() ve task_removed() yeniden tanımlanabilir.
+    MUTATIONS = ("add", "complete", "reopen", "delete", "edit")
+
+    def __init__(self, core):
+        self.core = core
+
+    def handle_line(self, line, session=None):
+        try:
+            request = json.loads(line)
+        except ValueError:
+            return {"id": None, "ok": False, "error": "geçersiz JSON"}
+        if not isinstance(request, dict):
+            return {"id": None, "ok": False, "error": "istek bir nesne olmalı"}
+        return self.handle(request, session)
+
+    def handle(self, request, session=None):
+        cmd = request.get("cmd")
+        handler = getattr(self, f"cmd_{cmd}", None) if isinstance(cmd, str) else None
+        if handler is None:
+            return {"id": request.get("id"), "ok": False, "error": f"bilinmeyen komut: {cmd}"}
+        try:
+            with tracer.span("control." + cmd):
+                result = handler(request, session)
+        except ControlError as e:
+            return {"id": request.get("id"), "ok": False, "error": str(e)}
+        except Exception as e:
+            # Beklenmeyen hata yalnızca bu isteği düşürür; bağlantı ve arayüz çalışmayı sürdürür
+            log.exception("Denetim komutu başarısız: %s", cmd)
+            return {"id": request.get("id"), "ok": False, "error": f"iç hata: {type(e).__name__}: {e}"}
+        return {"id": request.get("id"), "ok": True, "result": result}
+
+    def timer_changed(self):
+        pass
+
+    def task_removed(self, task_id):
+        pass
+
+    def subscriptions_changed(self):
+        pass
+
+    def status(self):
+        engine = self.core.engine
+        return {
+            "mode": engine.mode,
+            "running": engine.running,
+            "remaining": engine.remaining_seconds(),
+            "pomodoro_count": engine.pomodoro_count,
+            "active_task_id": self.core.active_task_id,
+            "list": self.core.lists.active
+        }
+
+    def event(self, name):
+        return {"event": name, **self.status()}
+
+    def cmd_ping(self, args, session):
+        return "pong"
+
+    def cmd_status(self, args, session):
+        return self.status()
+
+    def cmd_subscribe(self, args, session):
+        events = _events(args.get("events", list(EVENTS)))
+        if session is None or events is None:
+            raise ControlError(f"olaylar şunlardan seçilmeli: {', '.join(EVENTS)}")
+        session.events.update(events)
+        self.subscriptions_changed()
+        return sorted(session.events)
+
+    def cmd_unsubscribe(self, args, session):
+        if session is None:
+            raise ControlError("abonelik yok")
+        if args.get("events") is None:
+            session.events.clear()
+        else:
+            events = _events(args["events"])
+            if events is None:
+                raise ControlError(f"olaylar şunlardan seçilmeli: {', '.join(EVENTS)}")
+            session.events.difference_update(events)
+        self.subscriptions_changed()
+        return sorted(session.events)
+
+    def cmd_start(self, args, session):
+        if not self.core.engine.running:
+            self.core.start()
+            self.timer_changed()
+        return self.status()
+
+    def cmd_stop(self, args, session):
+        if self.core.engine.running:
+            self.core.stop()
+            self.timer_changed()
+        return self.status()
+
+    def cmd_list(self, args, session):
+        query = args.get("search")
+        ids = self.core.search(query) if isinstance(query, str) and query else None
+        store = self.core.store
+        tasks = store if ids is None else store.tasks_in_order(ids)
+        pending = bool(args.get("pending"))
+        return [task.to_dict() for task in tasks if not (pending and task.done)]
+
+    # Görev değişiklikleri: _check doğrular, _apply uygular. Toplu komut önce hepsini
+    # doğrular; biri bile geçersizse hiçbiri uygulanmaz.
+    def _check(self, op, ids):
+        cmd = op.get("cmd")
+        if cmd not in self.MUTATIONS:
+            raise ControlError(f"toplu komutta desteklenmeyen işlem: {cmd}")
+        if cmd == "add":
+            _text(op)
+            _text(op, "desc", required=False)
+            return
+        task_id = _task_id(op)
+        if task_id not in ids:
+            raise ControlError(f"görev bulunamadı: {task_id}")
+        if cmd == "edit":
+            if op.get("text") is None and op.get("desc") is None:
+                raise ControlError("edit için text ya da desc gerekli")
+            if op.get("text") is not None:
+                _text(op)
+            _text(op, "desc", required=False)
+        elif cmd == "delete":
+            ids.discard(task_id)
+
+    def _apply(self, op):
+        cmd = op["cmd"]
+        core = self.core
+        if cmd == "add":
+            return core.add_task(_text(op), _text(op, "desc", required=False) or "").to_dict()
+        task_id = op["id"]
+        if cmd == "complete":
+            task = core.store.get(task_id)
+            if not task.done:
+                core.complete_task(task_id)
+            return task.to_dict()
+        if cmd == "reopen":
+            return core.reopen_task(task_id).to_dict()
+        if cmd == "edit":
+            return core.store.update(task_id, text=_text(op, required=False),
+                                     desc=_text(op, "desc", required=False)).to_dict()
+        task = core.store.remove(task_id)
+        self.task_removed(task_id)
+        return task.to_dict()
+
+    def _check_loaded(self):
+        # Liste değişirken depo kayda bağlı değildir; değişiklikler kaybolurdu
+        if not self.core.loaded:
+            raise ControlError("görev listesi yükleniyor, tekrar deneyin")
+
+    def _mutate(self, args, session):
+        self._check_loaded()
+        self._check(args, _LiveIds(self.core.store))
+        return self._apply(args)
+
+    cmd_add = cmd_complete = cmd_reopen = cmd_delete = cmd_edit = _mutate
+
+    def cmd_batch(self, args, session):
+        ops = args.get("ops")
+        if not isinstance(ops, list) or not all(isinstance(op, dict) for op in ops):
+            raise ControlError("ops bir nesne listesi olmalı")
+        self._check_loaded()
+        ids = _LiveIds(self.core.store)
+        for op in ops:
+            self._check(op, ids)
+        # Tek kayıt, tek arayüz yenilemesi
+        with self.core.batch():
+            return [self._apply(op) for op in ops]
+
+
+class ControlSession:
+    # Bir bağlantının satır tamponu ve olay abonelikleri; taşıma yalnızca baytları taşır
+    def __init__(self, protocol):
+        self.protocol = protocol
+        self.events = set()
+        self._buffer = bytearray()
+
+    def feed(self, data):
+        # Gelen baytlardaki tüm tam satırları işler, yanıtları tek bayt dizisi olarak döner
+        buf = self._buffer
+        buf += data
+        out = []
+        while True:
+            end = buf.find(b"\n")
+            if end < 0:
+                break
+            line = bytes(buf[:end])
+            # Satır işlenmeden tampondan çıkarılır; işlerken hata çıksa da tekrar okunmaz
+            del buf[:end + 1]
+            if line.strip():
+                out.append(encode(self.protocol.handle_line(line, self)))
+        if len(buf) > MAX_LINE:
+            buf.clear()
+            out.append(encode({"id": None, "ok": False, "error": "satır çok uzun"}))
+        return b"".join(out)
+
+
+class _LiveIds:
+    # Depodaki kimlikler ve toplu komutta şimdiye dek silinenler; kopya çıkarılmaz
+    def __init__(self, store):
+        self.store = store
+        self.removed = set()
+
+    def __contains__(self, task_id):
+        return task_id in self.store and task_id not in self.removed
+
+    def discard(self, task_id):
+        self.removed.add(task_id)
+
+
+class ControlClient:
+    # Betikler ve yük testi için küçük, eşzamanlı istemci
+    def __init__(self, path, timeout=5.0):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        self.sock.connect(path)
+        self.file = self.sock.makefile("rb")
+        self.events = []
+        self._next_id = 0
+
+    def send(self, cmd, **args):
+        self._next_id += 1
+        self.sock.sendall(encode({"id": self._next_id, "cmd": cmd, **args}))
+        return self._next_id
+
+    def receive(self):
+        # Sıradaki yanıtı döner; arada gelen olaylar self.events'e eklenir
+        while True:
+            line = self.file.readline()
+            if not line:
+                raise ConnectionError("bağlantı kapandı")
+            message = json.loads(line)
+            if "event" in message:
+                self.events.append(message)
+                continue
+            return message
+
+    def call(self, cmd, **args):
+        self.send(cmd, **args)
+        response = self.receive()
+        if not response["ok"]:
+            raise ControlError(response["error"])
+        return response["result"]
+
+    def next_event(self):
+        if self.events:
+            return self.events.pop(0)
+        line = self.file.readline()
+        if not line:
+            raise ConnectionError("bağlantı kapandı")
+        return json.loads(line)
+
+    def close(self):
+        self.file.close()
+        self.sock.close()
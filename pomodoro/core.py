@@ -0,0 +1,410 @@
+import logging
+import os
+import time
+
+from .archive import Archive, archive_path
+from .config import TASKS_FILE, load_config
+from .history import SessionHistory, history_path
+from .hooks import EventBus, load_plugins
+from .journal import apply_record
+from .lists import TaskLists
+from .search import SearchIndex
+from .storage import open_storage
+from .store import TaskStore
+from .timer import TimerEngine, monotonic, WORK, SHORT_BREAK, LONG_BREAK
+from .trace import tracer
+from .undo import UndoLog
+
+log = logging.getLogger(__name__)
+
+DURATIONS = {
+    WORK: 25 * 60,
+    SHORT_BREAK: 5 * 60,
+    LONG_BREAK: 10 * 60
+}
+
+
+class PomodoroCore:
+    # Zamanlayıcı, görevler ve kayıt; arayüzden bağımsızdır, PySide6 içe aktarmaz
+    def __init__(self, config=None, tasks_file=TASKS_FILE, durations=DURATIONS,
+                 clock=monotonic, wall=time.time):
+        self.config = config if config is not None else load_config()
+        self.wall = wall
+        self.engine = TimerEngine(durations, clock, wall)
+        self.store = TaskStore()
+        # Dizin depoya görünümden önce abone olur; filtre güncellenirken dizin hazırdır
+        self.search_index = SearchIndex(self.store)
+        self.undo_log = UndoLog(self.store, self.config.get("undo_budget_kb", 4096) * 1024)
+        # Yalnızca etkin listenin kaydı açılır; oturum geçmişi tüm listeler için ortaktır
+        self.lists = TaskLists(tasks_file)
+        self._open_list(self.lists.active)
+        # Oturum geçmişi ve özetleri; istatistik istendiğinde ya da ilk oturum bitince yüklenir
+        self.history = SessionHistory(history_path(tasks_file))
+        self.active_task = None
+        self.active_task_id = None
+        self.loaded = False
+        # Arayüz yazım hatalarını göstermek için atar; kayıt iş parçacığında çağrılır
+        self.on_save_error = None
+        # Etkin görev tamamlanıp bırakılınca çağrılır; arayüz etiketini boşaltır
+        self.on_active_task_cleared = None
+        # Yan etkiler (zaman takibi, durum mesajı, betik) eklenti kancalarında, arka planda çalışır
+        config = self.config
+        self.hooks = EventBus(config.get("hook_workers", 2), config.get("hook_queue_size", 64),
+                              config.get("hook_timeout_s", 5), wall)
+
+    def load(self):
+        return self.apply_loaded(self.read_saved())
+
+    def read_saved(self):
+        # Arka plan iş parçacığında çağrılabilir; depoya dokunmaz
+        with tracer.span("load.read"):
+            return self.storage.load()
+
+    def apply_loaded(self, result):
+        with tracer.span("load.apply"):
+            return self._apply_loaded(result)
+
+    def _apply_loaded(self, result):
+        state, tasks = result
+        # Kaldığı oturumdan devam eder; kapalıyken süresi dolduysa ilk tick'te tamamlanır
+        self.engine.restore(state.get("timer"))
+        self.engine.pomodoro_count = state.get("pomodoro_count", 0)
+        self._use_tasks(state, tasks)
+        self.loaded = True
+        self._saved_state = self._state_key()
+        return state
+
+    def _open_list(self, name):
+        tasks_file, sqlite_path = self.lists.paths(name, self.config)
+        self.storage = open_storage(self.config, tasks_file, sqlite_path)
+        self.storage.on_error = self._save_error
+        self.archive = Archive(archive_path(tasks_file))
+        self.archived_max_id = 0
+        # Yeni listenin kaydına zamanlayıcı durumu bir kez yazılır
+        self._saved_state = None
+
+    def _use_tasks(self, state, tasks):
+        self.store.load(tasks)
+        self.archived_max_id = state.get("archived_max_id", 0)
+        self.store.reserve_ids(max(self.archived_max_id, self.lists.last_id))
+        self.storage.attach(self.store)
+
+    def _remember_list(self):
+        # Bırakılan ya da kapanan listenin sayıları değiştirici için saklanır
+        store = self.store
+        self.lists.set_counts(self.lists.active, len(store), len(store) - store.done_count())
+        self.lists.last_id = max(self.lists.last_id, store.last_id())
+
+    def switch_list(self, name):
+        if not self.leave_list(name):
+            return False
+        self.apply_list(self.read_saved())
+        return True
+
+    def leave_list(self, name):
+        # Liste değişimi açılıştaki gibi üç adımdır: leave_list, read_saved (arka planda
+        # olabilir), apply_list. Bırakılan listenin kaydı kapanır, görevleri bellekte tutulmaz.
+        if name == self.lists.active:
+            return False
+        self.lists.entry(name)
+        with tracer.span("list.leave"):
+            # Yüklenemeyen listeden dönülürken bellekteki görevler o listeye ait değildir
+            if self.loaded:
+                self._remember_list()
+                self.storage.detach(self.store)
+            # apply_list'e dek kayıt açık değil: durum yazılmaz, oturum kapanmaz, görev değişmez
+            self.loaded = False
+            self.storage.close()
+            self.lists.active = name
+            self.lists.save()
+            self._open_list(name)
+        return True
+
+    def apply_list(self, result):
+        state, tasks = result
+        with tracer.span("list.apply"):
+            # Görev kimlikleri listeye özgüdür; etkin görevin yalnızca adı kalır
+            self.active_task_id = None
+            self._use_tasks(state, tasks)
+            self.loaded = True
+            # Zamanlayıcı durumu yeni listenin kaydına yazılır; açılışta etkin listeden okunur
+            self.save_state()
+
+    def create_list(self, name):
+        return self.lists.create(name)
+
+    def rename_list(self, name, new_name):
+        return self.lists.rename(name, new_name)
+
+    def remove_list(self, name):
+        # Etkin liste silinecekse önce öntanımlı listeye geçilir
+        if name == self.lists.active:
+            self.switch_list(self.lists.default())
+        self.lists.remove(name)
+
+    def list_counts(self):
+        # (ad, toplam, bekleyen); etkin listenin sayıları canlı, diğerleri saklanan değerler
+        result = []
+        for name in self.lists.names():
+            if name == self.lists.active:
+                result.append((name, len(self.store), len(self.store) - self.store.done_count()))
+            else:
+                result.append((name, *self.lists.counts(name)))
+        return result
+
+    def reload(self):
+        # Başka bir örneğin ya da eşitlemenin yazdıkları; yalnızca değişen görevler uygulanır.
+        # Uygulanan değişiklik sayısını döner.
+        if not self.loaded or not self.storage.changed():
+            return 0
+        self.storage.flush()
+        changes = self.storage.read_changes()
+        if changes is None:
+            return 0
+        if changes[0] == "records" and self._collides(changes[1]):
+            # Kimlik çakışmasında diskteki sıra esas alınır; tüm örnekler aynı kimliklere varır
+            changes = self.storage.read_changes(full=True)
+        with tracer.span("load.reload", kind=changes[0]):
+            # Diskten gelen değişiklikler yeniden kaydedilmez ve geri alınamaz
+            self.storage.detach(self.store)
+            try:
+                with self.undo_log.paused():
+                    if changes[0] == "records":
+                        state = {}
+                        for record in changes[1]:
+                            apply_record(self.store, state, record)
+                        applied = len(changes[1])
+                    else:
+                        state = changes[1]
+                        applied = self._apply_delta(changes[2])
+            finally:
+                self.storage.attach(self.store)
+        self.archived_max_id = max(self.archived_max_id, state.get("archived_max_id", 0))
+        self.store.reserve_ids(self.archived_max_id)
+        return applied
+
+    def _collides(self, records):
+        for record in records:
+            if record.get("op") in ("add", "add_many"):
+                for item in record.get("tasks") or [record]:
+                    task = self.store.get(item["id"])
+                    if task is not None and task.text != item["text"]:
+                        return True
+        return False
+
+    def _apply_delta(self, tasks):
+        # Diskteki görevler kimliğe göre karşılaştırılır; aynı olanlara dokunulmaz
+        store = self.store
+        seen = set()
+        applied = 0
+        for item in tasks:
+            task_id = item["id"]
+            seen.add(task_id)
+            done = bool(item.get("done", False))
+            task = store.get(task_id)
+            if task is None:
+                store.add(item["text"], item.get("desc", ""), done, item.get("completed_time"),
+                          task_id=task_id, seq=item.get("seq"))
+                applied += 1
+                continue
+            desc = item.get("desc") or ""
+            if task.text != item["text"] or task.desc != desc:
+                store.update(task_id, text=item["text"], desc=desc)
+                applied += 1
+            if task.done != done:
+                store.set_done(task_id, done, item.get("completed_time"), seq=item.get("seq"))
+                applied += 1
+        for task in [task for task in store if task.id not in seen]:
+            store.remove(task.id)
+            applied += 1
+        return applied
+
+    def archive_old(self, days=None):
+        # Eski tamamlanmış görevler arşive yazılır, sonra canlı listeden silinir. Yükleme
+        # görevleri değiştirmez; yalnızca oturum bitince (isteğe bağlı) ya da istenince çağrılır.
+        days = self.config.get("archive_after_days", 0) if days is None else days
+        if not days:
+            return []
+        cutoff = self.wall() - days * 86400
+        tasks = self.store.done_before(cutoff)
+        if not tasks:
+            return tasks
+        with tracer.span("task.archive", tasks=len(tasks)):
+            self.archive.append(tasks)
+            self.archived_max_id = max(self.archived_max_id, max(task.id for task in tasks))
+            self.storage.record_state(archived_max_id=self.archived_max_id)
+            with self.undo_log.paused():
+                self.store.remove_done(before=cutoff)
+        return tasks
+
+    def load_plugins(self):
+        # Arka plan iş parçacığında çağrılabilir; eklentiler açıkça bir klasör verilince yüklenir
+        path = self.config.get("plugins_dir")
+        if not path:
+            return [], []
+        # Çalışma dizini değil, görev dosyasının klasörü esas alınır
+        base = os.path.dirname(os.path.abspath(self.lists.tasks_file))
+        return load_plugins(self.hooks, os.path.join(base, os.path.expanduser(path)))
+
+    def _state_key(self):
+        # Çalışırken bitiş anı saniyeye yuvarlanır; okuma anındaki kaymalar değişiklik sayılmaz
+        engine = self.engine
+        timer = engine.to_state()
+        end = timer["deadline"] if engine.running else timer["remaining"]
+        return (engine.mode, engine.running, engine.pomodoro_count, engine.started_at, round(end))
+
+    def _save_error(self, error):
+        # error None ise bekleyen kayıtlar sonunda yazıldı
+        if error is not None:
+            log.warning("Kayıt yazılamadı, yeniden denenecek: %s", error)
+        if self.on_save_error is not None:
+            self.on_save_error(error)
+
+    def save_state(self):
+        # Görev değişiklikleri depo olaylarıyla kaydedilir; burada yalnızca zamanlayıcı durumu.
+        # Değişmeyen durum yeniden yazılmaz; salt okuyan komutlar günlüğü büyütmez.
+        if not self.loaded:
+            return
+        key = self._state_key()
+        if key == self._saved_state:
+            return
+        self._saved_state = key
+        self.storage.record_state(pomodoro_count=self.engine.pomodoro_count,
+                                  timer=self.engine.to_state())
+
+    def start(self):
+        if self.engine.running:
+            return
+        resumed = self.engine.started_at is not None
+        self.engine.start()
+        self.save_state()
+        self._emit_started(resumed)
+
+    def stop(self):
+        self.engine.stop()
+        self.save_state()
+
+    def toggle(self):
+        resumed = self.engine.started_at is not None
+        running = self.engine.toggle()
+        self.save_state()
+        if running:
+            self._emit_started(resumed)
+        return running
+
+    def _active(self):
+        # (kimlik, ad); listede olmayan etkin görevin yalnızca adı vardır
+        task = self.store.get(self.active_task_id) if self.active_task_id is not None else None
+        if task is not None:
+            return task.id, task.text
+        return None, self.active_task
+
+    def _emit_started(self, resumed):
+        engine = self.engine
+        event = "work_started" if engine.mode == WORK else "break_started"
+        if not self.hooks.has_hooks(event):
+            return
+        task_id, text = self._active()
+        self.hooks.emit(event, mode=engine.mode, duration=engine.duration(),
+                        remaining=engine.remaining(), resumed=resumed, task_id=task_id, task=text)
+
+    def tick(self, archive=True):
+        # Süre dolduysa oturumu kapatır ve biten modu döner; liste değişirken beklenir
+        if self.loaded and self.engine.expired():
+            return self.finish(archive)
+        return None
+
+    def finish(self, archive=True):
+        finished, started, ended = self.engine.advance()
+        task_id, text = self._active()
+        if finished == WORK:
+            self.hooks.emit("work_completed", started=started, ended=ended,
+                            pomodoro_count=self.engine.pomodoro_count, task_id=task_id, task=text)
+        self.storage.add_session(started, ended, finished, task_id=task_id, task_text=text)
+        with tracer.span("history.append"):
+            self.history.append(started, ended, finished, task_id, text)
+        self.save_state()
+        # archive_after_days verildiyse eski görevler oturum bitiminde arşive taşınır
+        if archive:
+            self.archive_old()
+        return finished
+
+    def search(self, query):
+        with tracer.span("search", query=query):
+            return self.search_index.search(query)
+
+    def top_tasks(self, limit=5):
+        # Silinmiş görevlerin adı oturum özetinden gelir
+        result = []
+        for task_id, name, count, seconds in self.history.top_tasks(limit):
+            task = self.store.get(task_id)
+            result.append((task.text if task is not None else name or f"Görev #{task_id}", count, seconds))
+        return result
+
+    def batch(self):
+        # İçindeki görev değişiklikleri tek yazımla kaydedilir, arayüz bir kez yenilenir
+        return self.store.batch()
+
+    def add_task(self, text, desc="", done=False, completed_time=None):
+        task = self.store.add(text, desc, done, completed_time)
+        if self.hooks.has_hooks("task_added"):
+            self.hooks.emit("task_added", task=task.to_dict())
+        return task
+
+    def complete_task(self, task_id):
+        task = self.store.get(task_id)
+        was_done = task is not None and task.done
+        with tracer.span("task.reorder"):
+            task = self.store.set_done(task_id, True, self.wall())
+        if not was_done and self.hooks.has_hooks("task_completed"):
+            self.hooks.emit("task_completed", task=task.to_dict())
+        self._drop_done_active()
+        return task
+
+    def reopen_task(self, task_id):
+        with tracer.span("task.reorder"):
+            return self.store.set_done(task_id, False)
+
+    def complete_all(self):
+        with tracer.span("task.complete_all", tasks=len(self.store)):
+            changed = self.store.complete_all(self.wall())
+        # Görev başına bir olay; kancanın kuyruğuna sığmayanlar düşer ve sayılır
+        if self.hooks.has_hooks("task_completed"):
+            for task in changed:
+                self.hooks.emit("task_completed", task=task.to_dict())
+        self._drop_done_active()
+
+    def _drop_done_active(self):
+        # Tamamlanan görev etkin görev olarak kalmaz; arayüz, CLI ve denetim soketi için aynı
+        task = self.store.get(self.active_task_id) if self.active_task_id is not None else None
+        if task is None or not task.done:
+            return
+        self.active_task = None
+        self.active_task_id = None
+        if self.on_active_task_cleared is not None:
+            self.on_active_task_cleared()
+
+    def remove_done(self):
+        with tracer.span("task.remove_done", tasks=len(self.store)):
+            self.store.remove_done()
+
+    def clear_tasks(self):
+        self.store.clear()
+
+    def undo(self):
+        return self.loaded and self.undo_log.undo()
+
+    def redo(self):
+        return self.loaded and self.undo_log.redo()
+
+    def close(self):
+        # Önce kayıtlar yazılır; kancalar kapanışı ancak kısa bir süre bekletebilir
+        self.save_state()
+        self.history.save()
+        self.storage.close()
+        if self.loaded:
+            self._remember_list()
+            self.lists.save()
+        dropped = self.hooks.close(self.config.get("hook_shutdown_s", 0.5))
+        if dropped:
+            log.warning("Kapanışta %d kanca olayı çalıştırılmadı", dropped)
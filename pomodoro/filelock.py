@@ -0,0 +1,42 @@
+import os
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+
+def _acquire(fd):
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        return
+    while True:
+        try:
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            # LK_LOCK on saniye dener ve vazgeçer; kilit bırakılana kadar beklenir
+            continue
+
+
+def _release(fd):
+    if fcntl is None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def locked(path):
+    # Aynı veri dosyalarını kullanan süreçler (ve iş parçacıkları) arasında danışma kilidi.
+    # Veri dosyaları atomik olarak değiştirildiği için kilit ayrı bir dosyada tutulur.
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        _acquire(fd)
+        try:
+            yield
+        finally:
+            _release(fd)
+    finally:
+        os.close(fd)
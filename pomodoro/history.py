@@ -0,0 +1,193 @@
+import json
+import os
+import struct
+from datetime import date
+
+from .timer import WORK, SHORT_BREAK, LONG_BREAK
+
+SESSIONS_FILE = "pomodoro_sessions.bin"
+
+MODES = (WORK, SHORT_BREAK, LONG_BREAK)
+# başlangıç (unix sn), süre (sn), yerel gün sırası, mod, görev kimliği (-1: yok)
+RECORD = struct.Struct("<dfIBi")
+
+
+def history_path(tasks_file):
+    return os.path.join(os.path.dirname(tasks_file), SESSIONS_FILE)
+
+
+def week_of(day):
+    # Pazartesi başlayan hafta; date.fromordinal(1) bir pazartesidir
+    return (day - 1) // 7
+
+
+def _accumulate(daily, weekly, tasks, duration, day, mode, task_id):
+    # Gün ve hafta başına [pomodoro, çalışma sn, mola sn]; görev başına [pomodoro, çalışma sn]
+    work = mode == 0
+    for table, key in ((daily, day), (weekly, week_of(day))):
+        row = table.setdefault(key, [0, 0.0, 0.0])
+        if work:
+            row[0] += 1
+            row[1] += duration
+        else:
+            row[2] += duration
+    if work and task_id >= 0:
+        row = tasks.setdefault(task_id, [0, 0.0])
+        row[0] += 1
+        row[1] += duration
+
+
+def _rollups_python(data):
+    daily, weekly, tasks = {}, {}, {}
+    for _, duration, day, mode, task_id in RECORD.iter_unpack(data):
+        _accumulate(daily, weekly, tasks, duration, day, mode, task_id)
+    return daily, weekly, tasks
+
+
+def _group(numpy, keys, work, duration):
+    # Anahtar başına [pomodoro, çalışma sn, mola sn]
+    unique, inverse = numpy.unique(keys, return_inverse=True)
+    counts = numpy.bincount(inverse, weights=work, minlength=len(unique))
+    work_s = numpy.bincount(inverse, weights=duration * work, minlength=len(unique))
+    break_s = numpy.bincount(inverse, weights=duration * (1 - work), minlength=len(unique))
+    return unique, counts, work_s, break_s
+
+
+def _rollups_numpy(numpy, data):
+    dtype = numpy.dtype([("started", "<f8"), ("duration", "<f4"), ("day", "<u4"),
+                         ("mode", "u1"), ("task", "<i4")])
+    log = numpy.frombuffer(data, dtype=dtype)
+    work = (log["mode"] == 0).astype(numpy.float64)
+    duration = log["duration"].astype(numpy.float64)
+    days = log["day"].astype(numpy.int64)
+    daily, weekly, tasks = {}, {}, {}
+    for table, keys in ((daily, days), (weekly, (days - 1) // 7)):
+        for key, count, work_s, break_s in zip(*_group(numpy, keys, work, duration)):
+            table[int(key)] = [int(count), float(work_s), float(break_s)]
+    has_task = (log["task"] >= 0) & (work > 0)
+    if has_task.any():
+        for key, count, work_s, _ in zip(*_group(numpy, log["task"][has_task],
+                                                 work[has_task], duration[has_task])):
+            tasks[int(key)] = [int(count), float(work_s)]
+    return daily, weekly, tasks
+
+
+def compute_rollups(data):
+    # Ham günlükten toplu yeniden hesaplama; numpy varsa vektörel yapılır
+    try:
+        import numpy
+    except ImportError:
+        return _rollups_python(data)
+    return _rollups_numpy(numpy, data)
+
+
+class SessionHistory:
+    # Yalnızca sona eklenen, kayıt başına 21 baytlık oturum günlüğü ve artımlı özetleri.
+    # Özetler ayrı bir dosyada tutulur; istatistik görünümü ham günlüğü taramaz.
+    def __init__(self, path=SESSIONS_FILE):
+        self.path = path
+        self.rollup_path = path + ".rollup.json"
+        self.loaded = False
+        self.count = 0
+        self.daily = {}
+        self.weekly = {}
+        self.tasks = {}
+        self.names = {}
+        self._dirty = False
+
+    def load(self):
+        if self.loaded:
+            return
+        size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        count = size // RECORD.size
+        cache = self._read_cache()
+        if cache is not None and cache["count"] <= count:
+            self.count = cache["count"]
+            self.daily = {int(k): v for k, v in cache["daily"].items()}
+            self.weekly = {int(k): v for k, v in cache["weekly"].items()}
+            self.tasks = {int(k): v for k, v in cache["tasks"].items()}
+            self.names = {int(k): v for k, v in cache["names"].items()}
+            # Özet dosyası geride kaldıysa yalnızca eksik kuyruk işlenir
+            if self.count < count:
+                with open(self.path, "rb") as f:
+                    f.seek(self.count * RECORD.size)
+                    tail = f.read((count - self.count) * RECORD.size)
+                for record in RECORD.iter_unpack(tail):
+                    self._apply(*record)
+                self.count = count
+                self._dirty = True
+        else:
+            self.rebuild()
+        self.loaded = True
+
+    def rebuild(self):
+        data = b""
+        if os.path.exists(self.path):
+            with open(self.path, "rb") as f:
+                data = f.read()
+        data = data[:len(data) - len(data) % RECORD.size]
+        self.daily, self.weekly, self.tasks = compute_rollups(data)
+        self.count = len(data) // RECORD.size
+        self._dirty = True
+
+    def _read_cache(self):
+        if not os.path.exists(self.rollup_path):
+            return None
+        with open(self.rollup_path, "r", encoding="utf-8") as f:
+            try:
+                cache = json.load(f)
+            except ValueError:
+                return None
+        return cache if isinstance(cache, dict) and "count" in cache else None
+
+    def _apply(self, started, duration, day, mode, task_id):
+        _accumulate(self.daily, self.weekly, self.tasks, duration, day, mode, task_id)
+
+    def append(self, started, ended, mode, task_id=None, task_text=None):
+        self.load()
+        day = date.fromtimestamp(started).toordinal()
+        record = (started, max(0.0, ended - started), day, MODES.index(mode),
+                  -1 if task_id is None else task_id)
+        with open(self.path, "ab") as f:
+            # Yarım kalmış son kayıt varsa atılır
+            extra = f.tell() % RECORD.size
+            if extra:
+                f.truncate(f.tell() - extra)
+                f.seek(0, os.SEEK_END)
+            f.write(RECORD.pack(*record))
+        self._apply(*record)
+        if task_id is not None and task_text:
+            self.names[task_id] = task_text
+        self.count += 1
+        self._dirty = True
+
+    def save(self):
+        if not self._dirty:
+            return
+        data = {"count": self.count, "daily": self.daily, "weekly": self.weekly,
+                "tasks": self.tasks, "names": self.names}
+        tmp = self.rollup_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, self.rollup_path)
+        self._dirty = False
+
+    def day_totals(self, day):
+        self.load()
+        return self.daily.get(day, [0, 0.0, 0.0])
+
+    def week_totals(self, day):
+        self.load()
+        return self.weekly.get(week_of(day), [0, 0.0, 0.0])
+
+    def weeks(self, last_day, count=53):
+        # Son count haftanın [pomodoro, çalışma sn, mola sn] değerleri, eskiden yeniye
+        self.load()
+        last = week_of(last_day)
+        return [self.weekly.get(week, [0, 0.0, 0.0]) for week in range(last - count + 1, last + 1)]
+
+    def top_tasks(self, limit=5):
+        self.load()
+        ranked = sorted(self.tasks.items(), key=lambda item: item[1][1], reverse=True)
+        return [(task_id, self.names.get(task_id), count, seconds)
+                for task_id, (count, seconds) in ranked[:limit]]
@@ -0,0 +1,236 @@
+import importlib.util
+import logging
+import os
+import threading
+import time
+from collections import deque
+
+from .trace import tracer
+
+log = logging.getLogger(__name__)
+
+# Olay yükü bir sözlüktür: {"event": ad, "time": duvar saati, ...alanlar}
+#   work_started, break_started   mode, duration, remaining, resumed, task_id, task
+#   work_completed                started, ended, pomodoro_count, task_id, task
+#   task_added, task_completed    task (Task.to_dict())
+EVENTS = ("work_started", "work_completed", "break_started", "task_completed", "task_added")
+PLUGIN_PREFIX = "pomodoro_plugin_"
+
+
+class Hook:
+    __slots__ = ("name", "events", "callback", "timeout", "queue_size", "queue", "busy",
+                 "delivered", "errors", "timeouts", "dropped", "last_error")
+
+    def __init__(self, name, events, callback, timeout, queue_size):
+        self.name = name
+        self.events = events
+        self.callback = callback
+        self.timeout = timeout
+        self.queue_size = queue_size
+        self.queue = deque()
+        # Sırada ya da çalışıyor; bir kancanın çağrıları hiçbir zaman üst üste binmez
+        self.busy = False
+        self.delivered = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.dropped = 0
+        self.last_error = None
+
+
+class EventBus:
+    # Olaylar çağıranın iş parçacığında yalnızca kancaların sınırlı kuyruklarına eklenir;
+    # kancalar arka plandaki iş parçacıklarında çalışır. Kuyruğu dolu kancanın yeni olayı
+    # düşer ve sayılır. Süresini aşan çağrının iş parçacığı bırakılır (Python'da iş parçacığı
+    # durdurulamaz), yerine yenisi açılır; o kanca çağrı dönene kadar yeni olay almaz.
+    def __init__(self, workers=2, queue_size=64, timeout=5.0, wall=time.time):
+        self.workers = max(1, workers)
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self.wall = wall
+        # Olay başına değişmez demet; emit kilit almadan kanca olup olmadığına bakar
+        self._hooks = {event: () for event in EVENTS}
+        self._lock = threading.Lock()
+        self._ready = threading.Condition(self._lock)
+        self._watch = threading.Condition(self._lock)
+        self._queue = deque()
+        self._running = {}
+        self._threads = 0
+        self._serial = 0
+        self._watchdog = None
+        self._closed = False
+
+    def subscribe(self, events, callback, name=None, timeout=None):
+        # Birden çok olaya abone olan kanca onları geldikleri sırayla alır
+        events = (events,) if isinstance(events, str) else tuple(events)
+        unknown = [event for event in events if event not in EVENTS]
+        if unknown or not events:
+            raise ValueError(f"bilinmeyen olay: {', '.join(unknown)} (olaylar: {', '.join(EVENTS)})")
+        hook = Hook(name or getattr(callback, "__name__", repr(callback)), events, callback,
+                    self.timeout if timeout is None else timeout, self.queue_size)
+        with self._lock:
+            for event in events:
+                self._hooks[event] += (hook,)
+            # İş parçacıkları ilk abonelikte açılır; eklentisiz kullanımda hiç açılmaz
+            if self._watchdog is None:
+                self._watchdog = threading.Thread(target=self._watch_calls, name="pomodoro-hooks-watch",
+                                                  daemon=True)
+                self._watchdog.start()
+            while self._threads < self.workers:
+                self._spawn()
+        return hook
+
+    def unsubscribe(self, hook):
+        with self._lock:
+            for event in hook.events:
+                self._hooks[event] = tuple(h for h in self._hooks[event] if h is not hook)
+            hook.queue.clear()
+
+    def has_hooks(self, event):
+        return bool(self._hooks[event])
+
+    def emit(self, event, **data):
+        # Sıraya alınan kanca sayısını döner; hiç beklemez
+        hooks = self._hooks[event]
+        if not hooks:
+            return 0
+        payload = {"event": event, "time": self.wall(), **data}
+        queued = dropped = 0
+        with self._lock:
+            if self._closed:
+                return 0
+            for hook in hooks:
+                if len(hook.queue) >= hook.queue_size:
+                    hook.dropped += 1
+                    dropped += 1
+                    continue
+                hook.queue.append(payload)
+                queued += 1
+                if not hook.busy:
+                    hook.busy = True
+                    self._queue.append(hook)
+                    self._ready.notify()
+        if dropped:
+            tracer.count("hooks.dropped", dropped)
+        return queued
+
+    def stats(self):
+        with self._lock:
+            hooks = {id(hook): hook for hooks in self._hooks.values() for hook in hooks}
+            return [{"name": hook.name, "events": list(hook.events), "delivered": hook.delivered,
+                     "errors": hook.errors, "timeouts": hook.timeouts, "dropped": hook.dropped,
+                     "queued": len(hook.queue), "last_error": hook.last_error}
+                    for hook in hooks.values()]
+
+    def close(self, timeout=1.0):
+        # Sıradaki olaylar en fazla timeout saniye beklenir; kalanlar düşer, sayıları döner
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            while self._queue or self._running:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._watch.wait(remaining)
+            self._closed = True
+            dropped = 0
+            for hook in {id(hook): hook for hooks in self._hooks.values() for hook in hooks}.values():
+                hook.dropped += len(hook.queue)
+                dropped += len(hook.queue)
+                hook.queue.clear()
+            self._queue.clear()
+            self._ready.notify_all()
+            self._watch.notify_all()
+        if dropped:
+            tracer.count("hooks.dropped", dropped)
+        return dropped
+
+    def _spawn(self):
+        self._threads += 1
+        self._serial += 1
+        threading.Thread(target=self._work, name=f"pomodoro-hook-{self._serial}", daemon=True).start()
+
+    def _release(self, hook):
+        # Kuyruğunda olay kalan kanca sıranın sonuna döner; kancalar arasında sırayla çalışılır
+        if hook.queue and not self._closed:
+            self._queue.append(hook)
+            self._ready.notify()
+        else:
+            hook.busy = False
+
+    def _work(self):
+        me = threading.current_thread()
+        while True:
+            with self._lock:
+                while not self._queue and not self._closed:
+                    self._ready.wait()
+                if self._closed:
+                    self._threads -= 1
+                    return
+                hook = self._queue.popleft()
+                payload = hook.queue.popleft()
+                self._running[me] = (hook, time.monotonic() + hook.timeout)
+                self._watch.notify_all()
+            error = None
+            try:
+                with tracer.span("hooks.run", hook=hook.name):
+                    # Her kanca yükün kendi kopyasını alır
+                    hook.callback(dict(payload))
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+            with self._lock:
+                abandoned = self._running.pop(me, None) is None
+                if error is not None:
+                    hook.errors += 1
+                    if hook.last_error is None:
+                        log.warning("Kanca hatası (%s): %s", hook.name, error)
+                    hook.last_error = error
+                elif not abandoned:
+                    hook.delivered += 1
+                self._release(hook)
+                self._watch.notify_all()
+                if abandoned:
+                    # Yerine açılan iş parçacığı çalışmayı sürdürüyor
+                    return
+            if error is not None:
+                tracer.count("hooks.errors")
+
+    def _watch_calls(self):
+        with self._lock:
+            while not self._closed:
+                now = time.monotonic()
+                expired = [(thread, hook) for thread, (hook, deadline) in self._running.items()
+                           if deadline <= now]
+                for thread, hook in expired:
+                    del self._running[thread]
+                    hook.timeouts += 1
+                    hook.last_error = f"{hook.timeout:g} sn içinde dönmedi"
+                    self._threads -= 1
+                    self._spawn()
+                if expired:
+                    tracer.count("hooks.timeouts", len(expired))
+                deadlines = [deadline for _, deadline in self._running.values()]
+                self._watch.wait(min(deadlines) - now if deadlines else None)
+
+
+def load_plugins(bus, path):
+    # Klasördeki her .py dosyası register(bus) tanımlayan bir eklentidir; "_" ile başlayanlar
+    # atlanır. (yüklenen adlar, [(dosya, hata)]) döner; bozuk eklenti diğerlerini etkilemez.
+    loaded = []
+    errors = []
+    if not path or not os.path.isdir(path):
+        return loaded, errors
+    for filename in sorted(os.listdir(path)):
+        if not filename.endswith(".py") or filename.startswith("_"):
+            continue
+        name = filename[:-3]
+        try:
+            with tracer.span("hooks.load", plugin=name):
+                spec = importlib.util.spec_from_file_location(PLUGIN_PREFIX + name,
+                                                              os.path.join(path, filename))
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+                module.register(bus)
+        except Exception as e:
+            errors.append((filename, f"{type(e).__name__}: {e}"))
+            continue
+        loaded.append(name)
+    return loaded, errors
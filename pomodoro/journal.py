@@ -0,0 +1,570 @@
+import json
+import logging
+import os
+import threading
+
+from .filelock import locked
+from .scheduler import SaveScheduler
+from .store import TaskStore
+from .trace import tracer
+
+log = logging.getLogger(__name__)
+
+COMPACT_EVERY = 500
+SAVE_WINDOW = 0.3
+CHUNK_SIZE = 1 << 16
+NUMBER_CHARS = "0123456789+-.eE"
+
+_decoder = json.JSONDecoder()
+
+
+def _dumps(record):
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+
+
+def _write_all(f, data):
+    # Tamponsuz dosyada write kısmi yazabilir
+    view = memoryview(data)
+    while view:
+        view = view[f.write(view):]
+
+
+def _signature(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_ino, st.st_size, st.st_mtime_ns
+
+
+def _write_snapshot_data(f, data):
+    # Görevler tek tek ve en sona yazılır; dosya bellekte tek bir dizge olarak kurulmaz
+    head = _dumps({k: v for k, v in data.items() if k != "tasks"})
+    f.write(head[:-1] + ("," if len(head) > 2 else "") + '"tasks":[')
+    for i, task in enumerate(data.get("tasks", ())):
+        if i:
+            f.write(",")
+        f.write(_dumps(task))
+    f.write("]}")
+
+
+def write_snapshot(path, data):
+    # Geçici dosyaya yaz, diske zorla, sonra atomik olarak yer değiştir
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        _write_snapshot_data(f, data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class _StreamReader:
+    def __init__(self, f, chunk_size):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self):
+        chunk = self.f.read(self.chunk_size)
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        self.eof = not chunk
+        return not self.eof
+
+    def peek(self):
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError("beklenen karakter: " + char)
+        self.pos += 1
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+            except ValueError:
+                if self._fill():
+                    continue
+                raise
+            # Parça sonuna kadar uzanan bir sayı bir sonraki parçada devam ediyor olabilir:
+            # "1" | "5", "1." | "5" ya da "1e" | "3" bölünmelerinde arta kalan yalnızca sayı karakteridir
+            if not self.eof and isinstance(value, (int, float)) and \
+                    not self.buf[end:].strip(NUMBER_CHARS) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_snapshot(path, chunk_size=CHUNK_SIZE):
+    # Üst düzey alanları (anahtar, değer) olarak verir; "tasks" öğeleri tek tek (None, görev) gelir
+    if not os.path.exists(path):
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        reader = _StreamReader(f, chunk_size)
+        reader.expect("{")
+        if reader.peek() == "}":
+            return
+        while True:
+            key = reader.value()
+            reader.expect(":")
+            if key == "tasks" and reader.peek() == "[":
+                reader.expect("[")
+                if reader.peek() != "]":
+                    while True:
+                        yield None, reader.value()
+                        if reader.peek() != ",":
+                            break
+                        reader.expect(",")
+                reader.expect("]")
+            else:
+                yield key, reader.value()
+            if reader.peek() != ",":
+                break
+            reader.expect(",")
+        reader.expect("}")
+
+
+def read_snapshot_header(path):
+    # Görev dizisinden önceki alanlar; görevler en sonda yazıldığı için dosyanın tamamı okunmaz
+    header = {}
+    try:
+        for key, value in iter_snapshot(path):
+            if key is None:
+                break
+            header[key] = value
+    except ValueError:
+        return {}
+    return header
+
+
+def read_journal(path, limit=None):
+    # (başlık, [(bitiş_ofseti, kayıt)]) döner; yarım kalmış son satır yok sayılır
+    if not os.path.exists(path):
+        return None, []
+    with open(path, "rb") as f:
+        raw = f.read() if limit is None else f.read(limit)
+    header = None
+    records = []
+    offset = 0
+    for line in raw.splitlines(keepends=True):
+        offset += len(line)
+        if not line.endswith(b"\n"):
+            break
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if header is None and "generation" in record and "op" not in record:
+            header = record
+        else:
+            records.append((offset, record))
+    return header, records
+
+
+def task_item(task):
+    # Sıra numarası da yazılır; geri alınan silme ya da işaret yeniden açılışta yerinde kalır
+    return {**task.to_dict(), "seq": task.seq}
+
+
+def record_for_event(event, payload):
+    # Depo olaylarını kalıcı kayıtlara çevirir; hem günlük hem SQLite bunu kullanır
+    if event == "added":
+        task = payload[0]
+        return {"op": "add", **task_item(task)}
+    if event == "changed":
+        task = payload[0]
+        return {"op": "edit", "id": task.id, "text": task.text, "desc": task.desc}
+    if event == "moved":
+        task = payload[0]
+        return {"op": "done", "id": task.id, "done": task.done,
+                "completed_time": task.completed_time, "seq": task.seq}
+    if event == "added_many":
+        return {"op": "add_many", "tasks": [task_item(task) for task in payload]}
+    if event == "removed":
+        return {"op": "del", "id": payload[0].id}
+    if event == "removed_many":
+        return {"op": "del", "ids": [task.id for task in payload]}
+    if event == "rows_removed":
+        return {"op": "del", "ids": [task.id for task in payload[2]]}
+    if event == "reordered":
+        return {"op": "done_many",
+                "items": [[task.id, task.completed_time, task.done, task.seq] for task in payload]}
+    if event == "reset" and payload == "clear":
+        return {"op": "clear"}
+    return None
+
+
+def coalesce(records):
+    # Aynı yazımdaki durum kayıtları sonuncusunun yerinde tek kayda indirgenir
+    state_positions = [i for i, r in enumerate(records) if r.get("op") == "state"]
+    if len(state_positions) < 2:
+        return records
+    values = {}
+    for i in state_positions:
+        values.update(records[i]["values"])
+    last = state_positions[-1]
+    merged = [r for i, r in enumerate(records) if i == last or r.get("op") != "state"]
+    merged[merged.index(records[last])] = {"op": "state", "values": values}
+    return merged
+
+
+def apply_record(store, state, record):
+    op = record.get("op")
+    if op in ("add", "add_many"):
+        for item in record.get("tasks") or [record]:
+            existing = store.get(item["id"])
+            # İki örnek aynı kimliği aynı anda verdiyse ikinci görev yeni bir kimlikle eklenir
+            if existing is None or existing.text != item["text"]:
+                store.add(item["text"], item.get("desc", ""), item.get("done", False),
+                          item.get("completed_time"), task_id=item["id"], seq=item.get("seq"))
+    elif op == "edit":
+        if record["id"] in store:
+            store.update(record["id"], text=record.get("text"), desc=record.get("desc"))
+    elif op == "done":
+        if record["id"] in store:
+            store.set_done(record["id"], record["done"], record.get("completed_time"),
+                           seq=record.get("seq"))
+    elif op == "done_many":
+        # Eski kayıtlarda yalnızca [id, completed_time] vardır
+        for item in record["items"]:
+            if item[0] in store:
+                store.set_done(item[0], item[2] if len(item) > 2 else True, item[1],
+                               seq=item[3] if len(item) > 3 else None)
+    elif op == "del":
+        for task_id in record.get("ids") or [record["id"]]:
+            if task_id in store:
+                store.remove(task_id)
+    elif op == "clear":
+        store.clear()
+    elif op == "state":
+        state.update(record["values"])
+
+
+def _load_snapshot(store, path):
+    # Görevler ayrıştırılırken doğrudan depoya akar; ara liste tutulmaz
+    snapshot = {}
+
+    def tasks():
+        for key, value in iter_snapshot(path):
+            if key is None:
+                yield value
+            else:
+                snapshot[key] = value
+
+    try:
+        store.load(tasks())
+    except ValueError:
+        store.load([])
+        return {}
+    return snapshot
+
+
+def replay(path, journal_path, limit=None):
+    store = TaskStore()
+    snapshot = _load_snapshot(store, path)
+    generation = snapshot.get("generation", 0)
+    state = {k: v for k, v in snapshot.items()
+             if k not in ("tasks", "generation", "journal_offset")}
+    header, records = read_journal(journal_path, limit)
+    journal_generation = header["generation"] if header else generation
+    if journal_generation == generation - 1:
+        # Sıkıştırma yarıda kaldı: anlık görüntünün kapsamadığı kuyruk uygulanır
+        covered = snapshot.get("journal_offset", 0)
+        records = [(end, r) for end, r in records if end > covered]
+    elif journal_generation != generation:
+        records = []
+    for _, record in records:
+        apply_record(store, state, record)
+    return state, store, generation, len(records)
+
+
+class RecordStorage:
+    # Günlük ve SQLite kaydının ortak kısmı: depo olayları kayıtlara çevrilir ve zamanlayıcıyla
+    # toplu yazılır. Alt sınıf _write_batch'i tanımlar, yüklerken _start_scheduler'ı çağırır.
+    def __init__(self, save_window=SAVE_WINDOW):
+        self.save_window = save_window
+        self.scheduler = None
+        # Yazım hatası ve düzelmesi bildirilir (kayıt iş parçacığında): on_error(hata | None)
+        self.on_error = None
+        self._held = None
+
+    def _start_scheduler(self):
+        if self.scheduler is None:
+            self.scheduler = SaveScheduler(self._write_batch, self.save_window, self._report)
+
+    def _write_batch(self, records):
+        raise NotImplementedError
+
+    def attach(self, store):
+        store.subscribe(self._on_store_event)
+
+    def detach(self, store):
+        store.unsubscribe(self._on_store_event)
+
+    def _report(self, error):
+        if self.on_error is not None:
+            self.on_error(error)
+
+    def append(self, record):
+        # Kayıt arayüz iş parçacığında oluşturulur ve bir daha değişmez; yazım işçide yapılır
+        self.scheduler.submit(record)
+
+    def record_state(self, **values):
+        self.append({"op": "state", "values": values})
+
+    def stats(self):
+        return self.scheduler.stats() if self.scheduler else {}
+
+    def flush(self, timeout=None):
+        return self.scheduler.flush(timeout) if self.scheduler else True
+
+    def _close_scheduler(self):
+        if self.scheduler is not None:
+            self.scheduler.close()
+
+    def _on_store_event(self, event, payload):
+        # Toplu değişikliğin kayıtları tek yazıma (SQLite'ta tek işleme) girer
+        if event == "batching":
+            self._held = []
+        elif event == "batched":
+            held, self._held = self._held, None
+            if held:
+                self.scheduler.submit_many(held)
+        else:
+            record = record_for_event(event, payload)
+            if record is None:
+                return
+            if self._held is not None:
+                self._held.append(record)
+            else:
+                self.append(record)
+
+
+class Journal(RecordStorage):
+    def __init__(self, path, compact_every=COMPACT_EVERY, save_window=SAVE_WINDOW):
+        super().__init__(save_window)
+        self.path = path
+        self.journal_path = path + ".journal"
+        self.lock_path = path + ".lock"
+        self.compact_every = compact_every
+        self.generation = 0
+        self._lock = threading.Lock()
+        self._compact_lock = threading.Lock()
+        self._file = None
+        self._since_compact = 0
+        self._snapshot_tasks = 0
+        # Bellekteki depo günlüğün _consumed ofsetine kadarını yansıtır; ötesindeki kendi
+        # yazımlarımız _own aralıklarındadır, geri kalanı başka bir örneğe aittir
+        self._consumed = 0
+        self._own = []
+        self._snapshot_sig = None
+        self._journal_ino = None
+        self._stale = False
+
+    def watch_paths(self):
+        return [self.path, self.journal_path]
+
+    def load(self):
+        with locked(self.lock_path):
+            result = self._load()
+            self._synced()
+        return result
+
+    def _load(self):
+        state, store, generation, replayed = replay(self.path, self.journal_path)
+        self.generation = generation
+        tasks = [task_item(task) for task in store]
+        if os.path.exists(self.path) and "generation" not in read_snapshot_header(self.path):
+            # Eski biçimdeki dosya: kimlikler kalıcı olsun diye hemen sıkıştırılır
+            self._write_compacted(state, tasks, generation + 1, 0)
+            self._reset_journal(generation + 1, b"")
+        else:
+            header, _ = read_journal(self.journal_path)
+            if header is None or header["generation"] != generation:
+                if replayed:
+                    self._write_compacted(state, tasks, generation + 1, 0)
+                    generation += 1
+                self._reset_journal(generation, b"")
+            self._since_compact = replayed
+        self._snapshot_tasks = len(tasks)
+        self._open()
+        return state, tasks
+
+    def _synced(self):
+        # Disk ve bellek aynı noktada; başkasının yazımları bundan sonra fark edilir
+        self._consumed = os.path.getsize(self.journal_path)
+        self._own = []
+        self._snapshot_sig = _signature(self.path)
+        self._journal_ino = os.stat(self.journal_path).st_ino
+        self._stale = False
+
+    def _mark_own(self, start, end):
+        if start == self._consumed and not self._own:
+            self._consumed = end
+        else:
+            self._own.append((start, end))
+
+    def _reopen_if_replaced(self):
+        # Başka bir örnek sıkıştırdıysa eski dosyaya değil yenisine yazılır
+        try:
+            current = os.stat(self.journal_path).st_ino
+        except FileNotFoundError:
+            current = None
+        if current != os.fstat(self._file.fileno()).st_ino:
+            self._file.close()
+            self._file = open(self.journal_path, "ab", buffering=0)
+            self._stale = True
+
+    def changed(self):
+        # Yalnızca dosya bilgisine bakar, beklemez; kendi yazımlarımız değişiklik sayılmaz
+        journal = _signature(self.journal_path)
+        own = sum(e - s for s, e in list(self._own))
+        return (self._stale or journal is None or journal[0] != self._journal_ino
+                or journal[1] != self._consumed + own or _signature(self.path) != self._snapshot_sig)
+
+    def read_changes(self, full=False):
+        # Son eşitlemeden beri başka örneklerin yazdıkları. Yalnızca günlük büyüdüyse yeni
+        # kayıtlar ("records", [kayıt]); anlık görüntü değiştiyse ("full", durum, [görev]).
+        with locked(self.lock_path), self._lock:
+            journal = os.stat(self.journal_path) if os.path.exists(self.journal_path) else None
+            if (full or self._stale or journal is None or journal.st_ino != self._journal_ino
+                    or journal.st_size < self._consumed or _signature(self.path) != self._snapshot_sig):
+                state, store, _, _ = replay(self.path, self.journal_path)
+                self._synced()
+                return "full", state, [task_item(task) for task in store]
+            if journal.st_size == self._consumed:
+                return None
+            with open(self.journal_path, "rb") as f:
+                f.seek(self._consumed)
+                raw = f.read(journal.st_size - self._consumed)
+            records = []
+            offset = self._consumed
+            for line in raw.splitlines(keepends=True):
+                if not line.endswith(b"\n"):
+                    break
+                start, offset = offset, offset + len(line)
+                if any(s <= start < e for s, e in self._own):
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+            self._consumed = offset
+            self._own = [(s, e) for s, e in self._own if e > offset]
+            return "records", records
+
+    def _open(self):
+        self._file = open(self.journal_path, "ab", buffering=0)
+        self._start_scheduler()
+
+    def _reset_journal(self, generation, tail):
+        tmp = self.journal_path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write((_dumps({"generation": generation}) + "\n").encode("utf-8"))
+            f.write(tail)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.journal_path)
+        self.generation = generation
+
+    def _write_compacted(self, state, tasks, generation, journal_offset):
+        data = dict(state)
+        data["generation"] = generation
+        data["journal_offset"] = journal_offset
+        data["tasks"] = tasks
+        write_snapshot(self.path, data)
+
+    def compact(self):
+        self.flush()
+        self._compact()
+
+    def _write_batch(self, records):
+        records = coalesce(records)
+        data = b"".join((_dumps(r) + "\n").encode("utf-8") for r in records)
+        with tracer.span("save.journal", records=len(records)), locked(self.lock_path), self._lock:
+            self._reopen_if_replaced()
+            start = os.fstat(self._file.fileno()).st_size
+            try:
+                _write_all(self._file, data)
+                os.fsync(self._file.fileno())
+            except OSError:
+                # Yarım kalan satır kesilir; kayıtlar zamanlayıcıda yeniden denenir
+                try:
+                    os.ftruncate(self._file.fileno(), start)
+                except OSError:
+                    pass
+                raise
+            self._mark_own(start, start + len(data))
+            self._since_compact += len(records)
+            # Eşik anlık görüntü boyutuyla büyür: toplu eklemelerde sıkıştırma maliyeti
+            # kayıt başına sabit kalır, her parçada tüm liste yeniden yazılmaz
+            due = self._since_compact >= max(self.compact_every, self._snapshot_tasks)
+        tracer.count("saves")
+        if due:
+            # Kayıtlar yazıldı; sıkıştırma hatası yazımı tekrarlatmaz, sonraki yazımda denenir
+            try:
+                self._compact()
+            except OSError as e:
+                log.warning("Günlük sıkıştırılamadı: %s", e)
+        return len(records)
+
+    def _compact(self):
+        with tracer.span("save.compact"), locked(self.lock_path), self._compact_lock:
+            self._compact_locked()
+
+    def _compact_locked(self):
+        with self._lock:
+            self._reopen_if_replaced()
+            self._file.flush()
+            covered = os.path.getsize(self.journal_path)
+            self._since_compact = 0
+            # Henüz görülmemiş yabancı kayıtlar anlık görüntüye katılır; bellek sonra tam eşitlenir
+            unseen = covered - self._consumed - sum(e - s for s, e in self._own)
+        # Ağır iş kilit dışında: diskteki anlık görüntü + günlük yeniden oynatılır
+        state, store, generation, _ = replay(self.path, self.journal_path, covered)
+        tasks = [task_item(task) for task in store]
+        self._snapshot_tasks = len(tasks)
+        snapshot_tmp = self.path + ".tmp"
+        data = dict(state)
+        data["generation"] = generation + 1
+        data["journal_offset"] = covered
+        data["tasks"] = tasks
+        with open(snapshot_tmp, "w", encoding="utf-8") as f:
+            _write_snapshot_data(f, data)
+            f.flush()
+            os.fsync(f.fileno())
+        with self._lock:
+            self._file.close()
+            try:
+                with open(self.journal_path, "rb") as f:
+                    f.seek(covered)
+                    tail = f.read()
+                os.replace(snapshot_tmp, self.path)
+                self._reset_journal(generation + 1, tail)
+            finally:
+                # Yarıda kalan sıkıştırmada da günlüğe yazılmaya devam edilir; okuma bunu tamamlar
+                self._open()
+            stale = self._stale or unseen != 0
+            self._synced()
+            self._stale = stale
+
+    def close(self):
+        self._close_scheduler()
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def add_session(self, started, ended, mode, task_id=None, task_text=None):
+        # Oturum geçmişi yalnızca SQLite deposunda tutulur
+        pass
@@ -0,0 +1,120 @@
+import json
+import os
+import shutil
+
+LISTS_FILE = "pomodoro_lists.json"
+LISTS_DIR = "pomodoro_lists"
+DEFAULT_LIST = "Görevler"
+MAX_NAME_LENGTH = 30
+
+
+class TaskLists:
+    # Adlandırılmış görev listeleri. Her liste kendi klasöründe ayrı bir kayıt (anlık görüntü +
+    # günlük ya da SQLite veritabanı) ve arşivdir; yalnızca etkin liste belleğe yüklenir.
+    # Öntanımlı liste eski dosyalarda kalır. Diğer listelerin görev sayıları bırakılırken
+    # burada saklanır, liste değiştiricisi bunun için kayıtları açmaz.
+    def __init__(self, tasks_file):
+        self.tasks_file = tasks_file
+        self.base = os.path.dirname(tasks_file)
+        self.path = os.path.join(self.base, LISTS_FILE)
+        self.active = DEFAULT_LIST
+        # Kimlikler listeler arasında tekrar verilmez; oturum geçmişi görevleri kimlikle tutar
+        self.last_id = 0
+        self._entries = [{"name": DEFAULT_LIST, "dir": "", "total": None, "pending": None}]
+        self._read()
+
+    def _read(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        entries = [entry for entry in data.get("lists", [])
+                   if isinstance(entry, dict) and isinstance(entry.get("name"), str)]
+        if not any(entry.get("dir") == "" for entry in entries):
+            entries.insert(0, self._entries[0])
+        self._entries = entries
+        self.last_id = data.get("last_id", 0)
+        if data.get("active") in self.names():
+            self.active = data["active"]
+
+    def save(self):
+        # Tek listeyle çalışan kullanıcı için dosya oluşturulmaz
+        if len(self._entries) == 1 and not os.path.exists(self.path):
+            return
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"active": self.active, "last_id": self.last_id, "lists": self._entries},
+                      f, ensure_ascii=False, indent=1)
+        os.replace(tmp, self.path)
+
+    def names(self):
+        return [entry["name"] for entry in self._entries]
+
+    def entry(self, name):
+        for entry in self._entries:
+            if entry["name"] == name:
+                return entry
+        raise KeyError(name)
+
+    def default(self):
+        return next(entry["name"] for entry in self._entries if not entry["dir"])
+
+    def paths(self, name, config):
+        # (görev dosyası, SQLite yolu); öntanımlı liste ayar dosyasındaki yolları kullanır
+        folder = self.entry(name)["dir"]
+        if not folder:
+            return self.tasks_file, config["sqlite_path"]
+        folder = os.path.join(self.base, folder)
+        return (os.path.join(folder, os.path.basename(self.tasks_file)),
+                os.path.join(folder, os.path.basename(config["sqlite_path"])))
+
+    def _check_name(self, name):
+        name = name.strip() if isinstance(name, str) else ""
+        if not name or len(name) > MAX_NAME_LENGTH:
+            raise ValueError(f"Liste adı 1-{MAX_NAME_LENGTH} karakter olmalı.")
+        if name in self.names():
+            raise ValueError(f"Bu adda bir liste zaten var: {name}")
+        return name
+
+    def create(self, name):
+        name = self._check_name(name)
+        used = {entry["dir"] for entry in self._entries}
+        number = 1
+        while f"{LISTS_DIR}/{number}" in used or os.path.exists(
+                os.path.join(self.base, LISTS_DIR, str(number))):
+            number += 1
+        folder = f"{LISTS_DIR}/{number}"
+        os.makedirs(os.path.join(self.base, folder))
+        self._entries.append({"name": name, "dir": folder, "total": 0, "pending": 0})
+        self.save()
+        return name
+
+    def rename(self, name, new_name):
+        entry = self.entry(name)
+        new_name = self._check_name(new_name)
+        entry["name"] = new_name
+        if self.active == name:
+            self.active = new_name
+        self.save()
+        return new_name
+
+    def remove(self, name):
+        # Öntanımlı liste silinemez; etkin liste silinmeden önce bırakılmış olmalı
+        entry = self.entry(name)
+        if not entry["dir"]:
+            raise ValueError("Öntanımlı liste silinemez.")
+        if name == self.active:
+            raise ValueError("Etkin liste silinemez.")
+        self._entries.remove(entry)
+        self.save()
+        shutil.rmtree(os.path.join(self.base, entry["dir"]), ignore_errors=True)
+
+    def set_counts(self, name, total, pending):
+        entry = self.entry(name)
+        entry["total"] = total
+        entry["pending"] = pending
+
+    def counts(self, name):
+        entry = self.entry(name)
+        return entry["total"], entry["pending"]
@@ -0,0 +1,169 @@
+import threading
+import time
+from collections import deque
+
+from .trace import tracer
+
+# Yazım hatasından sonra yeniden deneme aralığı; her hatada ikiye katlanır
+RETRY_MIN = 0.1
+RETRY_MAX = 5.0
+
+
+class SaveScheduler:
+    # Kayıtları bir pencere boyunca biriktirir ve arka plandaki tek bir iş parçacığında yazar
+    # Yazılamayan kayıtlar sıranın başına döner ve artan aralıklarla yeniden denenir.
+    # on_error(hata) bir hata dizisinin başında, on_error(None) yazım yeniden başarılınca
+    # işçi iş parçacığında çağrılır.
+    def __init__(self, write_batch, window=0.3, on_error=None):
+        self._write_batch = write_batch
+        self.window = window
+        self.on_error = on_error
+        self._cond = threading.Condition()
+        self._queue = []
+        self._first_at = None
+        self._flush_requested = False
+        self._writing = False
+        self._stopped = False
+        self.saves = 0
+        self.records = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.lost = 0
+        self.last_error = None
+        self.failing = False
+        self._retry_delay = 0.0
+        self._retry_at = 0.0
+        self.last_latency = 0.0
+        self.max_latency = 0.0
+        self._latencies = deque(maxlen=256)
+        self._thread = threading.Thread(target=self._run, name="pomodoro-save", daemon=True)
+        self._thread.start()
+
+    def submit(self, record):
+        with self._cond:
+            if self._stopped:
+                raise RuntimeError("SaveScheduler kapatıldı")
+            if not self._queue:
+                self._first_at = time.monotonic()
+            self._queue.append((time.perf_counter(), record))
+            self._cond.notify_all()
+
+    def submit_many(self, records):
+        # Hepsi aynı yazıma girer
+        if not records:
+            return
+        with self._cond:
+            if self._stopped:
+                raise RuntimeError("SaveScheduler kapatıldı")
+            if not self._queue:
+                self._first_at = time.monotonic()
+            now = time.perf_counter()
+            self._queue.extend((now, record) for record in records)
+            self._cond.notify_all()
+
+    def flush(self, timeout=None):
+        # Yazım hata veriyorsa beklemeden False döner; kayıtlar sırada kalır
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify_all()
+            errors = self.errors
+            while self._queue or self._writing:
+                if self.failing or self.errors != errors:
+                    return False
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self):
+        with self._cond:
+            if self._stopped:
+                return
+        self.flush()
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._queue and not self._stopped:
+                    self._cond.wait()
+                if self._stopped and not self._queue:
+                    return
+                # Pencere dolana kadar (veya flush istenene kadar) gelenler aynı yazıma katılır
+                while not self._flush_requested and not self._stopped:
+                    remaining = self._first_at + self.window - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                # Hatadan sonra bekleme süresi kapanışta da kısaltılmaz; kapanış son bir kez dener
+                while self.failing and not self._stopped:
+                    remaining = self._retry_at - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                batch = self._queue
+                self._queue = []
+                self._flush_requested = False
+                self._writing = True
+            error = None
+            try:
+                written = self._write_batch([record for _, record in batch])
+            except Exception as e:
+                error = e
+            done = time.perf_counter()
+            with self._cond:
+                self._writing = False
+                started = not self.failing
+                if error is not None:
+                    self.errors += 1
+                    self.last_error = f"{type(error).__name__}: {error}"
+                    self.failing = True
+                    if self._stopped:
+                        # Kapanışta da yazılamadı; bekleyen kayıtlar bırakılır ve sayılır
+                        self.lost += len(batch)
+                        self._queue = []
+                    else:
+                        self._queue[:0] = batch
+                        self._retry_delay = min(RETRY_MAX, self._retry_delay * 2 or RETRY_MIN)
+                        self._retry_at = time.monotonic() + self._retry_delay
+                else:
+                    recovered = self.failing
+                    self.failing = False
+                    self._retry_delay = 0.0
+                    self.saves += 1
+                    self.records += len(batch)
+                    self.coalesced += len(batch) - (written if written is not None else len(batch))
+                    self.last_latency = done - batch[0][0]
+                    self.max_latency = max(self.max_latency, self.last_latency)
+                    self._latencies.append(self.last_latency)
+                self._cond.notify_all()
+            if error is not None:
+                tracer.count("save.errors")
+                if started and self.on_error is not None:
+                    self.on_error(error)
+            else:
+                tracer.sample("save.latency", (done - batch[0][0]) * 1000)
+                if recovered and self.on_error is not None:
+                    self.on_error(None)
+
+    def stats(self):
+        with self._cond:
+            latencies = sorted(self._latencies)
+            return {
+                "saves": self.saves,
+                "records": self.records,
+                "coalesced": self.coalesced,
+                "errors": self.errors,
+                "failing": self.failing,
+                "lost": self.lost,
+                "last_error": self.last_error,
+                "pending": len(self._queue),
+                "last_latency_ms": self.last_latency * 1000,
+                "max_latency_ms": self.max_latency * 1000,
+                "p50_latency_ms": latencies[len(latencies) // 2] * 1000 if latencies else 0.0,
+            }
@@ -0,0 +1,133 @@
+import re
+from bisect import bisect_left, insort
+
+_WORD = re.compile(r"\w+")
+
+# Önceki sonuç bu kadar küçükse yeni sorgu onun içinden süzülür
+NARROW_LIMIT = 2000
+
+
+def fold(text):
+    # Türkçe büyük/küçük harf: "I" -> "ı", "İ" -> "i"; gerisi olağan küçük harf
+    # (str.replace, str.translate'ten belirgin biçimde hızlı)
+    return text.replace("I", "ı").replace("İ", "i").lower()
+
+
+def tokenize(text):
+    return _WORD.findall(fold(text))
+
+
+class SearchIndex:
+    # Görev metni ve açıklaması üzerinde ters dizin; depo olaylarıyla artımlı güncellenir.
+    # İlk aramada kurulur; o zamana kadar olaylar yok sayılır.
+    def __init__(self, store):
+        self.store = store
+        self.built = False
+        self._postings = {}
+        self._task_tokens = {}
+        self._vocab = []
+        self._version = 0
+        self._last = None
+        store.subscribe(self._on_store_event)
+
+    def build(self):
+        self._postings = {}
+        self._task_tokens = {}
+        for task in self.store:
+            self._add(task, bulk=True)
+        self._vocab = sorted(self._postings)
+        self.built = True
+        self._changed()
+
+    def _changed(self):
+        self._version += 1
+        self._last = None
+
+    def _add(self, task, bulk=False):
+        tokens = frozenset(tokenize(task.text + "\n" + task.desc if task.desc else task.text))
+        self._task_tokens[task.id] = tokens
+        for token in tokens:
+            ids = self._postings.get(token)
+            if ids is None:
+                ids = self._postings[token] = set()
+                if not bulk:
+                    insort(self._vocab, token)
+            ids.add(task.id)
+
+    def _remove(self, task_id):
+        for token in self._task_tokens.pop(task_id, ()):
+            ids = self._postings[token]
+            ids.discard(task_id)
+            if not ids:
+                del self._postings[token]
+                del self._vocab[bisect_left(self._vocab, token)]
+
+    def _on_store_event(self, event, payload):
+        if not self.built:
+            return
+        if event == "added":
+            self._add(payload[0])
+        elif event == "added_many":
+            for task in payload:
+                self._add(task)
+        elif event == "changed":
+            self._remove(payload[0].id)
+            self._add(payload[0])
+        elif event == "removed":
+            self._remove(payload[0].id)
+        elif event == "rows_removed":
+            for task in payload[2]:
+                self._remove(task.id)
+        elif event == "removed_many":
+            for task in payload:
+                self._remove(task.id)
+        elif event == "reset":
+            # Toplu yüklemeden sonra dizin bir sonraki aramada yeniden kurulur
+            self.built = False
+            self._postings = {}
+            self._task_tokens = {}
+            self._vocab = []
+        else:
+            return
+        self._changed()
+
+    def _prefix_ids(self, prefix):
+        vocab = self._vocab
+        pos = bisect_left(vocab, prefix)
+        ids = set()
+        while pos < len(vocab) and vocab[pos].startswith(prefix):
+            ids |= self._postings[vocab[pos]]
+            pos += 1
+        return ids
+
+    def _matches(self, task_id, terms):
+        tokens = self._task_tokens[task_id]
+        return all(any(token.startswith(term) for token in tokens) for term in terms)
+
+    def search(self, query):
+        # Her sözcük bir önek olarak eşleşir; tüm sözcükleri içeren görev kimlikleri döner.
+        # Boş sorguda None: filtre yok.
+        terms = tokenize(query)
+        if not terms:
+            return None
+        if not self.built:
+            self.build()
+        last = self._last
+        if last is not None and last[0] == self._version and len(last[2]) <= NARROW_LIMIT \
+                and _narrows(last[1], terms):
+            # Yazmaya devam edildi: önceki küçük sonucun içinden süzülür
+            result = {task_id for task_id in last[2] if self._matches(task_id, terms)}
+        else:
+            result = None
+            for term in sorted(set(terms), key=len, reverse=True):
+                ids = self._prefix_ids(term)
+                result = ids if result is None else result & ids
+                if not result:
+                    break
+        self._last = (self._version, terms, result)
+        return result
+
+
+def _narrows(old_terms, new_terms):
+    # Yeni sorgu eskisinin her sözcüğünü aynen ya da uzatılmış olarak içeriyorsa
+    return all(any(new.startswith(old) for new in new_terms) for old in old_terms)
@@ -0,0 +1,217 @@
+import json
+import logging
+import os
+import sqlite3
+import sys
+import threading
+
+from .journal import SAVE_WINDOW, RecordStorage, coalesce, replay, task_item
+from .trace import tracer
+
+log = logging.getLogger(__name__)
+
+SQLITE_FILE = "pomodoro.db"
+# Bir örneğe tek seferde ayrılan görev kimliği sayısı
+ID_BLOCK = 64
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    text TEXT NOT NULL,
+    desc TEXT NOT NULL DEFAULT '',
+    done INTEGER NOT NULL DEFAULT 0,
+    completed_time REAL,
+    seq INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tasks_done_completed ON tasks (done, completed_time);
+CREATE INDEX IF NOT EXISTS tasks_seq ON tasks (seq);
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    started REAL NOT NULL,
+    ended REAL NOT NULL,
+    mode TEXT NOT NULL,
+    task_id INTEGER,
+    task_text TEXT
+);
+CREATE INDEX IF NOT EXISTS sessions_started ON sessions (started);
+CREATE INDEX IF NOT EXISTS sessions_task ON sessions (task_id);
+CREATE TABLE IF NOT EXISTS state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# Sabit SQL metinleri sqlite3'ün ifade önbelleğinde hazırlanmış olarak tutulur
+INSERT_TASK = ("INSERT OR REPLACE INTO tasks (id, text, desc, done, completed_time, seq) "
+               "VALUES (?, ?, ?, ?, ?, ?)")
+UPDATE_TEXT = "UPDATE tasks SET text = ?, desc = ? WHERE id = ?"
+UPDATE_DONE = "UPDATE tasks SET done = ?, completed_time = ?, seq = ? WHERE id = ?"
+DELETE_TASK = "DELETE FROM tasks WHERE id = ?"
+DELETE_ALL = "DELETE FROM tasks"
+UPSERT_STATE = "INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)"
+INSERT_SESSION = ("INSERT INTO sessions (started, ended, mode, task_id, task_text) "
+                  "VALUES (?, ?, ?, ?, ?)")
+SELECT_TASKS = "SELECT id, text, desc, done, completed_time, seq FROM tasks ORDER BY seq"
+SELECT_STATE = "SELECT key, value FROM state"
+NEXT_ID = "SELECT COALESCE(MAX(id), 0) + 1 FROM tasks"
+SELECT_ID_BLOCK = "SELECT value FROM state WHERE key = 'next_id'"
+
+
+def connect(path):
+    conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None,
+                           cached_statements=64)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def apply_records(conn, records):
+    # Bir yazım tek işlemde (transaction) uygulanır
+    conn.execute("BEGIN")
+    try:
+        for record in records:
+            op = record.get("op")
+            if op in ("add", "add_many"):
+                # Kimlikler veritabanından blok blok ayrıldığından örnekler arasında çakışmaz
+                for item in record.get("tasks") or [record]:
+                    conn.execute(INSERT_TASK, (item["id"], item["text"], item.get("desc", ""),
+                                               int(item.get("done", False)),
+                                               item.get("completed_time"), item["seq"]))
+            elif op == "edit":
+                conn.execute(UPDATE_TEXT, (record["text"], record["desc"], record["id"]))
+            elif op == "done":
+                conn.execute(UPDATE_DONE, (int(record["done"]), record.get("completed_time"),
+                                           record["seq"], record["id"]))
+            elif op == "done_many":
+                conn.executemany(UPDATE_DONE, [(int(done), completed_time, seq, task_id)
+                                               for task_id, completed_time, done, seq in record["items"]])
+            elif op == "del":
+                conn.executemany(DELETE_TASK, [(task_id,) for task_id in record.get("ids") or [record["id"]]])
+            elif op == "clear":
+                conn.execute(DELETE_ALL)
+            elif op == "state":
+                conn.executemany(UPSERT_STATE, [(key, json.dumps(value))
+                                                for key, value in record["values"].items()])
+            elif op == "session":
+                conn.execute(INSERT_SESSION, (record["started"], record["ended"], record["mode"],
+                                              record.get("task_id"), record.get("task_text")))
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def migrate_json(json_path, db_path):
+    # pomodoro_tasks.json (ve günlüğü) tek seferde SQLite veritabanına aktarılır
+    state, store, _, _ = replay(json_path, json_path + ".journal")
+    conn = connect(db_path)
+    try:
+        # Sıra numaraları korunur; geri alınan işaretler ve eşit anahtarlar aynı sırada kalır
+        records = [{"op": "add", **task_item(task)} for task in store]
+        if state:
+            records.append({"op": "state", "values": state})
+        apply_records(conn, records)
+    finally:
+        conn.close()
+    return len(store)
+
+
+class SqliteStorage(RecordStorage):
+    def __init__(self, path=SQLITE_FILE, save_window=SAVE_WINDOW, migrate_from=None):
+        super().__init__(save_window)
+        self.path = path
+        self.migrate_from = migrate_from
+        self._conn = None
+        self._lock = threading.Lock()
+        self._data_version = None
+
+    def watch_paths(self):
+        return [self.path, self.path + "-wal"]
+
+    def load(self):
+        # Henüz sıkıştırılmamış kayıtta yalnızca günlük dosyası vardır
+        source = self.migrate_from
+        if not os.path.exists(self.path) and source and (os.path.exists(source) or
+                                                         os.path.exists(source + ".journal")):
+            migrate_json(source, self.path)
+        self._conn = connect(self.path)
+        state, tasks = self._read()
+        self._start_scheduler()
+        return state, tasks
+
+    def _read(self):
+        # data_version yalnızca başka bağlantılar yazınca değişir
+        self._data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        state = {key: json.loads(value) for key, value in self._conn.execute(SELECT_STATE)}
+        tasks = [{"id": task_id, "text": text, "desc": desc, "done": bool(done),
+                  "completed_time": completed_time, "seq": seq}
+                 for task_id, text, desc, done, completed_time, seq in self._conn.execute(SELECT_TASKS)]
+        return state, tasks
+
+    def reserve_ids(self, floor):
+        # Yeni kimlik bloğu veritabanının yazma kilidi altında ayrılır; aynı veritabanını açan
+        # örnekler ayrı bloklar alır. floor: bu örneğin gördüğü ya da başka listelerde verilen.
+        with self._lock:
+            conn = self._conn
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    row = conn.execute(SELECT_ID_BLOCK).fetchone()
+                    start = max(floor, conn.execute(NEXT_ID).fetchone()[0],
+                                json.loads(row[0]) if row else 1)
+                    conn.execute(UPSERT_STATE, ("next_id", json.dumps(start + ID_BLOCK)))
+                    conn.execute("COMMIT")
+                except Exception:
+                    conn.execute("ROLLBACK")
+                    raise
+            except sqlite3.Error as e:
+                # Görev yine eklenir; kimliği yalnızca bu örneğin bildiklerinden verilir
+                log.warning("Kimlik bloğu ayrılamadı: %s", e)
+                return floor, floor + 1
+        return start, start + ID_BLOCK
+
+    def attach(self, store):
+        super().attach(store)
+        store.use_id_blocks(self.reserve_ids)
+
+    def detach(self, store):
+        super().detach(store)
+        store.use_id_blocks(None)
+
+    def changed(self):
+        with self._lock:
+            return self._conn.execute("PRAGMA data_version").fetchone()[0] != self._data_version
+
+    def read_changes(self, full=False):
+        # Kilitleme SQLite'ın kendisinde; başka bir örnek yazdıysa tüm tablo okunur
+        with self._lock:
+            if not full and self._conn.execute("PRAGMA data_version").fetchone()[0] == self._data_version:
+                return None
+            state, tasks = self._read()
+        return "full", state, tasks
+
+    def add_session(self, started, ended, mode, task_id=None, task_text=None):
+        self.append({"op": "session", "started": started, "ended": ended, "mode": mode,
+                     "task_id": task_id, "task_text": task_text})
+
+    def _write_batch(self, records):
+        records = coalesce(records)
+        with tracer.span("save.sqlite", records=len(records)), self._lock:
+            apply_records(self._conn, records)
+        tracer.count("saves")
+        return len(records)
+
+    def close(self):
+        self._close_scheduler()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+if __name__ == "__main__":
+    source = sys.argv[1] if len(sys.argv) > 1 else "pomodoro_tasks.json"
+    target = sys.argv[2] if len(sys.argv) > 2 else SQLITE_FILE
+    count = migrate_json(source, target)
+    print(f"{count} görev {target} dosyasına aktarıldı")
@@ -0,0 +1,9 @@
+from .journal import Journal
+
+
+def open_storage(config, tasks_file, sqlite_path=None):
+    save_window = config["save_window_ms"] / 1000
+    if config["storage"] == "sqlite":
+        from .sqlite_store import SqliteStorage
+        return SqliteStorage(sqlite_path or config["sqlite_path"], save_window, migrate_from=tasks_file)
+    return Journal(tasks_file, config["compact_every"], save_window)
@@ -0,0 +1,436 @@
+from bisect import bisect_left
+from contextlib import contextmanager
+
+# Görev başlığı için arayüzdeki sınır
+MAX_TEXT_LENGTH = 50
+# Sıra anahtarında kimlik payı: başka örneklerden gelen eşit sıra numaraları kimlikle ayrılır
+ID_SPAN = 1 << 32
+
+
+class Task:
+    __slots__ = ("id", "text", "desc", "done", "completed_time", "seq")
+
+    def __init__(self, task_id, text, desc="", done=False, completed_time=None, seq=0):
+        self.id = task_id
+        self.text = text
+        self.desc = desc
+        self.done = done
+        self.completed_time = completed_time
+        self.seq = seq
+
+    def sort_key(self):
+        if self.done:
+            return (self.completed_time or 0, self.seq, self.id)
+        return self.seq * ID_SPAN + self.id
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "text": self.text,
+            "desc": self.desc,
+            "done": self.done,
+            "completed_time": self.completed_time
+        }
+
+    def __repr__(self):
+        return f"Task({self.id!r}, {self.text!r}, done={self.done!r})"
+
+
+class OrderedIndex:
+    # Anahtara göre sıralı tutulan paralel listeler; konum bisect ile bulunur
+    __slots__ = ("_keys", "_items")
+
+    def __init__(self):
+        self._keys = []
+        self._items = []
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __getitem__(self, pos):
+        return self._items[pos]
+
+    def insertion_point(self, key):
+        return bisect_left(self._keys, key)
+
+    def position(self, key):
+        pos = bisect_left(self._keys, key)
+        if pos == len(self._keys) or self._keys[pos] != key:
+            raise KeyError(key)
+        return pos
+
+    def insert(self, key, item):
+        pos = bisect_left(self._keys, key)
+        self._keys.insert(pos, key)
+        self._items.insert(pos, item)
+        return pos
+
+    def remove(self, key):
+        pos = self.position(key)
+        del self._keys[pos]
+        del self._items[pos]
+        return pos
+
+    def extend(self, pairs):
+        pairs = list(pairs)
+        if not pairs:
+            return
+        in_order = not self._keys or pairs[0][0] > self._keys[-1]
+        in_order = in_order and all(pairs[i][0] < pairs[i + 1][0] for i in range(len(pairs) - 1))
+        self._keys.extend(k for k, _ in pairs)
+        self._items.extend(item for _, item in pairs)
+        if not in_order:
+            merged = sorted(zip(self._keys, self._items), key=lambda p: p[0])
+            self._keys = [k for k, _ in merged]
+            self._items = [item for _, item in merged]
+
+    def clear(self):
+        self._keys.clear()
+        self._items.clear()
+
+    def remove_many(self, keys):
+        # Çok sayıda anahtar tek geçişte silinir
+        drop = set(keys)
+        if not drop:
+            return
+        kept = [(k, item) for k, item in zip(self._keys, self._items) if k not in drop]
+        self._keys = [k for k, _ in kept]
+        self._items = [item for _, item in kept]
+
+    def drop_front(self, count):
+        del self._keys[:count]
+        del self._items[:count]
+
+    def items(self):
+        return list(self._items)
+
+
+class TaskStore:
+    # Her değişiklik önce "adding" gibi bir ön olay, sonra "added" gibi bir son olay yayar
+    # (payload aynıdır):
+    #   adding/added (task, row), moving/moved (task, old_row, new_row),
+    #   removing/removed (task, row), removing_rows/rows_removed (first, last, [task]),
+    #   reordering/reordered [task], resetting/reset "load" | "clear",
+    #   changing/changed (task, row), adding_many/added_many [task],
+    #   removing_many/removed_many [task]
+    # batch() içindeki değişiklikler batching/batched (None) arasında gelir.
+    def __init__(self):
+        self._index = {}
+        # Tamamlananlar en üstte tamamlanma zamanına göre, sonra bekleyenler
+        self._done = OrderedIndex()
+        self._pending = OrderedIndex()
+        self._next_id = 1
+        # Kayıt kimlik blokları veriyorsa id_blocks(taban) -> (ilk, son+1); yeni kimlikler
+        # yalnızca bu örneğe ayrılan bloktan gelir
+        self.id_blocks = None
+        self._block_source = None
+        self._block_next = self._block_end = 0
+        self._next_seq = 0
+        self._front_seq = 0
+        self._batch_depth = 0
+        self._listeners = []
+
+    def subscribe(self, listener):
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        self._listeners.remove(listener)
+
+    def _emit(self, event, payload=None):
+        for listener in list(self._listeners):
+            listener(event, payload)
+
+    @contextmanager
+    def batch(self):
+        # İç içe kullanılabilir; dinleyiciler yalnızca en dıştaki için haber alır
+        self._batch_depth += 1
+        if self._batch_depth == 1:
+            self._emit("batching")
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._emit("batched")
+
+    def __len__(self):
+        return len(self._index)
+
+    def __iter__(self):
+        yield from self._done
+        yield from self._pending
+
+    def __contains__(self, task_id):
+        return task_id in self._index
+
+    def get(self, task_id):
+        return self._index.get(task_id)
+
+    def task_at(self, row):
+        if row < len(self._done):
+            return self._done[row]
+        return self._pending[row - len(self._done)]
+
+    def row_of(self, task_id):
+        task = self._index[task_id]
+        if task.done:
+            return self._done.position(task.sort_key())
+        return len(self._done) + self._pending.position(task.sort_key())
+
+    def tasks_in_order(self, ids):
+        # Verilen kimliklerin görevlerini liste sırasıyla döner; yalnızca eşleşenler sıralanır,
+        # kümenin boyutu ne olursa olsun tüm liste dolaşılmaz
+        tasks = [self._index[task_id] for task_id in ids if task_id in self._index]
+        tasks.sort(key=lambda task: (not task.done, task.sort_key()))
+        return tasks
+
+    def done_count(self):
+        return len(self._done)
+
+    def done_tasks(self):
+        return self._done.items()
+
+    def done_before(self, before):
+        # Tamamlananlar zamana göre sıralı olduğundan bunlar listenin başıdır
+        return self._done.items()[:self._done.insertion_point((before,))]
+
+    def pending_tasks(self):
+        return self._pending.items()
+
+    def last_id(self):
+        return self._next_id - 1
+
+    def reserve_ids(self, last_id):
+        # Arşivlenen görevlerin kimlikleri yeniden verilmez
+        self._next_id = max(self._next_id, last_id + 1)
+
+    def use_id_blocks(self, id_blocks):
+        # Aynı kayda yeniden bağlanınca (ör. dışarıdan gelenler uygulanırken) blok korunur
+        if id_blocks is not None and id_blocks != self._block_source:
+            self._block_source = id_blocks
+            self._block_next = self._block_end = 0
+        self.id_blocks = id_blocks
+
+    def _new_id(self, task_id=None):
+        if task_id is None or task_id in self._index:
+            task_id = self._next_id if self.id_blocks is None else self._block_id()
+        self._next_id = max(self._next_id, task_id + 1)
+        return task_id
+
+    def _block_id(self):
+        # Başka örneklerin gördüğümüz kimlikleri _next_id'yi ilerletir ama bloğa dokunmaz
+        while self._block_next >= self._block_end or self._block_next in self._index:
+            if self._block_next >= self._block_end:
+                self._block_next, self._block_end = self.id_blocks(self._next_id)
+            else:
+                self._block_next += 1
+        self._block_next += 1
+        return self._block_next - 1
+
+    def _new_seq(self, seq=None):
+        if seq is not None:
+            # Geri alınan görev eski yerine döner
+            self._next_seq = max(self._next_seq, seq)
+            self._front_seq = min(self._front_seq, seq)
+            return seq
+        self._next_seq += 1
+        return self._next_seq
+
+    def _insertion_row(self, task):
+        if task.done:
+            return self._done.insertion_point(task.sort_key())
+        return len(self._done) + self._pending.insertion_point(task.sort_key())
+
+    def _insert(self, task):
+        if task.done:
+            return self._done.insert(task.sort_key(), task)
+        return len(self._done) + self._pending.insert(task.sort_key(), task)
+
+    def _detach(self, task):
+        if task.done:
+            return self._done.remove(task.sort_key())
+        return len(self._done) + self._pending.remove(task.sort_key())
+
+    def add(self, text, desc="", done=False, completed_time=None, task_id=None, seq=None):
+        task = Task(self._new_id(task_id), text, desc or "", done,
+                    completed_time if done else None, self._new_seq(seq))
+        payload = (task, self._insertion_row(task))
+        self._emit("adding", payload)
+        self._index[task.id] = task
+        self._insert(task)
+        self._emit("added", payload)
+        return task
+
+    def _insert_many(self, tasks):
+        # Sıralı parçalar tek birleştirmeyle eklenir; satır satır kaydırma yapılmaz
+        self._done.extend(sorted(((t.sort_key(), t) for t in tasks if t.done), key=lambda p: p[0]))
+        self._pending.extend(sorted(((t.sort_key(), t) for t in tasks if not t.done), key=lambda p: p[0]))
+
+    def _detach_many(self, tasks):
+        self._done.remove_many(t.sort_key() for t in tasks if t.done)
+        self._pending.remove_many(t.sort_key() for t in tasks if not t.done)
+
+    def add_many(self, items):
+        # Geri almada silinen görevler kimlik ve sıralarıyla tek seferde geri gelir.
+        # items: (id, text, desc, done, completed_time, seq)
+        tasks = []
+        taken = set()
+        for task_id, text, desc, done, completed_time, seq in items:
+            task_id = self._new_id(None if task_id in taken else task_id)
+            taken.add(task_id)
+            tasks.append(Task(task_id, text, desc or "", done,
+                              completed_time if done else None, self._new_seq(seq)))
+        if not tasks:
+            return tasks
+        self._emit("adding_many", tasks)
+        for task in tasks:
+            self._index[task.id] = task
+        self._insert_many(tasks)
+        self._emit("added_many", tasks)
+        return tasks
+
+    def remove_many(self, ids):
+        tasks = [self._index[task_id] for task_id in ids if task_id in self._index]
+        if not tasks:
+            return tasks
+        self._emit("removing_many", tasks)
+        for task in tasks:
+            del self._index[task.id]
+        self._detach_many(tasks)
+        self._emit("removed_many", tasks)
+        return tasks
+
+    def set_done_many(self, items):
+        # items: (id, done, completed_time, seq); aynı görev birden çok kez varsa sonuncusu geçerli.
+        # complete_all gibi tek düzen değişikliği olarak yayılır.
+        changes = {}
+        for task_id, done, completed_time, seq in items:
+            if task_id in self._index:
+                changes[task_id] = (done, completed_time, seq)
+        tasks = [self._index[task_id] for task_id in changes]
+        if not tasks:
+            return tasks
+        self._emit("reordering", tasks)
+        self._detach_many(tasks)
+        for task in tasks:
+            done, completed_time, seq = changes[task.id]
+            task.done = done
+            task.completed_time = completed_time if done else None
+            task.seq = self._new_seq(seq)
+        self._insert_many(tasks)
+        self._emit("reordered", tasks)
+        return tasks
+
+    def load(self, tasks):
+        self._emit("resetting", "load")
+        self._index.clear()
+        self._done.clear()
+        self._pending.clear()
+        done, pending = [], []
+        for item in tasks:
+            seq = item.get("seq")
+            if seq is None:
+                seq = self._new_seq()
+            else:
+                # Kalıcı sıra numarası korunur (ör. SQLite deposundan yüklerken)
+                self._next_seq = max(self._next_seq, seq)
+                self._front_seq = min(self._front_seq, seq)
+            task = Task(self._new_id(item.get("id")), item["text"], item.get("desc") or "",
+                        bool(item.get("done", False)), item.get("completed_time"), seq)
+            if not task.done:
+                task.completed_time = None
+            self._index[task.id] = task
+            (done if task.done else pending).append((task.sort_key(), task))
+        # Tek seferlik sıralama
+        done.sort(key=lambda p: p[0])
+        self._done.extend(done)
+        self._pending.extend(pending)
+        self._emit("reset", "load")
+
+    def update(self, task_id, text=None, desc=None):
+        task = self._index[task_id]
+        payload = (task, self.row_of(task_id))
+        self._emit("changing", payload)
+        if text is not None:
+            task.text = text
+        if desc is not None:
+            task.desc = desc
+        self._emit("changed", payload)
+        return task
+
+    def set_done(self, task_id, done, completed_time=None, seq=None):
+        task = self._index[task_id]
+        if task.done == done:
+            return task
+        old_row = self.row_of(task_id)
+        if done:
+            new_row = self._done.insertion_point((completed_time or 0, task.seq if seq is None else seq,
+                                                  task.id))
+        elif seq is None:
+            # Yeniden açılan görev bekleyenlerin en başına döner
+            new_row = len(self._done) - 1
+        else:
+            new_row = len(self._done) - 1 + self._pending.insertion_point(seq * ID_SPAN + task.id)
+        payload = (task, old_row, new_row)
+        self._emit("moving", payload)
+        self._detach(task)
+        task.done = done
+        if done:
+            task.completed_time = completed_time
+        else:
+            task.completed_time = None
+        if seq is not None:
+            task.seq = self._new_seq(seq)
+        elif not done:
+            self._front_seq -= 1
+            task.seq = self._front_seq
+        self._insert(task)
+        self._emit("moved", payload)
+        return task
+
+    def complete_all(self, now):
+        changed = self._pending.items()
+        if not changed:
+            return changed
+        self._emit("reordering", changed)
+        for idx, task in enumerate(changed):
+            task.done = True
+            task.completed_time = now + idx
+        self._pending.clear()
+        self._done.extend((task.sort_key(), task) for task in changed)
+        self._emit("reordered", changed)
+        return changed
+
+    def remove(self, task_id):
+        task = self._index[task_id]
+        payload = (task, self.row_of(task_id))
+        self._emit("removing", payload)
+        del self._index[task_id]
+        self._detach(task)
+        self._emit("removed", payload)
+        return task
+
+    def remove_done(self, before=None):
+        # before verilirse yalnızca o zamandan önce tamamlananlar
+        removed = self._done.items() if before is None else self.done_before(before)
+        if not removed:
+            return removed
+        payload = (0, len(removed) - 1, removed)
+        self._emit("removing_rows", payload)
+        for task in removed:
+            del self._index[task.id]
+        self._done.drop_front(len(removed))
+        self._emit("rows_removed", payload)
+        return removed
+
+    def clear(self):
+        removed = list(self._index.values())
+        self._emit("resetting", "clear")
+        self._index.clear()
+        self._done.clear()
+        self._pending.clear()
+        self._emit("reset", "clear")
+        return removed
@@ -0,0 +1,146 @@
+import math
+import time
+
+WORK = "work"
+SHORT_BREAK = "short_break"
+LONG_BREAK = "long_break"
+LONG_BREAK_EVERY = 4
+
+_BOOTTIME = getattr(time, "CLOCK_BOOTTIME", None)
+
+
+def monotonic():
+    # Linux'ta uyku süresini de sayan monoton saat tercih edilir
+    if _BOOTTIME is not None:
+        return time.clock_gettime(_BOOTTIME)
+    return time.monotonic()
+
+
+class TimerEngine:
+    def __init__(self, durations, clock=monotonic, wall=time.time):
+        self.durations = dict(durations)
+        self.clock = clock
+        self.wall = wall
+        self.mode = WORK
+        self.pomodoro_count = 0
+        self.running = False
+        self.deadline = None
+        self.paused_remaining = float(self.durations[WORK])
+        self.started_at = None
+
+    def duration(self, mode=None):
+        return self.durations[mode or self.mode]
+
+    def remaining(self):
+        if self.running:
+            return max(0.0, self.deadline - self.clock())
+        return self.paused_remaining
+
+    def remaining_seconds(self):
+        # Ekranda gösterilen tam saniye: 1499.4 sn kala hâlâ 25:00
+        return int(math.ceil(self.remaining() - 1e-6))
+
+    def ms_until_next_second(self):
+        remaining = self.remaining()
+        fraction = remaining - math.floor(remaining)
+        return max(1, int(math.ceil(fraction * 1000)) or 1000)
+
+    def expired(self):
+        return self.running and self.remaining() <= 0
+
+    def start(self):
+        if self.running:
+            return
+        if self.started_at is None:
+            self.started_at = self.wall()
+        self.deadline = self.clock() + self.paused_remaining
+        self.running = True
+
+    def stop(self):
+        if not self.running:
+            return
+        self.paused_remaining = self.remaining()
+        self.deadline = None
+        self.running = False
+
+    def toggle(self):
+        if self.running:
+            self.stop()
+        else:
+            self.start()
+        return self.running
+
+    def advance(self):
+        # Biten oturumu kapatır, 4 pomodoroda bir uzun molaya geçer
+        finished = self.mode
+        ended = self.wall()
+        started = self.started_at if self.started_at is not None else ended - self.duration()
+        if self.mode == WORK:
+            self.pomodoro_count += 1
+            self.mode = LONG_BREAK if self.pomodoro_count % LONG_BREAK_EVERY == 0 else SHORT_BREAK
+        else:
+            self.mode = WORK
+        self.running = False
+        self.deadline = None
+        self.started_at = None
+        self.paused_remaining = float(self.duration())
+        return finished, started, ended
+
+    def to_state(self):
+        remaining = self.remaining()
+        return {
+            "mode": self.mode,
+            "running": self.running,
+            "remaining": remaining,
+            "deadline": self.wall() + remaining if self.running else None,
+            "started_at": self.started_at,
+            "pomodoro_count": self.pomodoro_count
+        }
+
+    def restore(self, state):
+        if not state:
+            return
+        self.mode = state.get("mode", WORK)
+        if self.mode not in self.durations:
+            self.mode = WORK
+        self.pomodoro_count = state.get("pomodoro_count", self.pomodoro_count)
+        self.started_at = state.get("started_at")
+        remaining = state.get("remaining", self.duration())
+        if state.get("running") and state.get("deadline") is not None:
+            # Kapalıyken geçen süre duvar saatiyle düşülür
+            remaining = max(0.0, state["deadline"] - self.wall())
+            self.paused_remaining = remaining
+            self.running = False
+            self.start()
+        else:
+            self.paused_remaining = min(float(remaining), float(self.duration()))
+            self.running = False
+            self.deadline = None
+
+
+class WakeupMeter:
+    # Son bir dakikadaki uyanmaları duruma göre (ör. "visible"/"hidden") sayar
+    def __init__(self, clock=monotonic, window=60.0):
+        self.clock = clock
+        self.window = window
+        self._events = {}
+        self.totals = {}
+
+    def hit(self, state):
+        now = self.clock()
+        events = self._events.setdefault(state, [])
+        events.append(now)
+        self.totals[state] = self.totals.get(state, 0) + 1
+        self._trim(events, now)
+
+    def _trim(self, events, now):
+        cutoff = now - self.window
+        drop = 0
+        while drop < len(events) and events[drop] < cutoff:
+            drop += 1
+        del events[:drop]
+
+    def per_minute(self, state):
+        events = self._events.get(state, [])
+        self._trim(events, self.clock())
+        return len(events) * 60.0 / self.window
@@ -0,0 +1,125 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+
+MAX_EVENTS = 200000
+WINDOW = 512
+
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "args", "start")
+
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer._finish(self.name, self.start, time.perf_counter(), self.args)
+        return False
+
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+class Tracer:
+    # Kapalıyken span() paylaşılan boş bir bağlam döner; sıcak yola ek maliyet neredeyse yok
+    def __init__(self, max_events=MAX_EVENTS, window=WINDOW):
+        self.enabled = False
+        self.origin = time.perf_counter()
+        self.window = window
+        self.events = deque(maxlen=max_events)
+        self.samples = {}
+        self.counters = {}
+        self._threads = {}
+        self._lock = threading.Lock()
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def span(self, name, **args):
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, args)
+
+    def _event(self, name, phase, ts, **fields):
+        tid = threading.get_ident()
+        if tid not in self._threads:
+            self._threads[tid] = threading.current_thread().name
+        event = {"name": name, "ph": phase, "ts": (ts - self.origin) * 1e6,
+                 "pid": os.getpid(), "tid": tid}
+        event.update(fields)
+        self.events.append(event)
+
+    def _finish(self, name, start, end, args):
+        fields = {"dur": (end - start) * 1e6}
+        if args:
+            fields["args"] = args
+        self._event(name, "X", start, **fields)
+        self.sample(name, (end - start) * 1000, track=False)
+
+    def sample(self, name, ms, track=True):
+        # Son WINDOW ölçüm yüzdelikler için tutulur; aralık dışı ölçümler izde sayaç izi olur
+        if not self.enabled:
+            return
+        if track:
+            self._event(name, "C", time.perf_counter(), args={"ms": ms})
+        with self._lock:
+            samples = self.samples.get(name)
+            if samples is None:
+                samples = self.samples[name] = deque(maxlen=self.window)
+            samples.append(ms)
+
+    def count(self, name, n=1):
+        if not self.enabled:
+            return
+        with self._lock:
+            value = self.counters[name] = self.counters.get(name, 0) + n
+        self._event(name, "C", time.perf_counter(), args={"value": value})
+
+    def summary(self):
+        # ad -> (ölçüm sayısı, p50, p99) milisaniye
+        with self._lock:
+            samples = {name: list(values) for name, values in self.samples.items()}
+        return {name: (len(values), percentile(values, 0.5), percentile(values, 0.99))
+                for name, values in sorted(samples.items())}
+
+    def export(self, path):
+        # chrome://tracing ve Perfetto'nun okuduğu trace-event biçimi
+        pid = os.getpid()
+        events = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+                  for tid, name in list(self._threads.items())]
+        events.extend(list(self.events))
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        os.replace(tmp, path)
+        return len(events)
+
+
+tracer = Tracer()
@@ -0,0 +1,256 @@
+import csv
+import json
+import os
+from itertools import islice
+
+from .store import MAX_TEXT_LENGTH
+
+FORMATS = ("csv", "jsonl")
+CHUNK_SIZE = 500
+MAX_ERRORS = 20
+COLUMNS = ("id", "text", "desc", "done", "completed_time")
+# Sorun takipçisi dışa aktarımlarındaki yaygın sütun adları
+TEXT_KEYS = ("text", "title", "summary", "name", "başlık")
+DESC_KEYS = ("desc", "description", "body", "açıklama")
+TRUE_VALUES = ("1", "true", "yes", "x", "evet", "done", "closed")
+
+
+def detect_format(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".csv":
+        return "csv"
+    if ext in (".jsonl", ".ndjson"):
+        return "jsonl"
+    raise ValueError(f"biçim anlaşılamadı (csv ya da jsonl): {path}")
+
+
+class _CountingLines:
+    # Dosyayı satır satır okur ve okunan bayt sayısını tutar; ilerleme buradan hesaplanır
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        self.bytes_read = 0
+        self._first = True
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        raw = self.file.readline()
+        if not raw:
+            raise StopIteration
+        self.bytes_read += len(raw)
+        line = raw.decode("utf-8")
+        if self._first:
+            self._first = False
+            line = line.lstrip("\ufeff")
+        return line
+
+    def close(self):
+        self.file.close()
+
+
+def _iter_csv(lines):
+    reader = csv.DictReader(lines)
+    for row in reader:
+        yield reader.line_num, row
+
+
+def _iter_jsonl(lines):
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            yield number, None
+            continue
+        yield number, row
+
+
+def _pick(row, keys):
+    for key in keys:
+        value = row.get(key)
+        if value is not None:
+            return value
+    return None
+
+
+def parse_row(row, now):
+    # Geçerli satırdan (metin, açıklama, tamamlandı, tamamlanma zamanı); değilse ValueError
+    if not isinstance(row, dict):
+        raise ValueError("satır okunamadı")
+    row = {str(k).strip().lower(): v for k, v in row.items() if k is not None}
+    text = _pick(row, TEXT_KEYS)
+    text = str(text).strip() if text is not None else ""
+    if not text:
+        raise ValueError("görev metni boş")
+    if len(text) > MAX_TEXT_LENGTH:
+        raise ValueError(f"görev metni {MAX_TEXT_LENGTH} karakterden uzun")
+    desc = _pick(row, DESC_KEYS)
+    desc = str(desc).strip() if desc is not None else ""
+    done = row.get("done", False)
+    if not isinstance(done, bool):
+        done = str(done).strip().lower() in TRUE_VALUES
+    completed_time = None
+    if done:
+        value = row.get("completed_time")
+        try:
+            completed_time = float(value) if value not in (None, "") else now
+        except (TypeError, ValueError):
+            raise ValueError("completed_time sayı değil")
+    return text, desc, done, completed_time
+
+
+class TaskImporter:
+    # Dosya parça parça okunur; her step() bir parçayı tek toplu değişiklik olarak ekler.
+    # Bellekte yalnızca bir parça ve eklenen kimlikler (iptal için) tutulur.
+    def __init__(self, core, path, fmt=None, chunk_size=CHUNK_SIZE):
+        self.core = core
+        self.path = path
+        self.format = fmt or detect_format(path)
+        if self.format not in FORMATS:
+            raise ValueError(f"desteklenmeyen biçim: {self.format}")
+        self.chunk_size = chunk_size
+        self.total_bytes = os.path.getsize(path)
+        self.added = []
+        self.skipped = 0
+        self.errors = []
+        self.done = False
+        self.cancelled = False
+        self._lines = _CountingLines(path)
+        self._rows = (_iter_csv if self.format == "csv" else _iter_jsonl)(self._lines)
+        # Tüm içe aktarma tek adımda geri alınır; parçalar arasındaki düzenlemeler ayrı adımdır
+        self._undo = core.undo_log.begin_group()
+
+    def progress(self):
+        return self._lines.bytes_read / self.total_bytes if self.total_bytes else 1.0
+
+    def step(self):
+        # Devam edilecekse True döner
+        if self.done:
+            return False
+        try:
+            chunk = list(islice(self._rows, self.chunk_size))
+        except (UnicodeDecodeError, csv.Error) as e:
+            self._error(None, str(e))
+            chunk = []
+        core = self.core
+        now = core.wall()
+        with core.undo_log.collect(self._undo), core.batch():
+            for line, row in chunk:
+                try:
+                    text, desc, done, completed_time = parse_row(row, now)
+                except ValueError as e:
+                    self._error(line, str(e))
+                    continue
+                # Çekirdekten geçer; eklenti kancaları her görev için task_added alır
+                self.added.append(core.add_task(text, desc, done, completed_time).id)
+        if len(chunk) < self.chunk_size:
+            self._finish()
+        return not self.done
+
+    def _error(self, line, message):
+        self.skipped += 1
+        if len(self.errors) < MAX_ERRORS:
+            self.errors.append((line, message))
+
+    def _finish(self):
+        self.done = True
+        self._lines.close()
+        self.core.undo_log.end_group(self._undo, keep=not self.cancelled)
+        self._undo = None
+
+    def run(self, progress=None):
+        while self.step():
+            if progress is not None:
+                progress(self)
+        return len(self.added)
+
+    def cancel(self):
+        # Bu içe aktarmada eklenenler tek toplu silmeyle geri alınır
+        self.cancelled = True
+        self._finish()
+        with self.core.batch(), self.core.undo_log.paused():
+            self.core.store.remove_many(self.added)
+        self.added = []
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    return value
+
+
+class TaskExporter:
+    # Görevler (Task ya da sözlük) geçici dosyaya parça parça yazılır; her step() bir parça
+    # yazar. Dosya yazım bitince yerine konur; iptal ya da hata hedef dosyaya dokunmaz.
+    def __init__(self, tasks, path, fmt=None, chunk_size=CHUNK_SIZE):
+        self.path = path
+        self.format = fmt or detect_format(path)
+        if self.format not in FORMATS:
+            raise ValueError(f"desteklenmeyen biçim: {self.format}")
+        self.chunk_size = chunk_size
+        # Üreteçle verilen görevlerin sayısı bilinmez; ilerleme o zaman yalnızca sonda dolar
+        self.total = len(tasks) if hasattr(tasks, "__len__") else None
+        self.count = 0
+        self.done = False
+        self.cancelled = False
+        self._tasks = iter(tasks)
+        self._tmp = path + ".tmp"
+        self._file = open(self._tmp, "w", encoding="utf-8", newline="")
+        self._writer = None
+        if self.format == "csv":
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(COLUMNS)
+
+    def progress(self):
+        if self.done:
+            return 1.0
+        return self.count / self.total if self.total else 0.0
+
+    def step(self):
+        # Devam edilecekse True döner
+        if self.done:
+            return False
+        try:
+            chunk = list(islice(self._tasks, self.chunk_size))
+            for task in chunk:
+                item = task if isinstance(task, dict) else task.to_dict()
+                if self._writer is not None:
+                    self._writer.writerow([_csv_value(item.get(key)) for key in COLUMNS])
+                else:
+                    self._file.write(json.dumps(item, ensure_ascii=False, separators=(",", ":")) + "\n")
+                self.count += 1
+            if len(chunk) < self.chunk_size:
+                self.done = True
+                self._file.close()
+                os.replace(self._tmp, self.path)
+        except BaseException:
+            self._discard()
+            raise
+        return not self.done
+
+    def _discard(self):
+        self.done = True
+        self._file.close()
+        try:
+            os.remove(self._tmp)
+        except OSError:
+            pass
+
+    def run(self, progress=None):
+        while self.step():
+            if progress is not None:
+                progress(self)
+        return self.count
+
+    def cancel(self):
+        if not self.done:
+            self.cancelled = True
+            self._discard()
+
+
+def export_tasks(tasks, path, fmt=None):
+    return TaskExporter(tasks, path, fmt).run()
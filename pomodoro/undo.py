@@ -0,0 +1,193 @@
+from collections import deque
+from contextlib import contextmanager
+from itertools import groupby
+
+from .trace import tracer
+
+# Bir adım, değişikliği geri alan ters işlemlerin listesidir (sondan başa uygulanır):
+#   ("del", id)                                           eklenen görev silinir
+#   ("add", id, text, desc, done, completed_time, seq)    silinen görev geri eklenir
+#   ("edit", id, text, desc)                              önceki metin ve açıklama
+#   ("done", id, done, completed_time, seq)               önceki tamamlanma durumu
+# Görev listesinin kopyası tutulmaz; toplu işlemde k görev için k kayıt vardır.
+OP_BYTES = 64
+# Bu kadar ardışık aynı tür işlem deponun toplu işlemiyle tek olayda uygulanır
+BULK_MIN = 64
+
+
+class _Step:
+    __slots__ = ("ops", "size")
+
+    def __init__(self, ops):
+        self.ops = ops
+        # Yaklaşık bellek: kayıt başına sabit maliyet ve metinler (add ve edit'te 2. ve 3. alan)
+        self.size = OP_BYTES * len(ops) + sum(len(op[2]) + len(op[3]) for op in ops
+                                              if op[0] == "add" or op[0] == "edit")
+
+
+class UndoLog:
+    # Depo olaylarından ters işlemleri kaydeder. Dıştaki batch() tek adımdır, onun dışında
+    # her değişiklik kendi adımıdır. Geri alma da depo işlemleriyle yapılır; sırada oluşan
+    # olaylar yineleme adımını verir. Toplam boyut bütçeyi aşınca en eski adımlar düşer.
+    def __init__(self, store, budget):
+        self.store = store
+        self.budget = budget
+        self.size = 0
+        self._undo = deque()
+        self._redo = deque()
+        self._ops = None
+        self._target = None
+        self._group = None
+        self._paused = 0
+        store.subscribe(self._on_store_event)
+
+    def can_undo(self):
+        return bool(self._undo)
+
+    def can_redo(self):
+        return bool(self._redo)
+
+    def clear(self):
+        self._undo.clear()
+        self._redo.clear()
+        self.size = 0
+
+    @contextmanager
+    def paused(self):
+        # Diskten gelen ya da arşive taşınan değişiklikler kullanıcının adımı değildir
+        self._paused += 1
+        try:
+            yield
+        finally:
+            self._paused -= 1
+
+    def begin_group(self):
+        # Birden çok toplu değişiklik (ör. parça parça içe aktarma) tek adım olur. Gruba yalnızca
+        # collect() içindeki değişiklikler girer; aradaki başka değişiklikler kendi adımlarıdır.
+        return []
+
+    @contextmanager
+    def collect(self, group):
+        self._group = group
+        try:
+            yield
+        finally:
+            self._group = None
+
+    def end_group(self, group, keep=True):
+        if keep and group:
+            self._commit(group)
+
+    def undo(self):
+        return self._replay(self._undo, self._redo)
+
+    def redo(self):
+        return self._replay(self._redo, self._undo)
+
+    def _replay(self, source, target):
+        if not source:
+            return False
+        step = source.pop()
+        self.size -= step.size
+        self._target = target
+        try:
+            with tracer.span("task.undo", ops=len(step.ops)):
+                with self.store.batch():
+                    for kind, ops in groupby(reversed(step.ops), key=lambda op: op[0]):
+                        ops = list(ops)
+                        if len(ops) >= BULK_MIN and kind != "edit":
+                            self._apply_many(kind, ops)
+                        else:
+                            for op in ops:
+                                self._apply(op)
+        finally:
+            self._target = None
+        return True
+
+    def _apply(self, op):
+        store = self.store
+        kind, task_id = op[0], op[1]
+        if kind == "add":
+            _, _, text, desc, done, completed_time, seq = op
+            store.add(text, desc, done, completed_time, task_id=task_id, seq=seq)
+            return
+        # Başka bir örnekte silinmiş görev atlanır
+        if task_id not in store:
+            return
+        if kind == "del":
+            store.remove(task_id)
+        elif kind == "edit":
+            store.update(task_id, text=op[2], desc=op[3])
+        elif kind == "done":
+            store.set_done(task_id, op[2], op[3], seq=op[4])
+
+    def _apply_many(self, kind, ops):
+        store = self.store
+        if kind == "add":
+            store.add_many(op[1:] for op in ops)
+        elif kind == "del":
+            store.remove_many(op[1] for op in ops)
+        else:
+            store.set_done_many(op[1:] for op in ops)
+
+    def _commit(self, ops):
+        if self._group is not None and self._target is None:
+            self._group.extend(ops)
+            return
+        step = _Step(ops)
+        if self._target is not None:
+            self._target.append(step)
+        else:
+            # Yeni bir değişiklik yinelenecek adımları geçersiz kılar
+            self.size -= sum(s.size for s in self._redo)
+            self._redo.clear()
+            self._undo.append(step)
+        self.size += step.size
+        # En yeni adım bütçeyi tek başına aşsa da tutulur
+        while self.size > self.budget and len(self._undo) + len(self._redo) > 1:
+            stack = self._undo if self._undo and self._undo[0] is not step else self._redo
+            self.size -= stack.popleft().size
+
+    def _record(self, ops):
+        if self._ops is not None:
+            self._ops.extend(ops)
+        else:
+            self._commit(ops)
+
+    def _on_store_event(self, event, payload):
+        if self._paused:
+            return
+        if event == "batching":
+            self._ops = []
+        elif event == "batched":
+            ops, self._ops = self._ops, None
+            if ops:
+                self._commit(ops)
+        elif event == "added":
+            self._record([("del", payload[0].id)])
+        elif event == "added_many":
+            self._record([("del", task.id) for task in payload])
+        elif event == "changing":
+            task = payload[0]
+            self._record([("edit", task.id, task.text, task.desc)])
+        elif event == "moving":
+            task = payload[0]
+            self._record([("done", task.id, task.done, task.completed_time, task.seq)])
+        elif event == "reordering":
+            self._record([("done", task.id, task.done, task.completed_time, task.seq) for task in payload])
+        elif event == "removing":
+            self._record([_removed(payload[0])])
+        elif event == "removing_rows":
+            self._record([_removed(task) for task in payload[2]])
+        elif event == "removing_many":
+            self._record([_removed(task) for task in payload])
+        elif event == "resetting":
+            if payload == "clear":
+                self._record([_removed(task) for task in self.store])
+            else:
+                # Yeniden yüklenen liste önceki adımlarla eşleşmez
+                self.clear()
+
+
+def _removed(task):
+    return ("add", task.id, task.text, task.desc, task.done, task.completed_time, task.seq)
@@ -0,0 +1,37 @@
+import pytest
+
+from pomodoro.config import DEFAULTS
+from pomodoro.core import PomodoroCore
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def wall():
+    return FakeClock(1_700_000_000.0)
+
+
+@pytest.fixture
+def make_core(tmp_path, wall):
+    # Geçici klasörde, denetim soketi ve eklentiler kapalı, yüklenmiş bir çekirdek
+    cores = []
+
+    def make(**config):
+        settings = dict(DEFAULTS, control_socket="", plugins_dir="", save_window_ms=0,
+                        sqlite_path=str(tmp_path / "pomodoro.db"))
+        settings.update(config)
+        core = PomodoroCore(settings, str(tmp_path / "pomodoro_tasks.json"),
+                            clock=FakeClock(), wall=wall)
+        core.load()
+        cores.append(core)
+        return core
+
+    yield make
+    for core in cores:
+        core.close()
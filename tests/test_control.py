@@ -0,0 +1,95 @@
+import json
+
+import pytest
+
+from pomodoro.control import ControlError, ControlProtocol, ControlSession
+
+
+@pytest.fixture
+def protocol(make_core):
+    core = make_core()
+    for name in ("a", "b", "c"):
+        core.add_task(name)
+    return ControlProtocol(core)
+
+
+def call(protocol, cmd, **args):
+    return protocol.handle({"id": 1, "cmd": cmd, **args})
+
+
+def texts(protocol):
+    return [(task.text, task.done) for task in protocol.core.store]
+
+
+def test_batch_applies_all_ops_in_one_write(protocol):
+    core = protocol.core
+    core.storage.flush()
+    saves = core.storage.stats()["saves"]
+    response = call(protocol, "batch", ops=[{"cmd": "add", "text": "d"},
+                                            {"cmd": "complete", "id": 1},
+                                            {"cmd": "edit", "id": 2, "desc": "not"},
+                                            {"cmd": "delete", "id": 3}])
+    assert response["ok"], response
+    assert [item["text"] for item in response["result"]] == ["d", "a", "b", "c"]
+    assert texts(protocol) == [("a", True), ("b", False), ("d", False)]
+    core.storage.flush()
+    assert core.storage.stats()["saves"] == saves + 1
+    # Toplu komut tek geri alma adımıdır
+    core.undo()
+    assert texts(protocol) == [("a", False), ("b", False), ("c", False)]
+
+
+@pytest.mark.parametrize("ops, error", [
+    ([{"cmd": "add", "text": "d"}, {"cmd": "complete", "id": 99}], "görev bulunamadı: 99"),
+    ([{"cmd": "delete", "id": 1}, {"cmd": "edit", "id": 1, "text": "x"}], "görev bulunamadı: 1"),
+    ([{"cmd": "add", "text": ""}], None),
+    ([{"cmd": "add", "text": "x" * 51}], None),
+    ([{"cmd": "edit", "id": 2}], "edit için text ya da desc gerekli"),
+    ([{"cmd": "start"}], "toplu komutta desteklenmeyen işlem: start"),
+    ([{"cmd": "complete", "id": "1"}], None),
+])
+def test_invalid_batch_changes_nothing(protocol, ops, error):
+    before = texts(protocol)
+    response = call(protocol, "batch", ops=[{"cmd": "add", "text": "önce"}] + ops)
+    assert not response["ok"]
+    if error is not None:
+        assert response["error"] == error
+    assert texts(protocol) == before
+
+
+@pytest.mark.parametrize("ops", [None, {"cmd": "add"}, ["add"], [{"cmd": "add", "text": "a"}, 3]])
+def test_batch_requires_a_list_of_objects(protocol, ops):
+    response = call(protocol, "batch", ops=ops)
+    assert response == {"id": 1, "ok": False, "error": "ops bir nesne listesi olmalı"}
+
+
+def test_mutations_are_rejected_while_a_list_loads(protocol):
+    core = protocol.core
+    core.create_list("İş")
+    assert core.leave_list("İş")
+    for cmd, args in (("add", {"text": "x"}), ("batch", {"ops": [{"cmd": "add", "text": "x"}]})):
+        response = call(protocol, cmd, **args)
+        assert response["error"] == "görev listesi yükleniyor, tekrar deneyin"
+    core.apply_list(core.read_saved())
+    assert call(protocol, "add", text="x")["ok"]
+
+
+def test_session_handles_split_lines(protocol):
+    session = ControlSession(protocol)
+    line = json.dumps({"id": 7, "cmd": "ping"}).encode("utf-8") + b"\n"
+    assert session.feed(line[:5]) == b""
+    reply = json.loads(session.feed(line[5:] + b'{"id": 8, "cmd": "nope"}\n').split(b"\n")[0])
+    assert reply == {"id": 7, "ok": True, "result": "pong"}
+
+
+def test_unknown_and_internal_errors_drop_only_the_request(protocol, monkeypatch):
+    assert call(protocol, "nope")["error"] == "bilinmeyen komut: nope"
+
+    def broken(args, session):
+        raise RuntimeError("boom")
+    monkeypatch.setattr(protocol, "cmd_status", broken)
+    response = call(protocol, "status")
+    assert response["error"] == "iç hata: RuntimeError: boom"
+    assert call(protocol, "ping")["result"] == "pong"
+    with pytest.raises(ControlError):
+        protocol._check({"cmd": "complete", "id": 99}, set())
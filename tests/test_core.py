@@ -0,0 +1,96 @@
+import threading
+import time
+
+from pomodoro.cli import main
+
+DAY = 86400
+
+
+def add_old_done(core, wall, text="eski", days=10):
+    task = core.add_task(text)
+    core.store.set_done(task.id, True, wall.now - days * DAY)
+    return task
+
+
+def test_load_never_archives(make_core, wall):
+    core = make_core(archive_after_days=7)
+    add_old_done(core, wall)
+    core.close()
+    reopened = make_core(archive_after_days=7)
+    assert [task.text for task in reopened.store] == ["eski"]
+    assert reopened.archive.tasks() == []
+
+
+def test_finished_session_archives_when_enabled(make_core, wall):
+    core = make_core()
+    add_old_done(core, wall)
+    core.finish()
+    assert len(core.store) == 1
+    core.config["archive_after_days"] = 7
+    core.finish()
+    assert len(core.store) == 0
+    assert [task["text"] for task in core.archive.tasks()] == ["eski"]
+
+
+def test_archive_on_request(make_core, wall):
+    core = make_core()
+    add_old_done(core, wall, "eski", 10)
+    add_old_done(core, wall, "yeni", 1)
+    assert [task.text for task in core.archive_old(5)] == ["eski"]
+    assert [task.text for task in core.store] == ["yeni"]
+
+
+def test_read_only_cli_commands_leave_tasks_alone(make_core, wall, tmp_path, capsys):
+    core = make_core()
+    add_old_done(core, wall)
+    core.close()
+    config = tmp_path / "config.json"
+    config.write_text('{"archive_after_days": 1, "control_socket": ""}', encoding="utf-8")
+    args = ["--config", str(config), "--file", str(tmp_path / "pomodoro_tasks.json")]
+    journal = (tmp_path / "pomodoro_tasks.json.journal").read_bytes()
+    for command in (["status"], ["list"], ["stats"], ["lists"]):
+        assert main(args + command) == 0
+    assert (tmp_path / "pomodoro_tasks.json.journal").read_bytes() == journal
+    assert not (tmp_path / "pomodoro_archive.jsonl.gz").exists()
+    assert main(args + ["archive", "--days", "0"]) == 1
+    assert main(args + ["archive"]) == 0
+    assert capsys.readouterr().out.endswith("1 görev arşivlendi\n")
+    assert (tmp_path / "pomodoro_archive.jsonl.gz").exists()
+
+
+def test_plugins_are_opt_in_and_read_only_commands_skip_them(tmp_path, capsys, monkeypatch):
+    plugins = tmp_path / "eklentiler"
+    plugins.mkdir()
+    (plugins / "iz.py").write_text(
+        "import os\n\n\ndef register(bus):\n"
+        "    open(os.path.join(os.path.dirname(__file__), 'yüklendi'), 'a').write('x')\n",
+        encoding="utf-8")
+    # Göreli klasör çalışma dizinine değil görev dosyasının klasörüne göredir
+    monkeypatch.chdir(plugins)
+    config = tmp_path / "config.json"
+    args = ["--config", str(config), "--file", str(tmp_path / "pomodoro_tasks.json")]
+    config.write_text('{"control_socket": ""}', encoding="utf-8")
+    assert main(args + ["add", "a"]) == 0
+    assert not (plugins / "yüklendi").exists()
+    config.write_text('{"control_socket": "", "plugins_dir": "eklentiler"}', encoding="utf-8")
+    for command in (["status"], ["list"], ["stats"], ["lists"], ["stop"]):
+        assert main(args + command) == 0
+    assert not (plugins / "yüklendi").exists()
+    assert main(args + ["add", "b"]) == 0
+    assert (plugins / "yüklendi").read_text() == "x"
+    assert capsys.readouterr().err == ""
+
+
+def test_close_saves_before_a_short_hook_drain(make_core, tmp_path):
+    core = make_core(hook_shutdown_s=0.1)
+    release = threading.Event()
+    core.hooks.subscribe("task_added", lambda payload: release.wait(5))
+    for name in ("a", "b", "c"):
+        core.add_task(name)
+    started = time.monotonic()
+    core.close()
+    release.set()
+    assert time.monotonic() - started < 1
+    # Çalışan çağrı dışındaki olaylar düşer
+    assert [hook["dropped"] for hook in core.hooks.stats()] == [2]
+    assert [task.text for task in make_core().store] == ["a", "b", "c"]
@@ -0,0 +1,160 @@
+import json
+import os
+
+from pomodoro.journal import Journal, coalesce, iter_snapshot, read_journal, replay
+from pomodoro.store import TaskStore
+
+
+def open_journal(path, **kwargs):
+    journal = Journal(str(path), save_window=0, **kwargs)
+    state, tasks = journal.load()
+    store = TaskStore()
+    store.load(tasks)
+    journal.attach(store)
+    return journal, store, state
+
+
+def snapshot(store):
+    return [(task.id, task.text, task.desc, task.done, task.completed_time) for task in store]
+
+
+def test_replay_restores_every_operation(tmp_path):
+    path = tmp_path / "t.json"
+    journal, store, _ = open_journal(path)
+    for name in ("a", "b", "c", "d"):
+        store.add(name)
+    store.update(2, text="b2", desc="not")
+    store.set_done(3, True, 50)
+    store.remove(4)
+    with store.batch():
+        store.add("e")
+        store.complete_all(60)
+    journal.record_state(pomodoro_count=3)
+    journal.close()
+
+    state, replayed, _, _ = replay(str(path), str(path) + ".journal")
+    assert snapshot(replayed) == snapshot(store)
+    assert state["pomodoro_count"] == 3
+
+
+def test_batch_is_a_single_journal_write(tmp_path):
+    path = tmp_path / "t.json"
+    journal, store, _ = open_journal(path)
+    journal.flush()
+    before = len(read_journal(str(path) + ".journal")[1])
+    saves = journal.stats()["saves"]
+    with store.batch():
+        for i in range(10):
+            store.add(f"t{i}")
+    journal.flush()
+    assert journal.stats()["saves"] == saves + 1
+    assert len(read_journal(str(path) + ".journal")[1]) == before + 10
+    journal.close()
+
+
+def test_coalesce_merges_state_records_in_place():
+    records = [{"op": "state", "values": {"a": 1}},
+               {"op": "add", "id": 1, "text": "x"},
+               {"op": "state", "values": {"a": 2, "b": 3}}]
+    assert coalesce(records) == [{"op": "add", "id": 1, "text": "x"},
+                                 {"op": "state", "values": {"a": 2, "b": 3}}]
+    single = [{"op": "state", "values": {"a": 1}}]
+    assert coalesce(single) is single
+
+
+def test_compaction_folds_journal_into_snapshot(tmp_path):
+    path = tmp_path / "t.json"
+    journal, store, _ = open_journal(path, compact_every=5)
+    for i in range(12):
+        store.add(f"t{i}")
+    store.set_done(1, True, 5)
+    journal.compact()
+    header, records = read_journal(str(path) + ".journal")
+    assert header["generation"] == journal.generation
+    assert records == []
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    assert len(data["tasks"]) == 12
+    journal.close()
+
+    _, reopened, _ = open_journal(path)
+    assert snapshot(reopened) == snapshot(store)
+
+
+def test_reload_reads_only_records_from_another_instance(tmp_path):
+    path = tmp_path / "t.json"
+    first, store_a, _ = open_journal(path)
+    second, store_b, _ = open_journal(path)
+    store_a.add("a")
+    store_a.set_done(1, True, 10)
+    first.flush()
+    assert second.changed()
+    kind, records = second.read_changes()
+    assert kind == "records"
+    assert [record["op"] for record in records] == ["add", "done"]
+    # Kendi yazımları bir daha okunmaz
+    store_b.add("b")
+    second.flush()
+    assert not second.changed()
+    first.close()
+    second.close()
+
+
+def test_reload_after_compaction_by_another_instance(tmp_path):
+    path = tmp_path / "t.json"
+    first, store_a, _ = open_journal(path)
+    second, _, _ = open_journal(path)
+    store_a.add("a")
+    store_a.add("b")
+    first.compact()
+    kind, state, tasks = second.read_changes()
+    assert kind == "full"
+    assert [task["text"] for task in tasks] == ["a", "b"]
+    first.close()
+    second.close()
+
+
+def test_core_reload_applies_external_changes(make_core, tmp_path):
+    core_a = make_core()
+    core_b = make_core()
+    task = core_a.add_task("dışarıdan")
+    core_a.complete_task(task.id)
+    core_a.storage.flush()
+    assert core_b.reload() > 0
+    assert [(t.text, t.done) for t in core_b.store] == [("dışarıdan", True)]
+    # Diskten gelen değişiklik geri alınabilir bir adım değildir
+    assert not core_b.undo_log.can_undo()
+
+
+def test_torn_last_line_is_ignored(tmp_path):
+    path = tmp_path / "t.json"
+    journal, store, _ = open_journal(path)
+    store.add("a")
+    journal.close()
+    with open(str(path) + ".journal", "ab") as f:
+        f.write(b'{"op":"add","id":2,"te')
+    _, replayed, _, _ = replay(str(path), str(path) + ".journal")
+    assert [task.text for task in replayed] == ["a"]
+    assert os.path.getsize(str(path) + ".journal") > 0
+
+
+def test_iter_snapshot_matches_json_at_every_chunk_size(tmp_path):
+    path = tmp_path / "t.json"
+    data = {"a": 1.5, "b": -12, "c": 3e-7, "d": 1.25E+10, "e": True, "f": None, "g": "ş\"\\",
+            "h": [1, 2.5], "generation": 10, "tasks": [
+                {"id": 1, "text": "a", "desc": "", "done": True, "completed_time": 1700000000.125,
+                 "seq": -3},
+                {"id": 22, "text": "ü{[", "desc": "x" * 40, "done": False, "completed_time": None,
+                 "seq": 123456}]}
+    text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    path.write_text(text, encoding="utf-8")
+    with open(path, encoding="utf-8") as f:
+        expected = json.load(f)
+    for chunk_size in range(1, len(text) + 2):
+        header, tasks = {}, []
+        for key, value in iter_snapshot(str(path), chunk_size):
+            if key is None:
+                tasks.append(value)
+            else:
+                header[key] = value
+        assert {**header, "tasks": tasks} == expected, chunk_size
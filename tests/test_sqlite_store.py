@@ -0,0 +1,84 @@
+import sqlite3
+
+from pomodoro.journal import Journal
+from pomodoro.sqlite_store import SqliteStorage, migrate_json
+from pomodoro.store import TaskStore
+
+
+def fill_journal(path):
+    journal = Journal(str(path), save_window=0)
+    journal.load()
+    store = TaskStore()
+    journal.attach(store)
+    for name in ("a", "b", "c", "d"):
+        store.add(name, f"{name} açıklama")
+    store.set_done(2, True, 1_699_999_000)
+    # Yeniden açılan görev listenin başına döner; sırası kalıcıdır
+    store.set_done(4, True, 1_699_999_100)
+    store.set_done(4, False)
+    journal.record_state(pomodoro_count=5, archived_max_id=0)
+    journal.close()
+    return store
+
+
+def rows(tasks):
+    return [(t["id"], t["text"], t["desc"], t["done"], t["completed_time"], t["seq"]) for t in tasks]
+
+
+def test_migrate_json_keeps_tasks_state_and_order(tmp_path):
+    store = fill_journal(tmp_path / "t.json")
+    db = str(tmp_path / "t.db")
+    assert migrate_json(str(tmp_path / "t.json"), db) == 4
+    storage = SqliteStorage(db, save_window=0)
+    state, tasks = storage.load()
+    storage.close()
+    assert state["pomodoro_count"] == 5
+    assert rows(tasks) == sorted(rows({**t.to_dict(), "seq": t.seq} for t in store),
+                                 key=lambda row: row[5])
+    loaded = TaskStore()
+    loaded.load(tasks)
+    assert [task.text for task in loaded] == [task.text for task in store] == ["b", "d", "a", "c"]
+
+
+def test_sqlite_storage_migrates_on_first_load(make_core, tmp_path):
+    fill_journal(tmp_path / "pomodoro_tasks.json")
+    core = make_core(storage="sqlite")
+    assert [task.text for task in core.store] == ["b", "d", "a", "c"]
+    assert core.engine.pomodoro_count == 5
+    core.add_task("e")
+    core.close()
+    with sqlite3.connect(str(tmp_path / "pomodoro.db")) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0] == 5
+
+
+def test_sqlite_round_trip_and_external_changes(make_core):
+    core_a = make_core(storage="sqlite")
+    core_b = make_core(storage="sqlite")
+    with core_a.batch():
+        for name in ("a", "b", "c"):
+            core_a.add_task(name)
+    core_a.complete_task(2)
+    core_a.storage.flush()
+    assert core_b.reload() > 0
+    assert [(t.id, t.text, t.done) for t in core_b.store] == [(t.id, t.text, t.done)
+                                                              for t in core_a.store]
+
+
+def test_instances_sharing_a_database_never_reuse_ids(make_core, tmp_path):
+    core_a = make_core(storage="sqlite")
+    core_b = make_core(storage="sqlite")
+    # İki örnek birbirini görmeden görev ekler; kimlikler ayrı bloklardan gelir
+    added_a = [core_a.add_task(f"a{i}").id for i in range(100)]
+    added_b = [core_b.add_task(f"b{i}").id for i in range(100)]
+    assert not set(added_a) & set(added_b)
+    core_a.storage.flush()
+    core_b.storage.flush()
+    with sqlite3.connect(str(tmp_path / "pomodoro.db")) as conn:
+        stored = dict(conn.execute("SELECT id, text FROM tasks"))
+    assert len(stored) == 200
+    assert all(stored[task.id] == task.text for core in (core_a, core_b) for task in core.store)
+    core_a.reload()
+    core_b.reload()
+    assert sorted(t.id for t in core_a.store) == sorted(t.id for t in core_b.store) == sorted(stored)
+    # Yeniden yüklemeden sonra da bloklar ayrı kalır
+    assert core_a.add_task("x").id != core_b.add_task("y").id
@@ -0,0 +1,105 @@
+from pomodoro.store import TaskStore
+
+
+def texts(store):
+    return [task.text for task in store]
+
+
+def make_store(*names):
+    store = TaskStore()
+    for name in names:
+        store.add(name)
+    return store
+
+
+def test_pending_tasks_keep_insertion_order():
+    store = make_store("a", "b", "c")
+    assert texts(store) == ["a", "b", "c"]
+    assert [store.row_of(task.id) for task in store] == [0, 1, 2]
+    assert store.task_at(1).text == "b"
+
+
+def test_done_tasks_come_first_by_completion_time():
+    store = make_store("a", "b", "c")
+    store.set_done(3, True, 20)
+    store.set_done(1, True, 10)
+    assert texts(store) == ["a", "c", "b"]
+    assert store.done_count() == 2
+    assert [task.text for task in store.done_before(15)] == ["a"]
+
+
+def test_reopened_task_goes_to_the_top_of_pending():
+    store = make_store("a", "b", "c")
+    store.set_done(3, True, 10)
+    store.set_done(3, False)
+    assert texts(store) == ["c", "a", "b"]
+
+
+def test_reopen_with_seq_returns_to_old_position():
+    store = make_store("a", "b", "c")
+    seq = store.get(2).seq
+    store.set_done(2, True, 10)
+    store.set_done(2, False, seq=seq)
+    assert texts(store) == ["a", "b", "c"]
+
+
+def test_complete_all_keeps_list_order():
+    store = make_store("a", "b", "c")
+    changed = store.complete_all(100)
+    assert [task.text for task in changed] == ["a", "b", "c"]
+    assert texts(store) == ["a", "b", "c"]
+    assert all(task.done for task in store)
+
+
+def test_tasks_in_order_matches_list_order():
+    store = make_store(*"abcdefghij")
+    store.set_done(5, True, 10)
+    store.set_done(2, True, 5)
+    order = [task.id for task in store]
+    for ids in ({9, 2, 5}, {1, 2, 3, 4, 5, 6, 7, 8}, {42, 3}):
+        assert [task.id for task in store.tasks_in_order(ids)] == [i for i in order if i in ids]
+
+
+def test_added_task_gets_a_fresh_id_when_taken():
+    store = make_store("a")
+    task = store.add("b", task_id=1)
+    assert task.id == 2
+    store.reserve_ids(10)
+    assert store.add("c").id == 11
+
+
+def test_events_come_in_pre_post_pairs():
+    store = make_store("a", "b")
+    events = []
+    store.subscribe(lambda event, payload: events.append((event, payload)))
+    store.set_done(2, True, 10)
+    store.update(1, text="x")
+    store.remove(1)
+    names = [event for event, _ in events]
+    assert names == ["moving", "moved", "changing", "changed", "removing", "removed"]
+    task, old_row, new_row = events[0][1]
+    assert (task.id, old_row, new_row) == (2, 1, 0)
+    assert events[0][1] is events[1][1]
+
+
+def test_batch_wraps_changes_once():
+    store = TaskStore()
+    events = []
+    store.subscribe(lambda event, payload: events.append(event))
+    with store.batch():
+        with store.batch():
+            store.add("a")
+        store.add("b")
+    assert events == ["batching", "adding", "added", "adding", "added", "batched"]
+
+
+def test_bulk_operations_emit_single_events():
+    store = make_store("a", "b", "c", "d")
+    events = []
+    store.subscribe(lambda event, payload: events.append(event))
+    store.complete_all(10)
+    store.remove_many([1, 3])
+    store.remove_done()
+    assert events == ["reordering", "reordered", "removing_many", "removed_many",
+                      "removing_rows", "rows_removed"]
+    assert len(store) == 0
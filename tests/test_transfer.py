@@ -0,0 +1,123 @@
+import json
+
+import pytest
+
+from pomodoro.transfer import TaskExporter, TaskImporter, export_tasks, parse_row
+
+
+def write_csv(path, count):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("title,description,done\n")
+        for i in range(count):
+            f.write(f"görev {i},açıklama {i},{'x' if i % 3 == 0 else ''}\n")
+    return str(path)
+
+
+def test_import_adds_all_rows_in_chunks(make_core, tmp_path):
+    core = make_core()
+    importer = TaskImporter(core, write_csv(tmp_path / "in.csv", 25), chunk_size=10)
+    assert importer.run() == 25
+    assert len(core.store) == 25
+    assert core.store.done_count() == 9
+    assert importer.progress() == 1.0
+    # Tüm içe aktarma tek adımda geri alınır
+    core.undo()
+    assert len(core.store) == 0
+
+
+def test_cancel_removes_imported_tasks_only(make_core, tmp_path):
+    core = make_core()
+    core.add_task("önceden")
+    importer = TaskImporter(core, write_csv(tmp_path / "in.csv", 30), chunk_size=10)
+    importer.step()
+    between = core.add_task("arada")
+    importer.step()
+    importer.cancel()
+    assert [task.text for task in core.store] == ["önceden", "arada"]
+    assert importer.added == []
+    assert not importer.step()
+    # İptal geri alma geçmişine adım eklemez; aradaki düzenleme kendi adımıdır
+    core.undo()
+    assert between.id not in core.store
+    assert [task.text for task in core.store] == ["önceden"]
+
+
+def test_cancel_is_persisted(make_core, tmp_path):
+    core = make_core()
+    importer = TaskImporter(core, write_csv(tmp_path / "in.csv", 20), chunk_size=5)
+    importer.step()
+    importer.cancel()
+    core.close()
+    reopened = make_core()
+    assert len(reopened.store) == 0
+
+
+def test_invalid_rows_are_skipped_and_reported(make_core, tmp_path):
+    path = tmp_path / "in.jsonl"
+    lines = [json.dumps({"text": "a"}), "{bozuk", json.dumps({"text": ""}),
+             json.dumps({"title": "b", "done": True, "completed_time": 5})]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    core = make_core()
+    importer = TaskImporter(core, str(path))
+    importer.run()
+    assert [(task.text, task.done) for task in core.store] == [("b", True), ("a", False)]
+    assert importer.skipped == 2
+    assert [line for line, _ in importer.errors] == [2, 3]
+
+
+def test_parse_row_limits():
+    with pytest.raises(ValueError):
+        parse_row({"text": "x" * 51}, 0)
+    assert parse_row({"Title": " a ", "done": "evet"}, 7) == ("a", "", True, 7)
+
+
+def test_export_round_trips_through_import(make_core, tmp_path):
+    core = make_core()
+    core.add_task("a", "açıklama")
+    core.complete_task(core.add_task("b").id)
+    expected = [(task.text, task.desc, task.done) for task in core.store]
+    for fmt in ("csv", "jsonl"):
+        path = str(tmp_path / f"out.{fmt}")
+        assert export_tasks(core.store, path) == 2
+        core.clear_tasks()
+        TaskImporter(core, path).run()
+        assert [(task.text, task.desc, task.done) for task in core.store] == expected
+
+
+def test_import_emits_task_added_hooks(make_core, tmp_path):
+    core = make_core()
+    seen = []
+    core.hooks.subscribe("task_added", lambda payload: seen.append(payload["task"]["text"]))
+    TaskImporter(core, write_csv(tmp_path / "in.csv", 25), chunk_size=10).run()
+    core.hooks.close(5)
+    assert sorted(seen) == sorted(f"görev {i}" for i in range(25))
+
+
+def test_export_in_chunks_and_cancel(make_core, tmp_path):
+    core = make_core()
+    for i in range(25):
+        core.add_task(f"t{i}")
+    path = tmp_path / "out.jsonl"
+    path.write_text("eski\n", encoding="utf-8")
+    exporter = TaskExporter(list(core.store), str(path), chunk_size=10)
+    assert exporter.step()
+    assert exporter.progress() == 0.4
+    exporter.cancel()
+    assert not exporter.step()
+    # İptal edilen yazım hedef dosyaya dokunmaz, geçici dosya kalmaz
+    assert path.read_text(encoding="utf-8") == "eski\n"
+    assert not (tmp_path / "out.jsonl.tmp").exists()
+    exporter = TaskExporter(list(core.store), str(path), chunk_size=10)
+    assert exporter.run() == 25
+    assert exporter.progress() == 1.0
+    assert [json.loads(line)["text"] for line in path.read_text(encoding="utf-8").splitlines()] == \
+        [f"t{i}" for i in range(25)]
+
+
+def test_failed_export_removes_its_temporary_file(tmp_path):
+    def tasks():
+        yield {"id": 1, "text": "a"}
+        raise OSError("disk dolu")
+    with pytest.raises(OSError):
+        export_tasks(tasks(), str(tmp_path / "out.csv"))
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,112 @@
+from pomodoro.store import TaskStore
+from pomodoro.undo import BULK_MIN, UndoLog
+
+
+def make(budget=1 << 20):
+    store = TaskStore()
+    return store, UndoLog(store, budget)
+
+
+def state(store):
+    return [(task.id, task.text, task.desc, task.done, task.completed_time) for task in store]
+
+
+def test_each_change_is_one_step():
+    store, log = make()
+    store.add("a")
+    store.add("b")
+    store.update(1, text="a2")
+    log.undo()
+    assert [task.text for task in store] == ["a", "b"]
+    log.undo()
+    assert [task.text for task in store] == ["a"]
+    log.redo()
+    log.redo()
+    assert [task.text for task in store] == ["a2", "b"]
+    assert not log.can_redo()
+
+
+def test_batch_is_undone_and_redone_as_one_step():
+    store, log = make()
+    store.add("keep")
+    before = state(store)
+    with store.batch():
+        store.add("a")
+        store.add("b")
+        store.set_done(1, True, 10)
+        store.update(2, desc="açıklama")
+    after = state(store)
+    assert log.undo()
+    assert state(store) == before
+    assert log.redo()
+    assert state(store) == after
+
+
+def test_large_batches_use_bulk_operations():
+    store, log = make()
+    with store.batch():
+        for i in range(BULK_MIN * 2):
+            store.add(f"t{i}")
+    store.complete_all(100)
+    store.remove_done()
+    events = []
+    store.subscribe(lambda event, payload: events.append(event))
+    log.undo()
+    assert "added_many" in events
+    assert len(store) == BULK_MIN * 2 and all(task.done for task in store)
+    log.undo()
+    assert not any(task.done for task in store)
+    assert [task.text for task in store] == [f"t{i}" for i in range(BULK_MIN * 2)]
+
+
+def test_undone_delete_returns_to_its_row():
+    store, log = make()
+    for name in "abc":
+        store.add(name)
+    store.remove(2)
+    log.undo()
+    assert [task.text for task in store] == ["a", "b", "c"]
+    store.clear()
+    log.undo()
+    assert [task.text for task in store] == ["a", "b", "c"]
+
+
+def test_new_change_drops_redo_steps():
+    store, log = make()
+    store.add("a")
+    log.undo()
+    store.add("b")
+    assert not log.redo()
+
+
+def test_budget_drops_oldest_steps():
+    store, log = make(budget=300)
+    for i in range(20):
+        store.add(f"t{i}")
+    assert log.size <= 300
+    steps = 0
+    while log.undo():
+        steps += 1
+    assert 0 < steps < 20
+
+
+def test_paused_changes_are_not_recorded():
+    store, log = make()
+    with log.paused():
+        store.add("a")
+    assert not log.can_undo()
+
+
+def test_group_collects_only_its_own_batches():
+    store, log = make()
+    group = log.begin_group()
+    with log.collect(group), store.batch():
+        store.add("a")
+    store.add("between")
+    with log.collect(group), store.batch():
+        store.add("b")
+    log.end_group(group)
+    log.undo()
+    assert [task.text for task in store] == ["between"]
+    log.undo()
+    assert len(store) == 0